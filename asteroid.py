@@ -1,29 +1,86 @@
 import pygame
 import random
 import math
+from functools import cache
+from typing import Optional
 from game_object import GameObject
-from constants import ASTEROID_SIZES, ASTEROID_COLORS
+from entity_store import EntityView
+from sprite_cache import SpriteCache, quantize_angle
+from quality import QUALITY
+from constants import (
+    ASTEROID_SIZES, ASTEROID_COLORS, ASTEROID_ARCHETYPES, ASTEROID_ROTATION_STEPS,
+    ASTEROID_SPRITE_CACHE_BYTES
+)
 
 ASTEROID_MIN_POINTS = 5
 ASTEROID_MAX_POINTS = 14
 ASTEROID_RADIUS_VARIANCE = (0.8, 1.2)
+ASTEROID_GLOW_WIDTH = 5
+ASTEROID_CORE_WIDTH = 2
 
+# Rendered sprites keyed by (size, archetype, color, rotation step, glow, outline points)
+ASTEROID_SPRITES = SpriteCache(ASTEROID_SPRITE_CACHE_BYTES)
 
-class Asteroid(GameObject):
+
+@cache
+def archetype_shape(size: str, archetype: int) -> tuple[pygame.Vector2, ...]:
+    """Irregular outline shared by every asteroid of this size and archetype."""
+    shape_rng = random.Random(f"{size}:{archetype}")
+    radius = ASTEROID_SIZES[size]['radius']
+    num_points = shape_rng.randint(ASTEROID_MIN_POINTS, ASTEROID_MAX_POINTS)
+    min_radius, max_radius = ASTEROID_RADIUS_VARIANCE
+    points = []
+    for i in range(num_points):
+        angle = (i / num_points) * 2 * math.pi
+        distance = radius * shape_rng.uniform(min_radius, max_radius)
+        points.append(pygame.Vector2(math.cos(angle) * distance, math.sin(angle) * distance))
+    return tuple(points)
+
+
+@cache
+def outline(size: str, archetype: int, max_points: Optional[int] = None) -> tuple[pygame.Vector2, ...]:
+    """The archetype's outline, thinned to evenly spaced vertices when it has more than max_points."""
+    shape = archetype_shape(size, archetype)
+    if max_points is None or len(shape) <= max_points:
+        return shape
+    return tuple(shape[i * len(shape) // max_points] for i in range(max_points))
+
+
+def _render_asteroid(shape: tuple[pygame.Vector2, ...], color: tuple, angle: float, glow: bool = True) -> pygame.Surface:
+    half = math.ceil(max(point.length() for point in shape)) + (ASTEROID_GLOW_WIDTH if glow else ASTEROID_CORE_WIDTH)
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    center = pygame.Vector2(half, half)
+    rotated_points = [center + point.rotate(angle) for point in shape]
+    # Glow (thick, transparent) under the core (thin, solid)
+    if glow:
+        pygame.draw.polygon(surf, (*color[:3], 100), rotated_points, ASTEROID_GLOW_WIDTH)
+    pygame.draw.polygon(surf, color, rotated_points, ASTEROID_CORE_WIDTH)
+    return surf
+
+
+class Asteroid(EntityView, GameObject):
     """Asteroid entity with irregular shape, size-based scoring, and splitting behavior.
 
     Supports different sizes (large, medium, small) and types (normal, fast, armored).
-    When destroyed, splits into smaller asteroids. Has random rotation and shape.
+    When destroyed, splits into smaller asteroids. Its outline is one of a fixed
+    set of archetypes per size, so rotated sprites can be cached and shared.
     """
-    def __init__(self, position: pygame.Vector2, size: str = 'large'):
-        velocity = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
+    __slots__ = ('size', 'score_value', 'type', 'hitpoints', 'archetype', 'shape_points', 'color', 'far', 'idle_dt')
+
+    def __init__(self, position: pygame.Vector2, size: str = 'large', rng: random.Random = random):
+        super().__init__(position)
+        self.reset(position, size, rng)
+
+    def reset(self, position: pygame.Vector2, size: str = 'large', rng: random.Random = random) -> None:
+        velocity = pygame.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1))
         velocity.scale_to_length(ASTEROID_SIZES[size]['speed'])
-        super().__init__(position, velocity)
+        super().reset(position, velocity)
         self.size = size
         self.radius = ASTEROID_SIZES[size]['radius']
-        self.rotation_speed = random.uniform(-90, 90)  # degrees per second
+        self.rotation_speed = rng.uniform(-90, 90)  # degrees per second
         self.score_value = ASTEROID_SIZES[size]['score']
-        self.type = random.choice(['normal', 'fast', 'armored'])
+        self.type = rng.choice(['normal', 'fast', 'armored'])
+        self.hitpoints = 1  # A reused asteroid must not keep an armored predecessor's hitpoints
         # Adjust based on type
         if self.type == 'fast':
             self.velocity.scale_to_length(ASTEROID_SIZES[size]['speed'] * 1.2)
@@ -31,59 +88,36 @@ class Asteroid(GameObject):
         elif self.type == 'armored':
             self.hitpoints = 2
             self.score_value = ASTEROID_SIZES[size]['score'] * 2
-        else:
-            self.hitpoints = 1  # normal
-        self.shape_points = self._generate_shape()
-        self.color = random.choice(ASTEROID_COLORS)
-
-    def _generate_shape(self) -> list[pygame.Vector2]:
-        """Generate irregular asteroid shape"""
-        points = []
-        num_points = random.randint(ASTEROID_MIN_POINTS, ASTEROID_MAX_POINTS)
-        min_radius, max_radius = ASTEROID_RADIUS_VARIANCE
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            distance = self.radius * random.uniform(min_radius, max_radius)
-            points.append(pygame.Vector2(math.cos(angle) * distance, math.sin(angle) * distance))
-        return points
+        self.archetype = rng.randrange(ASTEROID_ARCHETYPES)
+        self.shape_points = archetype_shape(size, self.archetype)
+        self.color = rng.choice(ASTEROID_COLORS)
+        # Update tier bookkeeping, see GameLogic.update_asteroids()
+        self.far = False
+        self.idle_dt = 0.0
 
     def update(self, dt: float, screen_width: int, screen_height: int):
         self.rotation += self.rotation_speed * dt
         self.position += self.velocity * dt
         self.wrap_position(screen_width, screen_height)
 
-    def draw(self, screen: pygame.Surface):
-        # Create glow surface
-        glow_size = int(self.radius * 2.5)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        center = pygame.Vector2(glow_size, glow_size)
-
-        # Rotate and translate shape points to local coordinates
-        rotated_points = []
-        for point in self.shape_points:
-            rotated = point.rotate(self.rotation)
-            rotated_points.append(center + rotated)
-
-        # Draw Glow (Thick, transparent)
-        if len(self.color) == 3:
-            glow_color = (*self.color, 100)
-        else:
-            glow_color = self.color # Already has alpha? No, ASTEROID_COLORS are RGB tuples in constants usually
-        
-        pygame.draw.polygon(glow_surf, glow_color, rotated_points, 5)
-        
-        # Draw Core (Thin, solid)
-        pygame.draw.polygon(glow_surf, self.color, rotated_points, 2)
-        
-        # Blit to screen
-        screen_pos = self.position - center
-        screen.blit(glow_surf, screen_pos)
-
-    def split(self):
-        """Return smaller asteroids when destroyed"""
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
+        position = self.render_position(alpha)
+        step = quantize_angle(self.rotation, ASTEROID_ROTATION_STEPS)
+        tier = QUALITY.tier
+        sprite = ASTEROID_SPRITES.get(
+            (self.size, self.archetype, self.color, step, tier.glow, tier.outline_points),
+            lambda: _render_asteroid(outline(self.size, self.archetype, tier.outline_points), self.color,
+                                     step * 360 / ASTEROID_ROTATION_STEPS, tier.glow),
+        )
+        return screen.blit(sprite, (position.x + offset[0] - sprite.get_width() // 2,
+                                   position.y + offset[1] - sprite.get_height() // 2))
+
+    def split(self, rng: random.Random = random, create=None):
+        """Return smaller asteroids when destroyed; create(position, size, rng) builds each one."""
+        create = create or Asteroid
         if self.size == 'large':
-            return [Asteroid(self.position, 'medium'), Asteroid(self.position, 'medium')]
+            return [create(self.position, 'medium', rng), create(self.position, 'medium', rng)]
         elif self.size == 'medium':
-            return [Asteroid(self.position, 'small'), Asteroid(self.position, 'small')]
+            return [create(self.position, 'small', rng), create(self.position, 'small', rng)]
         else:
-            return []
\ No newline at end of file
+            return []
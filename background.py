@@ -0,0 +1,77 @@
+import random
+import pygame
+from constants import BLACK, STAR_LAYERS
+
+
+class BackgroundLayer:
+    """Starfield pre-rendered into cached surfaces.
+
+    Layers with a parallax factor of 0 are baked, together with the clear
+    color, into one opaque surface, so a static frame starts with a single
+    blit. Layers with a non-zero factor get their own transparent surface,
+    tiled and scrolled by offset * factor in draw(). Everything is rebuilt on
+    resize.
+    """
+    def __init__(self, width: int, height: int, layers: list[tuple[int, float]] = STAR_LAYERS) -> None:
+        self.layers = layers
+        self.rebuild(width, height)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.width, self.height
+
+    def rebuild(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.surface = pygame.Surface((width, height))
+        self.surface.fill(BLACK)
+        self.parallax: list[tuple[pygame.Surface, float]] = []
+        for count, factor in self.layers:
+            if factor == 0:
+                self._draw_stars(self.surface, count)
+            else:
+                layer = pygame.Surface((width, height), pygame.SRCALPHA)
+                self._draw_stars(layer, count)
+                self.parallax.append((layer, factor))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+            self.parallax = [(layer.convert_alpha(), factor) for layer, factor in self.parallax]
+
+    def _draw_stars(self, target: pygame.Surface, count: int) -> None:
+        translucent = target.get_flags() & pygame.SRCALPHA
+        star = pygame.Surface((2, 2))
+        for _ in range(count):
+            x = random.randint(0, self.width)
+            y = random.randint(0, self.height)
+            size = random.randint(1, 2)
+            brightness = random.randint(100, 255)
+            # Dim stars are both darker and more transparent
+            if translucent:
+                target.fill((brightness, brightness, brightness, brightness), (x, y, size, size))
+            else:
+                star.fill((brightness, brightness, brightness))
+                star.set_alpha(brightness)
+                target.blit(star, (x, y), (0, 0, size, size))
+
+    def restore(self, screen: pygame.Surface, rect: pygame.Rect, offset: tuple[float, float] = (0, 0)) -> None:
+        """Repaint only rect from the background, e.g. to erase a moved sprite."""
+        if not self.parallax:
+            screen.blit(self.surface, rect, rect)
+            return
+        clip = screen.get_clip()
+        screen.set_clip(rect)
+        self.draw(screen, offset)
+        screen.set_clip(clip)
+
+    def draw(self, screen: pygame.Surface, offset: tuple[float, float] = (0, 0)) -> None:
+        """Blit the background; a non-zero offset scrolls the parallax layers."""
+        if screen.get_size() != self.size:
+            self.rebuild(*screen.get_size())
+        screen.blit(self.surface, (0, 0))
+        for layer, factor in self.parallax:
+            x = -int(offset[0] * factor) % self.width
+            y = -int(offset[1] * factor) % self.height
+            # Four tiles cover the screen for any wrapped offset
+            for tile_x in (x - self.width, x):
+                for tile_y in (y - self.height, y):
+                    screen.blit(layer, (tile_x, tile_y))
@@ -0,0 +1,242 @@
+"""Batch playtests: many seeded bot games spread over every CPU core.
+
+Each worker process builds one headless Game when it starts, plays a few
+warm-up ticks, and then reuses that world for every game it is given.
+reset_game() reseeds it and hands the previous run's entities back to the
+pools. Games are sent out in chunks of seeds. Chunk results stream back as
+they finish and are merged into one summary per difficulty:
+
+    python batch.py --games 2000 --difficulty easy normal hard
+    python batch.py --games 500 --max-ticks 36000 --output summary.json --games-output games.jsonl
+
+Every difficulty plays the same seeds, so boards can be compared game by game.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+import numpy as np
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')  # Keep stdout clean for the JSON summary
+import pygame
+from constants import TICK_RATE, DIFFICULTIES
+from event_manager import PLAYER_HIT
+from headless import create_headless_game
+from input_source import Controls, NO_CONTROLS
+
+DEFAULT_GAMES = 200
+DEFAULT_MAX_TICKS = TICK_RATE * 60 * 5  # Five minutes of game time
+DEFAULT_CHUNK_SIZE = 10
+WARMUP_TICKS = 300
+
+
+class BotInput:
+    """Scripted pilot: turns toward the nearest asteroid, fires when lined up, and closes in on far targets.
+
+    It reads the live game state, so unlike ScriptedInput its controls depend
+    on the run. Given the same seed it still plays the same game.
+    """
+    def __init__(self, game, aim_tolerance: float = 6.0, approach_distance: float = 220.0) -> None:
+        self.game = game
+        self.aim_tolerance = aim_tolerance
+        self.approach_distance = approach_distance
+
+    def _nearest_target(self) -> Optional[pygame.Vector2]:
+        game = self.game
+        px, py = game.player.position
+        width, height = game.world_width, game.world_height
+        half_w, half_h = width / 2, height / 2
+        best = None
+        best_distance = float('inf')
+        for group in (game.asteroids, game.ufos):
+            for target in group:
+                # Shortest offset across the wrapped edges
+                dx = (target.position.x - px + half_w) % width - half_w
+                dy = (target.position.y - py + half_h) % height - half_h
+                distance = dx * dx + dy * dy
+                if distance < best_distance:
+                    best_distance = distance
+                    best = (dx, dy)
+        return pygame.Vector2(best) if best else None
+
+    def poll(self) -> Controls:
+        player = self.game.player
+        offset = self._nearest_target()
+        if player is None or offset is None:
+            return NO_CONTROLS
+        heading = pygame.Vector2(0, -1).rotate(player.rotation)
+        turn = heading.angle_to(offset)
+        turn = (turn + 180.0) % 360.0 - 180.0
+        aimed = abs(turn) <= self.aim_tolerance
+        return Controls(
+            rotate_left=turn < -self.aim_tolerance,
+            rotate_right=turn > self.aim_tolerance,
+            thrust=aimed and offset.length() > self.approach_distance,
+            shoot=aimed,
+        )
+
+
+_worker_game = None
+
+
+def _init_worker(warmup_ticks: int) -> None:
+    """Build and warm up this process's game once; every later game reuses it."""
+    global _worker_game
+    game = create_headless_game(seed=0)
+    game.input_source = BotInput(game)
+    for _ in range(warmup_ticks):
+        if game.game_over:
+            break
+        game.update(game.tick_dt)
+    _worker_game = game
+
+
+def play_game(game, seed: int, difficulty: str, max_ticks: int) -> dict:
+    """Replay one seed on an existing headless game and return its result row."""
+    game.difficulty = difficulty
+    game.apply_difficulty()
+    game.input_source = BotInput(game)
+    game.logic.reset_game(seed)
+    dt = game.tick_dt
+    hits = []
+    record_hits = hits.extend
+    # One PLAYER_HIT per life lost; the lives counter alone misses a hit in the tick that awards a level-up life
+    game.events.subscribe(PLAYER_HIT, record_hits)
+    start = time.perf_counter()
+    try:
+        for _ in range(max_ticks):
+            if game.game_over:
+                break
+            game.update(dt)
+    finally:
+        game.events.unsubscribe(PLAYER_HIT, record_hits)
+    elapsed = time.perf_counter() - start
+    deaths = len(hits)
+    ticks = game.sim_clock.ticks
+    return {
+        'seed': seed,
+        'difficulty': difficulty,
+        'score': game.score,
+        'level': game.level,
+        'deaths': deaths,
+        'ticks': ticks,
+        'game_over': game.game_over,
+        'ticks_per_second': ticks / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def play_chunk(jobs: list[tuple[int, str]], max_ticks: int) -> list[dict]:
+    """Worker task: play (seed, difficulty) jobs back to back in this process's game."""
+    if _worker_game is None:
+        _init_worker(0)
+    return [play_game(_worker_game, seed, difficulty, max_ticks) for seed, difficulty in jobs]
+
+
+def _stats(values: list) -> dict:
+    array = np.asarray(values, dtype=float)
+    return {
+        'mean': float(array.mean()),
+        'p10': float(np.percentile(array, 10)),
+        'p50': float(np.percentile(array, 50)),
+        'p90': float(np.percentile(array, 90)),
+        'max': float(array.max()),
+    }
+
+
+def summarize(results: list[dict]) -> dict:
+    """Merge per-game rows into one summary per difficulty."""
+    boards = {}
+    for difficulty in DIFFICULTIES:
+        rows = [row for row in results if row['difficulty'] == difficulty]
+        if not rows:
+            continue
+        levels = {}
+        for row in rows:
+            levels[row['level']] = levels.get(row['level'], 0) + 1
+        boards[difficulty] = {
+            'games': len(rows),
+            'game_over_rate': sum(row['game_over'] for row in rows) / len(rows),
+            'score': _stats([row['score'] for row in rows]),
+            'level': _stats([row['level'] for row in rows]),
+            'levels_reached': dict(sorted(levels.items())),
+            'deaths': _stats([row['deaths'] for row in rows]),
+            'ticks': _stats([row['ticks'] for row in rows]),
+            'ticks_per_second': _stats([row['ticks_per_second'] for row in rows]),
+        }
+    return boards
+
+
+def run_batch(games: int, difficulties=('normal',), max_ticks: int = DEFAULT_MAX_TICKS,
+              workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, first_seed: int = 0,
+              warmup_ticks: int = WARMUP_TICKS, on_chunk=None) -> dict:
+    """Play `games` seeds on each difficulty across a process pool and summarize them.
+
+    on_chunk, if given, is called with each chunk's rows as it arrives.
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(first_seed + i, difficulty) for difficulty in difficulties for i in range(games)]
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(warmup_ticks,)) as pool:
+        pending = [pool.submit(play_chunk, chunk, max_ticks) for chunk in chunks]
+        for future in as_completed(pending):
+            rows = future.result()
+            results.extend(rows)
+            if on_chunk:
+                on_chunk(rows)
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda row: (row['difficulty'], row['seed']))
+    total_ticks = sum(row['ticks'] for row in results)
+    return {
+        'games': len(results),
+        'workers': workers,
+        'max_ticks': max_ticks,
+        'elapsed_s': elapsed,
+        'games_per_second': len(results) / elapsed if elapsed > 0 else 0.0,
+        'ticks_per_second': total_ticks / elapsed if elapsed > 0 else 0.0,
+        'difficulties': summarize(results),
+        'results': results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play many seeded bot games in parallel and summarize them.")
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help="games per difficulty")
+    parser.add_argument('--difficulty', nargs='+', choices=DIFFICULTIES, default=['normal'])
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS, help="ticks before a game is cut off")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="games sent to a worker at a time")
+    parser.add_argument('--seed', type=int, default=0, help="first seed; game i plays seed + i")
+    parser.add_argument('--output', help="write the summary JSON here instead of stdout")
+    parser.add_argument('--games-output', help="also write one JSON line per game here")
+    args = parser.parse_args()
+
+    total = args.games * len(args.difficulty)
+    done = 0
+
+    def progress(rows: list[dict]) -> None:
+        nonlocal done
+        done += len(rows)
+        print(f"\r{done}/{total} games", end='', file=sys.stderr, flush=True)
+
+    report = run_batch(args.games, args.difficulty, args.max_ticks, args.workers, args.chunk_size,
+                       args.seed, on_chunk=progress)
+    print(file=sys.stderr)
+    results = report.pop('results')
+    if args.games_output:
+        with open(args.games_output, 'w', encoding='utf-8') as f:
+            for row in results:
+                f.write(json.dumps(row) + "\n")
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
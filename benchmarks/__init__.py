@@ -0,0 +1,17 @@
+"""Reproducible simulation benchmarks.
+
+Each scenario builds a world directly on a headless Game and times the logic,
+collision and particle phases of GameLogic separately over many ticks:
+
+    python -m benchmarks --output bench.json
+    python -m benchmarks --baseline bench.json
+"""
+import os
+
+# Keep stdout clean JSON
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from benchmarks.scenarios import SCENARIOS, Scenario
+from benchmarks.runner import run_scenario, run_all, compare
+
+__all__ = ['SCENARIOS', 'Scenario', 'run_scenario', 'run_all', 'compare']
@@ -0,0 +1,99 @@
+"""Memory and construction cost of the entity classes that are built in bursts.
+
+Splits, explosions and multishot volleys create many entities in one tick.
+For each class this reports the bytes a live instance holds (traced with
+tracemalloc, so everything its constructor allocates is counted), the time
+to construct one, and the time to add one to a group and remove it again:
+
+    python -m benchmarks.entities
+    python -m benchmarks.entities --count 50000 --output entities.json
+"""
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+import pygame
+from asteroid import Asteroid
+from bullet import Bullet
+from powerup import PowerUp
+from ufo import UFO
+from game_object import EntityGroup
+from constants import SCREEN_WIDTH
+
+DEFAULT_COUNT = 20000
+REPEATS = 5
+
+
+def _builders(rng: random.Random) -> dict:
+    position = pygame.Vector2(100, 100)
+    velocity = pygame.Vector2(300, 0)
+    return {
+        'asteroid': lambda: Asteroid(position, 'small', rng),
+        'bullet': lambda: Bullet(position, velocity),
+        'powerup': lambda: PowerUp(position, 'shield'),
+        'ufo': lambda: UFO(position, SCREEN_WIDTH, rng),
+    }
+
+
+def _bytes_per_entity(build, count: int) -> float:
+    keep = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            keep[i] = build()
+        used = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    return used / count
+
+
+def _best_ns(run, count: int) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter_ns()
+        run()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / count
+
+
+def measure(count: int = DEFAULT_COUNT) -> dict:
+    results = {}
+    for name, build in _builders(random.Random(1)).items():
+        def construct():
+            for _ in range(count):
+                build()
+
+        entities = [build() for _ in range(count)]
+        group = EntityGroup()
+
+        def join_and_leave():
+            group.add(*entities)
+            group.remove(*entities)
+
+        results[name] = {
+            'bytes': _bytes_per_entity(build, count),
+            'construct_ns': _best_ns(construct, count),
+            'group_add_remove_ns': _best_ns(join_and_leave, count),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure bytes and construction time per entity.")
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help="entities built per measurement")
+    parser.add_argument('--output', help="write the JSON results here instead of stdout")
+    args = parser.parse_args()
+    text = json.dumps(measure(args.count), indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
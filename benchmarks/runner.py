@@ -0,0 +1,189 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pygame
+from headless import create_headless_game
+from input_source import ScriptedInput
+from constants import USE_ENTITY_STORE
+from benchmarks.scenarios import SCENARIOS, Scenario
+
+PHASES = ('logic', 'collision', 'events', 'particles')
+DEFAULT_TICKS = 2000
+DEFAULT_WARMUP = 200
+DEFAULT_THRESHOLD = 0.15  # Relative slowdown of a phase mean that counts as a regression
+
+
+def _build(scenario: Scenario):
+    game = create_headless_game(ScriptedInput(lambda tick: scenario.controls), seed=scenario.seed,
+                                world_size=scenario.world_size)
+    scenario.setup(game)
+    return game
+
+
+def _tick(game, scenario: Scenario, dt: float, clock) -> tuple[int, int, int, int]:
+    """Run one tick and return the time (or bytes) spent in each phase."""
+    if scenario.refresh:
+        scenario.refresh(game)
+    logic = game.logic
+
+    start = clock()
+    controls = logic.begin_tick(dt)
+    logic.update_entities(dt, controls)
+    logic_end = clock()
+    game.collision_manager.check_collisions(dt)
+    collision_end = clock()
+    game.events.dispatch()
+    events_end = clock()
+    game.particles.update(dt)
+    particles_end = clock()
+    logic.end_tick()
+    end = clock()
+    return ((logic_end - start) + (end - particles_end), collision_end - logic_end,
+            events_end - collision_end, particles_end - events_end)
+
+
+def _summarize(samples: np.ndarray) -> dict:
+    micros = samples / 1000.0
+    return {
+        'mean_us': float(micros.mean()),
+        'p50_us': float(np.percentile(micros, 50)),
+        'p99_us': float(np.percentile(micros, 99)),
+    }
+
+
+def _measure_allocations(scenario: Scenario, ticks: int, dt: float) -> dict:
+    """Per-phase tracemalloc figures, from a separate pass since tracing skews timings.
+
+    alloc_peak_bytes is the mean per-tick high-water mark of memory allocated
+    inside the phase; alloc_net_bytes is the mean per-tick memory it retained.
+    """
+    game = _build(scenario)
+    peaks = np.zeros((ticks, len(PHASES)))
+    nets = np.zeros((ticks, len(PHASES)))
+    tracemalloc.start()
+    try:
+        for i in range(ticks):
+            if scenario.refresh:
+                scenario.refresh(game)
+            logic = game.logic
+            stages = (
+                lambda: logic.update_entities(dt, logic.begin_tick(dt)),
+                lambda: game.collision_manager.check_collisions(dt),
+                game.events.dispatch,
+                lambda: game.particles.update(dt),
+            )
+            for phase, stage in enumerate(stages):
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                stage()
+                current, peak = tracemalloc.get_traced_memory()
+                peaks[i, phase] = peak - base
+                nets[i, phase] = current - base
+            logic.end_tick()
+    finally:
+        tracemalloc.stop()
+    return {
+        name: {'alloc_peak_bytes': float(peaks[:, i].mean()), 'alloc_net_bytes': float(nets[:, i].mean())}
+        for i, name in enumerate(PHASES)
+    }
+
+
+def run_scenario(scenario: Scenario, ticks: int = DEFAULT_TICKS, warmup: int = DEFAULT_WARMUP,
+                 allocations: bool = True) -> dict:
+    """Time every phase of `scenario` over `ticks` ticks after `warmup` untimed ones."""
+    dt = 1.0 / scenario.tick_rate
+    game = _build(scenario)
+    for _ in range(warmup):
+        _tick(game, scenario, dt, time.perf_counter_ns)
+
+    samples = np.zeros((ticks, len(PHASES)))
+    for i in range(ticks):
+        samples[i] = _tick(game, scenario, dt, time.perf_counter_ns)
+
+    phases = {name: _summarize(samples[:, i]) for i, name in enumerate(PHASES)}
+    if allocations:
+        alloc_ticks = min(ticks, max(warmup, 100))
+        for name, figures in _measure_allocations(scenario, alloc_ticks, dt).items():
+            phases[name].update(figures)
+    return {
+        'description': scenario.description,
+        'ticks': ticks,
+        'phases': phases,
+        'total': _summarize(samples.sum(axis=1)),
+        'final_state': {key: value for key, value in game.snapshot().items()
+                        if key in ('asteroids', 'bullets', 'ufos', 'ufo_bullets', 'particles')},
+        'pools': game.factories.stats(),
+    }
+
+
+def run_all(names=None, ticks: int = DEFAULT_TICKS, warmup: int = DEFAULT_WARMUP, allocations: bool = True) -> dict:
+    names = names or list(SCENARIOS)
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'entity_store': USE_ENTITY_STORE,
+        },
+        'scenarios': {name: run_scenario(SCENARIOS[name], ticks, warmup, allocations) for name in names},
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """Ratio of each phase's mean and p99 to the baseline, flagging slowdowns past threshold."""
+    report = {}
+    regressions = []
+    for name, result in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous is None:
+            continue
+        report[name] = {}
+        for phase in PHASES + ('total',):
+            if phase != 'total' and phase not in previous['phases']:
+                continue  # Baseline from before the phase existed
+            current = result['phases'][phase] if phase != 'total' else result['total']
+            before = previous['phases'][phase] if phase != 'total' else previous['total']
+            ratios = {
+                stat: current[stat] / before[stat] if before[stat] else None
+                for stat in ('mean_us', 'p99_us')
+            }
+            report[name][phase] = ratios
+            if ratios['mean_us'] is not None and ratios['mean_us'] > 1.0 + threshold:
+                regressions.append(f"{name}/{phase}")
+    return {'threshold': threshold, 'ratios': report, 'regressions': regressions}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the simulation phases over named scenarios.")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help="scenario to run; repeat for several (default: all)")
+    parser.add_argument('--ticks', type=int, default=DEFAULT_TICKS, help="timed ticks per scenario")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help="untimed ticks before measuring")
+    parser.add_argument('--no-allocations', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--output', help="write the results JSON to this file")
+    parser.add_argument('--baseline', help="compare against a results JSON from an earlier run")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown of a phase mean reported as a regression")
+    parser.add_argument('--list', action='store_true', help="list scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:32} {scenario.description}")
+        return
+
+    results = run_all(args.scenario, args.ticks, args.warmup, not args.no_allocations)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            results['comparison'] = compare(results, json.load(f), args.threshold)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    if results.get('comparison', {}).get('regressions'):
+        sys.exit(1)
@@ -0,0 +1,145 @@
+import math
+from dataclasses import dataclass
+from typing import Callable, Optional
+import pygame
+from game import Game
+from input_source import Controls, NO_CONTROLS
+from constants import (
+    SPEED_INCREASE_PER_LEVEL, BULLET_SPEED, PARTICLE_COUNT_EXPLODE, TICK_RATE
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named, seeded world setup.
+
+    setup builds the world on a freshly reset game. refresh runs before every
+    tick, outside the timed region, and tops the world back up so the load
+    stays roughly constant for the whole run. tick_rate sets the length of
+    each simulated tick, and world_size the play field (None: the screen).
+    """
+    name: str
+    description: str
+    setup: Callable[[Game], None]
+    refresh: Optional[Callable[[Game], None]] = None
+    controls: Controls = NO_CONTROLS
+    seed: int = 1
+    tick_rate: int = TICK_RATE
+    world_size: Optional[tuple[int, int]] = None
+
+
+def _immortal(game: Game) -> None:
+    # Collisions still run in full, but the run never ends in a game over
+    game.lives = 10 ** 9
+    game.player.invincible_timer = math.inf
+
+
+def _add_asteroids(game: Game, count: int, size: str = 'large') -> None:
+    rng = game.rng
+    speed = 1.0 + (game.level - 1) * SPEED_INCREASE_PER_LEVEL
+    for _ in range(count):
+        asteroid = game.factories.asteroids.create(game.logic.spawn_position(), size, rng)
+        asteroid.velocity *= speed
+        game.asteroids.add(asteroid)
+
+
+def _add_bullets(game: Game, count: int) -> None:
+    rng = game.rng
+    for _ in range(count):
+        pos = pygame.Vector2(rng.uniform(0, game.world_width), rng.uniform(0, game.world_height))
+        velocity = pygame.Vector2(0, -BULLET_SPEED).rotate(rng.uniform(0, 360))
+        game.bullets.add(game.factories.bullets.create(pos, velocity))
+
+
+def _add_ufos(game: Game, count: int) -> None:
+    rng = game.rng
+    for i in range(count):
+        pos = pygame.Vector2(rng.randint(0, game.world_width), (i + 1) * game.world_height / (count + 1))
+        ufo = game.factories.ufos.create(pos, game.world_width, rng)
+        ufo.shoot_interval = 0.25
+        game.ufos.add(ufo)
+
+
+def _explode(game: Game, count: int) -> None:
+    rng = game.rng
+    for _ in range(count):
+        pos = pygame.Vector2(rng.uniform(0, game.world_width), rng.uniform(0, game.world_height))
+        game.particles.emit_burst(pos, PARTICLE_COUNT_EXPLODE)
+
+
+def _setup_opening(game: Game) -> None:
+    _immortal(game)
+
+
+def _setup_level_25(game: Game) -> None:
+    game.level = 25
+    game.asteroids.empty()
+    _add_asteroids(game, 150)
+    _immortal(game)
+
+
+def _refresh_level_25(game: Game) -> None:
+    if len(game.asteroids) < 150:
+        _add_asteroids(game, 150 - len(game.asteroids))
+
+
+def _setup_large_field(game: Game) -> None:
+    game.asteroids.empty()
+    _add_asteroids(game, 600)
+    _immortal(game)
+
+
+def _refresh_large_field(game: Game) -> None:
+    if len(game.asteroids) < 600:
+        _add_asteroids(game, 600 - len(game.asteroids))
+
+
+def _setup_barrage(game: Game) -> None:
+    game.player.multishot = True
+    _add_bullets(game, 300)
+    _immortal(game)
+
+
+def _refresh_barrage(game: Game) -> None:
+    if len(game.bullets) < 300:
+        _add_bullets(game, 300 - len(game.bullets))
+    if len(game.asteroids) < 20:
+        _add_asteroids(game, 20 - len(game.asteroids), 'medium')
+
+
+def _setup_explosions(game: Game) -> None:
+    _explode(game, 10)
+    _immortal(game)
+
+
+def _refresh_explosions(game: Game) -> None:
+    if not game.particles:
+        _explode(game, 10)
+
+
+def _setup_ufos(game: Game) -> None:
+    _add_ufos(game, 4)
+    _immortal(game)
+
+
+def _refresh_ufos(game: Game) -> None:
+    if len(game.ufos) < 4:
+        _add_ufos(game, 4 - len(game.ufos))
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario('level-1-opening', "Fresh level 1 with the ship turning and firing",
+             _setup_opening, controls=Controls(rotate_right=True, shoot=True)),
+    Scenario('level-25-150-asteroids', "Level 25 speeds with 150 large asteroids on screen",
+             _setup_level_25, _refresh_level_25),
+    Scenario('large-field-600-asteroids', "600 large asteroids spread over a 4000x3000 scrolling world",
+             _setup_large_field, _refresh_large_field, world_size=(4000, 3000)),
+    Scenario('multishot-barrage-300-bullets', "300 bullets in flight plus multishot fire into medium asteroids",
+             _setup_barrage, _refresh_barrage, Controls(rotate_left=True, shoot=True)),
+    Scenario('barrage-at-15-ticks', "The 300-bullet barrage at 15 ticks/s, bullets moving 27 px per tick",
+             _setup_barrage, _refresh_barrage, Controls(rotate_left=True, shoot=True), tick_rate=15),
+    Scenario('10-simultaneous-explosions', "Ten explosion bursts at once, re-emitted as they fade",
+             _setup_explosions, _refresh_explosions),
+    Scenario('4-ufos-firing', "Four UFOs firing at the ship every quarter second",
+             _setup_ufos, _refresh_ufos, Controls(thrust=True, rotate_left=True)),
+)}
@@ -1,16 +1,35 @@
 import pygame
 from game_object import GameObject
+from entity_store import EntityView
+from sprite_cache import GLOW_STAMPS
+from quality import QUALITY
 from constants import BULLET_RADIUS, BULLET_LIFETIME, BULLET_COLOR
 
 
-class Bullet(GameObject):
+def _render_bullet(color: tuple, radius: int, glow: bool = True) -> pygame.Surface:
+    glow_radius = radius * 3 if glow else radius
+    surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+    center = (glow_radius, glow_radius)
+    if glow:
+        pygame.draw.circle(surf, (*color, 100), center, radius * 2)
+    pygame.draw.circle(surf, color, center, radius)
+    return surf
+
+
+class Bullet(EntityView, GameObject):
     """Projectile fired by player or UFO with limited lifetime.
 
     Moves in a straight line with constant velocity. Automatically deactivates
     after lifetime expires or wraps around screen edges.
     """
+    __slots__ = ()
+
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2):
-        super().__init__(position, velocity)
+        super().__init__(position)
+        self.reset(position, velocity)
+
+    def reset(self, position: pygame.Vector2, velocity: pygame.Vector2) -> None:
+        super().reset(position, velocity)
         self.radius = BULLET_RADIUS
         self.lifetime = BULLET_LIFETIME
         self.age = 0
@@ -24,17 +43,10 @@ class Bullet(GameObject):
         self.position += self.velocity * dt
         self.wrap_position(screen_width, screen_height)
 
-    def draw(self, screen: pygame.Surface):
-        # Create glow surface
-        glow_radius = int(self.radius * 3)
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        center = (glow_radius, glow_radius)
-
-        # Draw Glow
-        pygame.draw.circle(glow_surf, (*BULLET_COLOR, 100), center, int(self.radius * 2))
-        
-        # Draw Core
-        pygame.draw.circle(glow_surf, BULLET_COLOR, center, self.radius)
-        
-        # Blit
-        screen.blit(glow_surf, (self.position.x - glow_radius, self.position.y - glow_radius))
\ No newline at end of file
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
+        radius = int(self.radius)
+        glow = QUALITY.tier.glow
+        stamp = GLOW_STAMPS.get(('bullet', BULLET_COLOR, radius, glow), lambda: _render_bullet(BULLET_COLOR, radius, glow))
+        glow_radius = stamp.get_width() // 2
+        position = self.render_position(alpha)
+        return screen.blit(stamp, (position.x + offset[0] - glow_radius, position.y + offset[1] - glow_radius))
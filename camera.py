@@ -0,0 +1,78 @@
+import argparse
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_MAX_SIZE
+
+
+class Camera:
+    """Viewport of view_width x view_height pixels onto the wrapping world.
+
+    follow() centers the view on a target along every axis where the world is
+    larger than the view. Along an axis that fits on screen the view stays
+    at 0, so the classic single-screen field does not scroll.
+
+    visible_offsets() culls an object against the view. It returns the
+    offsets to add to the object's world position to draw it on screen: none
+    when it is out of view, and one per visible copy otherwise. An object
+    straddling a seam that lies inside the view (e.g. the screen edge of a
+    screen-sized world) also gets its wrapped ghost copy on the far side.
+    The world must be at least as large as the view on both axes, so no
+    object ever needs more than one copy on each side of a seam.
+    """
+    def __init__(self, view_width: int, view_height: int, world_width: int, world_height: int) -> None:
+        if world_width < view_width or world_height < view_height:
+            raise ValueError(f"World {world_width}x{world_height} is smaller than the {view_width}x{view_height} view")
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.left = 0.0
+        self.top = 0.0
+
+    @property
+    def scrolls(self) -> bool:
+        return self.world_width > self.view_width or self.world_height > self.view_height
+
+    @property
+    def offset(self) -> tuple[float, float]:
+        return self.left, self.top
+
+    def follow(self, position: pygame.Vector2) -> None:
+        if self.world_width > self.view_width:
+            self.left = (position.x - self.view_width / 2) % self.world_width
+        if self.world_height > self.view_height:
+            self.top = (position.y - self.view_height / 2) % self.world_height
+
+    @staticmethod
+    def _copies(coord: float, extent: float, start: float, world: float, view: float) -> tuple:
+        """Screen coordinates, along one axis, of the copies of an object that overlap the view."""
+        local = (coord - start) % world
+        if extent < local < view - extent and local + world - extent >= view:
+            return (local,)  # The common case: well inside the view, no ghost
+        return tuple(shifted for shifted in (local - world, local, local + world)
+                     if shifted + extent > 0 and shifted - extent < view)
+
+    def visible_offsets(self, position: pygame.Vector2, extent: float) -> list[tuple[float, float]]:
+        """Offsets that place the visible copies of an object on screen; extent is its half size."""
+        xs = self._copies(position.x, extent, self.left, self.world_width, self.view_width)
+        if not xs:
+            return []
+        ys = self._copies(position.y, extent, self.top, self.world_height, self.view_height)
+        x, y = position.x, position.y
+        return [(sx - x, sy - y) for sx in xs for sy in ys]
+
+
+def world_size_arg(text: str) -> tuple[int, int]:
+    """argparse type for a world size written as WIDTHxHEIGHT, e.g. 2400x1800.
+
+    The world may not be smaller than the screen, which the camera relies on,
+    nor larger than WORLD_MAX_SIZE, which the replay header can hold.
+    """
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {text!r}") from None
+    if width < SCREEN_WIDTH or height < SCREEN_HEIGHT:
+        raise argparse.ArgumentTypeError(f"the world must be at least the screen size, {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+    if width > WORLD_MAX_SIZE or height > WORLD_MAX_SIZE:
+        raise argparse.ArgumentTypeError(f"world width and height must be at most {WORLD_MAX_SIZE}")
+    return width, height
@@ -1,131 +1,234 @@
-import pygame
-import random
-from constants import SOUND_EXPLODE, UFO_SCORE, POWERUP_SPAWN_CHANCE, POWERUP_TYPES, PARTICLE_COUNT_EXPLODE
-from powerup import PowerUp
-from particle import Particle
-from highscores import is_highscore
+import math
+from typing import Optional
+import numpy as np
+from constants import UFO_SCORE, SPATIAL_HASH_CELL_SIZE
+from spatial_hash import SpatialHash
+from event_manager import ASTEROID_DESTROYED, UFO_DESTROYED, PLAYER_HIT, POWERUP_COLLECTED
 
 class CollisionManager:
     def __init__(self, game):
         self.game = game
+        self.asteroid_grid = SpatialHash(game.world_width, game.world_height, SPATIAL_HASH_CELL_SIZE)
+        self.ufo_grid = SpatialHash(game.world_width, game.world_height, SPATIAL_HASH_CELL_SIZE)
+        self.powerup_grid = SpatialHash(game.world_width, game.world_height, SPATIAL_HASH_CELL_SIZE)
+        self.ufo_bullet_grid = SpatialHash(game.world_width, game.world_height, SPATIAL_HASH_CELL_SIZE)
+        # Per-frame broad-phase stats: pairs that reached the narrow-phase test
+        # versus pairs a brute-force all-against-all check would have tested.
+        self.candidate_pairs = 0
+        self.naive_pairs = 0
+        self.dt = game.tick_dt
 
-    def check_collisions(self):
+    def check_collisions(self, dt: Optional[float] = None):
+        """Resolve this tick's collisions; dt is the tick length the entities just moved by.
+
+        Bullets and UFO bullets are tested along the whole path they covered
+        this tick rather than only where they ended up, so hits are not
+        missed when a tick moves them farther than a target is wide.
+
+        The passes only resolve the hits themselves (removing entities,
+        splitting asteroids, lives) and emit events on game.events. Score,
+        power-up drops, particles and sounds follow when the bus is dispatched
+        after this returns.
+        """
+        self.dt = dt or self.game.tick_dt
         self.lives_lost_this_frame = 0
-        self._check_bullet_asteroid_collisions()
-        self._check_bullet_ufo_collisions()
-        self._check_powerup_collection()
-        self._check_player_asteroid_collisions()
-        self._check_player_ufo_collisions()
-        self._check_ufo_bullet_player_collisions()
+        self.candidate_pairs = 0
+        self.naive_pairs = (
+            len(self.game.bullets) * (len(self.game.asteroids) + len(self.game.ufos))
+            + len(self.game.powerups) + len(self.game.asteroids)
+            + len(self.game.ufos) + len(self.game.ufo_bullets)
+        )
+        profiler = self.game.profiler
+        with profiler.span('collision.rebuild_grids'):
+            self._rebuild_grids()
+        with profiler.span('collision.bullet_asteroid'):
+            self._check_bullet_asteroid_collisions()
+        with profiler.span('collision.bullet_ufo'):
+            self._check_bullet_ufo_collisions()
+        with profiler.span('collision.powerup'):
+            self._check_powerup_collection()
+        with profiler.span('collision.player_asteroid'):
+            self._check_player_asteroid_collisions()
+        with profiler.span('collision.player_ufo'):
+            self._check_player_ufo_collisions()
+        with profiler.span('collision.ufo_bullet_player'):
+            self._check_ufo_bullet_player_collisions()
 
-    def _check_bullet_asteroid_collisions(self):
-        hits = pygame.sprite.groupcollide(self.game.bullets, self.game.asteroids, False, False, collided=lambda bullet, asteroid: bullet.position.distance_to(asteroid.position) < bullet.radius + asteroid.radius)
+    def _rebuild_grids(self):
+        self.asteroid_grid.rebuild(self.game.asteroids)
+        self.ufo_grid.rebuild(self.game.ufos)
+        self.powerup_grid.rebuild(self.game.powerups)
+        self.ufo_bullet_grid.rebuild(self.game.ufo_bullets)
+
+    def _prune(self, group):
+        """Remove inactive sprites in place and return them to their pools."""
+        store = getattr(group, 'store', None)
+        if store is None:
+            dead = [sprite for sprite in group if not sprite.active]
+        else:
+            dead = [sprite for sprite, active in zip(group, store.active[group.slots()].tolist()) if not active]
+        if dead:
+            group.remove(*dead)
+            for sprite in dead:
+                self.game.factories.release(sprite)
+
+    def _collide(self, grid, obj):
+        """Yield active objects in grid that overlap obj, counting every candidate."""
+        position, radius = obj.position, obj.radius
+        x, y = position.x, position.y
+        candidates = grid.query(x, y, radius)
+        self.candidate_pairs += len(candidates)
+        for record in candidates:
+            if grid.overlaps(x, y, radius, record):
+                yield record[0]
+
+    def _sweep(self, grid, mover: tuple, margin: float) -> list:
+        """Active objects in grid that a mover touched at any point during the tick.
+
+        mover is an (obj, x, y, vx, vy, radius) tuple from _movers(). margin is
+        the farthest any object in grid moved this tick; see _max_step().
+        """
+        dt = self.dt
+        _, x, y, vx, vy, radius = mover
+        step = (vx * dt, vy * dt)
+        candidates = grid.query_swept(x, y, step, radius, margin)
+        if not candidates:
+            return candidates
+        self.candidate_pairs += len(candidates)
+        travel = math.hypot(*step) + margin
+        return [record[0] for record in candidates
+                if grid.swept_overlaps(x, y, radius, step, record, dt, travel)]
+
+    @staticmethod
+    def _movers(group) -> list[tuple]:
+        """(obj, x, y, vx, vy, radius) for each active member of group, in group order.
+
+        A StoredGroup's are read from its store's arrays in one go rather than
+        through each entity's fields.
+        """
+        store = getattr(group, 'store', None)
+        if store is None:
+            return [CollisionManager._mover(obj) for obj in group if obj.active]
+        slots = group.slots()
+        alive = store.active[slots]
+        members = [obj for obj, active in zip(group, alive.tolist()) if active]
+        slots = slots[alive]
+        position, velocity = store.position[slots], store.velocity[slots]
+        return list(zip(members, position[:, 0].tolist(), position[:, 1].tolist(),
+                        velocity[:, 0].tolist(), velocity[:, 1].tolist(), store.radius[slots].tolist()))
+
+    @staticmethod
+    def _mover(obj) -> tuple:
+        position, velocity = obj.position, obj.velocity
+        return obj, position.x, position.y, velocity.x, velocity.y, obj.radius
 
-        for bullet, asteroids in hits.items():
-            for asteroid in asteroids:
+    def _max_step(self, group) -> float:
+        """Distance the fastest member of group moved this tick."""
+        if not group:
+            return 0.0
+        store = getattr(group, 'store', None)
+        if store is not None:
+            velocity = store.velocity[:store.count]
+            speed = float(np.sqrt(np.einsum('ij,ij->i', velocity, velocity).max())) if len(velocity) else 0.0
+        else:
+            speed = max((sprite.velocity.length() for sprite in group), default=0.0)
+        return speed * self.dt
+
+    def _player_hit(self):
+        """Take one life, at most once per tick."""
+        if self.lives_lost_this_frame == 0:
+            self.game.lives -= 1
+            self.lives_lost_this_frame += 1
+            position = self.game.player.position
+            self.game.events.emit(PLAYER_HIT, position.x, position.y, self.game.lives)
+
+    def _check_bullet_asteroid_collisions(self):
+        spawned = []
+        margin = self._max_step(self.game.asteroids) if self.game.bullets else 0.0
+        emit = self.game.events.emit
+        rng, create, asteroids = self.game.rng, self.game.factories.asteroids.create, self.game.asteroids
+        for mover in self._movers(self.game.bullets):
+            bullet = mover[0]
+            for asteroid in self._sweep(self.asteroid_grid, mover, margin):
                 bullet.active = False
                 if hasattr(asteroid, 'hitpoints'):
                     asteroid.hitpoints -= 1
                     if asteroid.hitpoints > 0:
                         continue
                 asteroid.active = False
-                self.game.score += asteroid.score_value
-                if SOUND_EXPLODE:
-                    SOUND_EXPLODE.play()
-                new_asteroids = asteroid.split()
-                self.game.asteroids.add(*new_asteroids)
-                if random.random() < POWERUP_SPAWN_CHANCE:
-                    powerup_type = random.choice(POWERUP_TYPES)
-                    powerup = PowerUp(asteroid.position, powerup_type)
-                    self.game.powerups.add(powerup)
-                for _ in range(PARTICLE_COUNT_EXPLODE):
-                    particle = Particle(asteroid.position)
-                    self.game.explosion_particles.add(particle)
+                position = asteroid.position
+                emit(ASTEROID_DESTROYED, position.x, position.y, asteroid.score_value, True)
+                new_asteroids = asteroid.split(rng, create)
+                asteroids.add(*new_asteroids)
+                spawned.extend(new_asteroids)
 
-        self.game.bullets = pygame.sprite.Group(b for b in self.game.bullets if b.active)
-        self.game.asteroids = pygame.sprite.Group(a for a in self.game.asteroids if a.active)
+        # Fragments only become targets once this pass is done, as before
+        for asteroid in spawned:
+            self.asteroid_grid.insert(asteroid)
 
-    def _check_bullet_ufo_collisions(self):
-        hits = pygame.sprite.groupcollide(self.game.bullets, self.game.ufos, False, False, collided=lambda bullet, ufo: bullet.position.distance_to(ufo.position) < bullet.radius + ufo.radius)
+        self._prune(self.game.bullets)
+        self._prune(self.game.asteroids)
 
-        for bullet, ufos in hits.items():
-            for ufo in ufos:
+    def _check_bullet_ufo_collisions(self):
+        margin = self._max_step(self.game.ufos) if self.game.bullets else 0.0
+        for mover in self._movers(self.game.bullets) if self.game.ufos else ():
+            bullet = mover[0]
+            for ufo in self._sweep(self.ufo_grid, mover, margin):
                 bullet.active = False
                 ufo.active = False
-                self.game.score += UFO_SCORE
-                if SOUND_EXPLODE:
-                    SOUND_EXPLODE.play()
-                for _ in range(PARTICLE_COUNT_EXPLODE):
-                    particle = Particle(ufo.position)
-                    self.game.explosion_particles.add(particle)
+                self.game.events.emit(UFO_DESTROYED, ufo.position.x, ufo.position.y, UFO_SCORE)
 
-        self.game.bullets = pygame.sprite.Group(b for b in self.game.bullets if b.active)
-        self.game.ufos = pygame.sprite.Group(u for u in self.game.ufos if u.active)
+        self._prune(self.game.bullets)
+        self._prune(self.game.ufos)
 
     def _check_powerup_collection(self):
-        hits = pygame.sprite.spritecollide(self.game.player, self.game.powerups, False, collided=lambda player, powerup: player.position.distance_to(powerup.position) < player.radius + powerup.radius)
-        for powerup in hits:
+        for powerup in self._collide(self.powerup_grid, self.game.player):
             powerup.active = False
+            # Applied at once: a shield picked up now already counts for the player passes below
             self.game.logic.apply_powerup(powerup.type)
+            self.game.events.emit(POWERUP_COLLECTED, powerup.position.x, powerup.position.y, powerup.type)
 
-        self.game.powerups = pygame.sprite.Group(p for p in self.game.powerups if p.active)
+        self._prune(self.game.powerups)
 
     def _check_player_asteroid_collisions(self):
-        for asteroid in self.game.asteroids.sprites():
-            if self.game.player.invincible_timer <= 0 and self.game.player.position.distance_to(asteroid.position) < self.game.player.radius + asteroid.radius:
-                if self.game.player.shielded:
-                    self.game.player.shielded = False
-                    asteroid.active = False
-                    self.game.score += asteroid.score_value
-                    new_asteroids = asteroid.split()
-                    self.game.asteroids.add(*new_asteroids)
-                else:
-                    if self.lives_lost_this_frame == 0:
-                        self.game.lives -= 1
-                        self.lives_lost_this_frame += 1
-                if self.game.lives <= 0:
-                    self.game.game_over = True
-                    if is_highscore(self.game.score):
-                        self.game.state = 'enter_name'
-                    else:
-                        self.game.state = 'game_over'
-                else:
-                    self.game._reset_player_position()
-                break
-
-        self.game.asteroids = pygame.sprite.Group(a for a in self.game.asteroids if a.active)
+        if self.game.player.invincible_timer > 0:
+            return
+        for asteroid in self._collide(self.asteroid_grid, self.game.player):
+            if self.game.player.shielded:
+                self.game.player.shielded = False
+                asteroid.active = False
+                self.game.events.emit(ASTEROID_DESTROYED, asteroid.position.x, asteroid.position.y,
+                                      asteroid.score_value, False)
+                new_asteroids = asteroid.split(self.game.rng, self.game.factories.asteroids.create)
+                self.game.asteroids.add(*new_asteroids)
+            else:
+                self._player_hit()
+            if self.game.lives <= 0:
+                self.game.game_over = True
+            else:
+                self.game._reset_player_position()
+            break
+
+        self._prune(self.game.asteroids)
 
     def _check_player_ufo_collisions(self):
-        for ufo in self.game.ufos.sprites():
-            if self.game.player.position.distance_to(ufo.position) < self.game.player.radius + ufo.radius:
-                if self.lives_lost_this_frame == 0:
-                    self.game.lives -= 1
-                    self.lives_lost_this_frame += 1
-                if self.game.lives <= 0:
-                    self.game.game_over = True
-                    if is_highscore(self.game.score):
-                        self.game.state = 'enter_name'
-                    else:
-                        self.game.state = 'game_over'
-                else:
-                    self.game._reset_player_position()
-                break
+        for ufo in self._collide(self.ufo_grid, self.game.player):
+            self._player_hit()
+            if self.game.lives <= 0:
+                self.game.game_over = True
+            else:
+                self.game._reset_player_position()
+            break
 
     def _check_ufo_bullet_player_collisions(self):
-        for bullet in self.game.ufo_bullets.sprites():
-            if bullet.position.distance_to(self.game.player.position) < bullet.radius + self.game.player.radius:
-                if self.lives_lost_this_frame == 0:
-                    self.game.lives -= 1
-                    self.lives_lost_this_frame += 1
-                if self.game.lives <= 0:
-                    self.game.game_over = True
-                    if is_highscore(self.game.score):
-                        self.game.state = 'enter_name'
-                    else:
-                        self.game.state = 'game_over'
-                else:
-                    self.game._reset_player_position()
-                bullet.active = False
-                break
+        margin = self._max_step(self.game.ufo_bullets)
+        for bullet in self._sweep(self.ufo_bullet_grid, self._mover(self.game.player), margin):
+            self._player_hit()
+            if self.game.lives <= 0:
+                self.game.game_over = True
+            else:
+                self.game._reset_player_position()
+            bullet.active = False
+            break
 
-        self.game.ufo_bullets = pygame.sprite.Group(b for b in self.game.ufo_bullets if b.active)
\ No newline at end of file
+        self._prune(self.game.ufo_bullets)
@@ -3,6 +3,34 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# World: the wrapping play field. Make it larger than the screen for a field
+# that scrolls with the player; at screen size the camera stays still.
+WORLD_WIDTH = SCREEN_WIDTH
+WORLD_HEIGHT = SCREEN_HEIGHT
+WORLD_MAX_SIZE = 65535  # Replay headers store each world dimension in 16 bits
+CAMERA_CULL_MARGIN = 32  # Pixels an entity's glow may reach past its collision radius
+# Asteroids farther than this from the player move in coarse steps. Keep it past
+# bullet range (BULLET_SPEED * BULLET_LIFETIME) and the view's half diagonal.
+FAR_UPDATE_DISTANCE = 1200
+FAR_UPDATE_INTERVAL = 4  # Ticks between moves of a far asteroid
+
+# Fixed-timestep simulation
+TICK_RATE = 60  # Simulation ticks per second, independent of the frame rate
+MAX_CATCH_UP_TICKS = 5  # Ticks run per frame at most; the rest of a long hitch is dropped
+INTERPOLATION_MAX_STEP = 64  # Larger per-tick moves are wraps or teleports and are not interpolated
+
+# Replays
+RECORD_REPLAYS = True  # Record every windowed run to REPLAY_DIR
+REPLAY_DIR = 'replays'
+REPLAY_CHUNK_TICKS = 600  # Input bytes buffered before a chunk is written
+REPLAY_CHECKSUM_INTERVAL = 60  # Ticks between state checksums used to detect divergence
+REPLAY_COMPRESS = True
+
+# Profiler
+PROFILER_SPAN_CAPACITY = 16384  # Spans kept in the ring buffer, about ten seconds of frames
+PROFILER_FRAME_HISTORY = 240  # Frames shown in the overlay graph
+PROFILE_DIR = 'profiles'
+
 # Colors
 BLACK = (5, 5, 20)  # Deep space blue
 WHITE = (220, 220, 255)  # Slightly blueish white
@@ -30,6 +58,7 @@ PLAYER_THRUST = 200  # pixels per second squared
 PLAYER_MAX_SPEED = 300
 PLAYER_DRAG = 0.96  # More friction (easier to stop)
 PLAYER_SHOOT_COOLDOWN = 0.15  # Faster shooting
+PLAYER_ROTATION_STEPS = 120  # Pre-rendered ship and flame angles (3 degrees apart)
 
 # Bullet
 BULLET_COLOR = NEON_YELLOW
@@ -50,20 +79,77 @@ INITIAL_LEVEL = 1
 LEVEL_ASTEROID_INCREASE = 2
 BASE_ASTEROIDS = 3  # Start with fewer asteroids
 ASTEROID_SPAWN_DISTANCE = 100
+ASTEROID_SPAWN_ATTEMPTS = 32  # Random spawn points tried before settling for the farthest one
 SPEED_INCREASE_PER_LEVEL = 0.05
 SPEED_INCREASE_PER_LEVEL = 0.05
 
+# Collision broad-phase
+SPATIAL_HASH_CELL_SIZE = 80  # About the diameter of a large asteroid
+
+# Keep asteroids and bullets in NumPy arrays and update them in one vectorized pass
+USE_ENTITY_STORE = False
+
+# Leaderboard
+DIFFICULTIES = ('easy', 'normal', 'hard')
+LEADERBOARD_DB = 'leaderboard.db'
+LEADERBOARD_BATCH_SIZE = 256  # Runs buffered before one insert transaction
+LEADERBOARD_PAGE_SIZE = 10
+LEADERBOARD_RANK_BUCKET = 500  # Score points per pre-counted block used by rank lookups
+
+# Training environment (env.py)
+ENV_NEAREST_ASTEROIDS = 8  # Objects of each kind in an observation, nearest first
+ENV_NEAREST_UFOS = 2
+ENV_NEAREST_BULLETS = 4
+ENV_FRAME_SKIP = 4  # Ticks each action is held for
+ENV_MAX_TICKS = TICK_RATE * 60 * 10  # Episodes are cut off after ten minutes of game time
+ENV_SCORE_REWARD = 0.01  # Reward per point scored
+ENV_DEATH_PENALTY = 1.0  # Reward taken away per life lost
+
+# Object pools: released entities kept for reuse, per type, before extras are dropped
+POOL_HIGH_WATER_MARKS = {'asteroids': 256, 'bullets': 512, 'powerups': 32, 'ufos': 8}
+
 # UI
 FONT_SIZE = 36
+HUD_HEIGHT = 40
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+# Dirty-rect frames fall back to a full flip when their rects cover more than this share of the screen
+DIRTY_RECT_MAX_COVERAGE = 0.5
+
+# Render quality tiers, best first; the governor (quality.py) steps through them
+# to hold FPS. particles is the share of each particle burst and of thrust
+# particles that is spawned; outline_points caps the vertices of asteroid
+# outlines (None keeps them all); pulse animates blinking menu text.
+QUALITY_TIERS = [
+    {'name': 'high', 'glow': True, 'particles': 1.0, 'outline_points': None, 'pulse': True},
+    {'name': 'medium', 'glow': True, 'particles': 0.5, 'outline_points': None, 'pulse': False},
+    {'name': 'low', 'glow': False, 'particles': 0.5, 'outline_points': 8, 'pulse': False},
+    {'name': 'minimal', 'glow': False, 'particles': 0.25, 'outline_points': 6, 'pulse': False},
+]
+QUALITY_WINDOW = 60  # Frames of work time the governor judges at once
+QUALITY_PERCENTILE = 0.9  # Frame of the window, by rank, compared with the budget
+QUALITY_DOWNGRADE_LOAD = 0.9  # Step down when that frame used more than this share of 1 / FPS
+QUALITY_UPGRADE_LOAD = 0.5  # Step up only when it used less than this share
+QUALITY_UPGRADE_HOLD = 180  # Frames at a tier before stepping up; doubles each time a step up is undone
+QUALITY_MAX_UPGRADE_HOLD = 3600
+
+# Starfield layers as (star count, parallax factor); factor 0 is baked static
+STAR_LAYERS = [(100, 0.0)]
 
 # Particles
 PARTICLE_LIFETIME = 1.0
 PARTICLE_COUNT_EXPLODE = 12
 PARTICLE_SPEED = 200
 PARTICLE_COLORS = [NEON_ORANGE, NEON_RED, NEON_YELLOW, WHITE]
+PARTICLE_SIZE = 5
+PARTICLE_CAPACITY = 2048  # Hard cap on live particles across all emitters
+PARTICLE_ALPHA_LEVELS = 16  # Pre-rendered fade steps per color
 
 # Asteroid variations
 ASTEROID_COLORS = [NEON_MAGENTA, NEON_PURPLE, (200, 50, 200)]
+ASTEROID_ARCHETYPES = 8  # Distinct outlines per asteroid size
+ASTEROID_ROTATION_STEPS = 64  # Pre-rendered rotation angles per outline
+ASTEROID_SPRITE_CACHE_BYTES = 32 * 1024 * 1024
+GLOW_STAMP_CACHE_BYTES = 16 * 1024 * 1024
 
 # UFO
 UFO_RADIUS = 15
@@ -91,15 +177,17 @@ import pygame
 import os
 from typing import Optional
 
-SOUNDS_DIR = 'assets/sounds'
-SOUND_SHOOT = None
-SOUND_EXPLODE = None
-SOUND_THRUST = None
+SOUNDS_DIR = 'assets/sounds'  # Loaded sounds live on sounds.SOUNDS
 MUSIC_BACKGROUND = os.path.join(SOUNDS_DIR, 'background.mp3')
-THRUST_CHANNEL = None
 MASTER_VOLUME = 0.7
 MUSIC_VOLUME = 0.5
 SFX_VOLUME = 0.6
+AUDIO_RESERVED_CHANNELS = 2  # Mixer channels kept out of the effect pool; channel 1 loops the thrust sound
+AUDIO_EFFECT_VOICES = 8  # Effect sounds playing at once, across all sounds
+AUDIO_VOICES_PER_SOUND = {'shoot': 3, 'explode': 4}
+AUDIO_PRIORITIES = {'shoot': 1, 'explode': 2}  # A busy mixer gives a new sound the oldest voice of equal or lower priority
+AUDIO_TRIGGER_VOLUME = 0.7  # Channel volume of a sound triggered once in a frame
+AUDIO_COALESCE_GAIN = 0.25  # Volume added per doubling of identical triggers merged into one play
 
 def load_sounds() -> tuple[Optional[pygame.mixer.Sound], ...]:
     sounds = []
@@ -147,6 +235,5 @@ UI_RESTART_Y = SCREEN_HEIGHT // 2
 UI_MENU_X = SCREEN_WIDTH // 2 - 70
 UI_MENU_Y = SCREEN_HEIGHT // 2 + 50
 
-def init_channels():
-    global THRUST_CHANNEL
-    THRUST_CHANNEL = pygame.mixer.Channel(1)
\ No newline at end of file
+def init_channels() -> pygame.mixer.Channel:
+    return pygame.mixer.Channel(1)
\ No newline at end of file
@@ -0,0 +1,302 @@
+import math
+import numpy as np
+import pygame
+from game_object import GameObject, EntityGroup
+
+STORE_INITIAL_CAPACITY = 64
+
+
+class FrozenVector2(pygame.Vector2):
+    """Read-only copy of a vector that lives in an EntityStore row.
+
+    Changing it in place would only change the copy, so attribute and item
+    assignment and the in-place methods raise instead. Augmented assignment
+    builds a new vector, so entity.position += step still writes through the
+    field. Arithmetic on a FrozenVector2 returns another one; wrap the value in
+    pygame.Vector2() to get a mutable copy.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"Cannot set {name!r} on a read-only copy of a stored vector; assign the entity attribute")
+
+    def __setitem__(self, index, value) -> None:
+        raise TypeError("Cannot change a read-only copy of a stored vector; assign the entity attribute")
+
+    def __iadd__(self, other):
+        return pygame.Vector2(self) + other
+
+    def __isub__(self, other):
+        return pygame.Vector2(self) - other
+
+    def __imul__(self, other):
+        return pygame.Vector2(self) * other
+
+    def __itruediv__(self, other):
+        return pygame.Vector2(self) / other
+
+    def __ifloordiv__(self, other):
+        return pygame.Vector2(self) // other
+
+
+def _read_only(name: str):
+    def method(self, *args, **kwargs):
+        raise TypeError(f"{name}() would change a read-only copy of a stored vector; assign the entity attribute")
+    method.__name__ = name
+    return method
+
+
+for _name in ('update', 'scale_to_length', 'normalize_ip', 'rotate_ip', 'rotate_ip_rad', 'rotate_rad_ip',
+              'reflect_ip', 'clamp_magnitude_ip', 'move_towards_ip', 'from_polar'):
+    setattr(FrozenVector2, _name, _read_only(_name))
+
+
+class _Field:
+    """Attribute that lives in an EntityStore column while the entity is attached.
+
+    While detached the value sits in a slot on the entity: the base class's
+    slot of the same name if it has one (position, radius, ...), otherwise the
+    owner's '_'-prefixed slot.
+    """
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        for base in owner.__mro__[1:]:
+            if name in base.__dict__:
+                self.slot = base.__dict__[name]
+                break
+        else:
+            self.slot = owner.__dict__['_' + name]
+
+    def detached(self, obj):
+        return self.slot.__get__(obj)
+
+    def set_detached(self, obj, value) -> None:
+        self.slot.__set__(obj, value)
+
+
+class _VectorField(_Field):
+    """Vector2 attribute that lives in an EntityStore row while attached.
+
+    Reads of an attached entity return a new FrozenVector2 every time, so hot
+    loops should read the store's arrays instead (see SpatialHash.rebuild()).
+    """
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return self.slot.__get__(obj)
+        x, y = getattr(store, self.name)[obj._slot]
+        return FrozenVector2(x, y)
+
+    def __set__(self, obj, value) -> None:
+        store = obj._store
+        if store is None:
+            self.slot.__set__(obj, value)
+        else:
+            getattr(store, self.name)[obj._slot] = (value[0], value[1])
+
+
+class _ScalarField(_Field):
+    """Scalar attribute that lives in an EntityStore column while attached."""
+    def __init__(self, cast=float) -> None:
+        self.cast = cast
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return self.slot.__get__(obj)
+        return self.cast(getattr(store, self.name)[obj._slot])
+
+    def __set__(self, obj, value) -> None:
+        store = obj._store
+        if store is None:
+            self.slot.__set__(obj, value)
+        else:
+            getattr(store, self.name)[obj._slot] = value
+
+
+class EntityView(GameObject):
+    """Base that turns an entity into a thin view over an EntityStore slot.
+
+    While detached, the physics attributes behave like ordinary instance
+    attributes. Once a StoredGroup attaches the entity, reads and writes go
+    straight to the store's arrays, so collision and rendering code keeps
+    using entity.position, entity.active and friends unchanged. Vectors read
+    while attached are FrozenVector2 copies: assign entity.position rather
+    than changing its x or y.
+    """
+    __slots__ = ('_store', '_slot', '_rotation_speed', '_age', '_lifetime')
+
+    position = _VectorField()
+    previous_position = _VectorField()
+    velocity = _VectorField()
+    rotation = _ScalarField()
+    rotation_speed = _ScalarField()
+    radius = _ScalarField()
+    age = _ScalarField()
+    lifetime = _ScalarField()
+    active = _ScalarField(bool)
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._store = None
+        self._slot = -1
+        super().__init__(*args, **kwargs)
+
+    def save_previous_position(self) -> None:
+        # Vector fields hand out copies, so assign rather than update in place
+        self.previous_position = pygame.Vector2(self.position)
+
+
+class EntityStore:
+    """Structure-of-arrays storage for one kind of entity.
+
+    Position, velocity, rotation, radius, lifetime and active flags are kept in
+    contiguous NumPy arrays so that integration, wrap-around and lifetime
+    expiry run as a single vectorized pass instead of one update() per sprite.
+    """
+    VECTOR_FIELDS = ('position', 'previous_position', 'velocity')
+    SCALAR_FIELDS = ('rotation', 'rotation_speed', 'radius', 'age', 'lifetime')
+    DEFAULTS = {'rotation_speed': 0.0, 'age': 0.0, 'lifetime': math.inf}
+
+    def __init__(self, kind: str, capacity: int = STORE_INITIAL_CAPACITY) -> None:
+        self.kind = kind
+        self.capacity = capacity
+        self.count = 0  # High-water mark of used slots
+        self.position = np.zeros((capacity, 2))
+        self.previous_position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.rotation = np.zeros(capacity)
+        self.rotation_speed = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.age = np.zeros(capacity)
+        self.lifetime = np.full(capacity, math.inf)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.entities: list = [None] * capacity
+        self.free_slots: list[int] = []
+
+    def __len__(self) -> int:
+        return self.count - len(self.free_slots)
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for name in self.VECTOR_FIELDS + self.SCALAR_FIELDS + ('active',):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.lifetime[self.capacity:] = math.inf
+        self.entities.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def attach(self, entity: EntityView) -> None:
+        """Move an entity's physics attributes into a free slot."""
+        if entity._store is not None:
+            return
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow()
+            slot = self.count
+            self.count += 1
+
+        fields = vars(EntityView)
+        for name in self.VECTOR_FIELDS:
+            value = fields[name].detached(entity)
+            getattr(self, name)[slot] = (value.x, value.y)
+        for name in self.SCALAR_FIELDS:
+            try:
+                value = fields[name].detached(entity)
+            except AttributeError:  # Not every entity has every field, e.g. asteroids never age
+                value = self.DEFAULTS.get(name, 0.0)
+            getattr(self, name)[slot] = value
+        self.active[slot] = fields['active'].detached(entity)
+
+        self.entities[slot] = entity
+        entity._store = self
+        entity._slot = slot
+
+    def detach(self, entity: EntityView) -> None:
+        """Copy an entity's state back onto the object and release its slot."""
+        if entity._store is not self:
+            return
+        slot = entity._slot
+        fields = vars(EntityView)
+        for name in self.VECTOR_FIELDS:
+            x, y = getattr(self, name)[slot]
+            fields[name].set_detached(entity, pygame.Vector2(x, y))
+        for name in self.SCALAR_FIELDS:
+            fields[name].set_detached(entity, float(getattr(self, name)[slot]))
+        fields['active'].set_detached(entity, bool(self.active[slot]))
+
+        self.active[slot] = False
+        self.lifetime[slot] = math.inf
+        self.entities[slot] = None
+        self.free_slots.append(slot)
+        entity._store = None
+        entity._slot = -1
+
+    def save_previous_positions(self) -> None:
+        n = self.count
+        self.previous_position[:n] = self.position[:n]
+
+    def step(self, dt: float, screen_width: int, screen_height: int) -> None:
+        """Age, expire, integrate and wrap every attached entity in one pass."""
+        n = self.count
+        if n == 0:
+            return
+        active = self.active[:n]
+
+        # Lifetime expiry happens before movement, like Bullet.update
+        age = self.age[:n]
+        np.add(age, dt, out=age, where=active)
+        active &= age < self.lifetime[:n]
+
+        moving = active[:, np.newaxis]
+        position = self.position[:n]
+        np.add(position, self.velocity[:n] * dt, out=position, where=moving)
+        rotation = self.rotation[:n]
+        np.add(rotation, self.rotation_speed[:n] * dt, out=rotation, where=active)
+
+        # Same rule as GameObject.wrap_position: jump to the opposite edge
+        for axis, limit in ((0, screen_width), (1, screen_height)):
+            coord = position[:, axis]
+            under = coord < 0
+            over = coord > limit
+            coord[under] = limit
+            coord[over] = 0
+
+
+class StoredGroup(EntityGroup):
+    """Entity group whose members are backed by an EntityStore.
+
+    Adding a sprite attaches it to the store and removing it detaches it, so
+    group membership and store slots stay in sync. update() runs the store's
+    vectorized step instead of calling update() on each sprite.
+    """
+    __slots__ = ('store',)
+
+    def __init__(self, kind: str, *sprites) -> None:
+        self.store = EntityStore(kind)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite) -> None:
+        super().add_internal(sprite)
+        self.store.attach(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self.store.detach(sprite)
+
+    def update(self, dt: float, screen_width: int, screen_height: int) -> None:
+        self.store.step(dt, screen_width, screen_height)
+
+    def slots(self) -> np.ndarray:
+        """Store slots of the members in group order, for reading their columns in bulk."""
+        return np.fromiter((entity._slot for entity in self), dtype=np.intp, count=len(self))
+
+    def save_previous_positions(self) -> None:
+        self.store.save_previous_positions()
@@ -0,0 +1,279 @@
+"""Training environments around the headless simulation.
+
+AsteroidsEnv is a single game with reset() and step(action). VectorEnv steps
+N independent games in one process. Their observations, rewards and done
+flags live in arrays allocated once, and each game writes into its own row.
+
+An action is an int from 0 to 15, the Controls bit mask: 1 rotate left,
+2 rotate right, 4 thrust, 8 shoot. An observation is a flat float32 vector:
+
+    PLAYER_FEATURES   cos and sin of the heading, velocity / PLAYER_MAX_SPEED,
+                      lives, level, shielded, multishot, speed boost,
+                      power-up time left / POWERUP_DURATION, invincible
+    OBJECT_FEATURES   for each of the nearest ENV_NEAREST_ASTEROIDS asteroids,
+                      ENV_NEAREST_UFOS UFOs and ENV_NEAREST_BULLETS UFO
+                      bullets: offset / world size (across the wrapped
+                      edges), velocity relative to the player /
+                      PLAYER_MAX_SPEED, radius / largest asteroid radius, and
+                      1 if the slot holds an object (0 for empty slots)
+
+The reward is ENV_SCORE_REWARD per point scored minus ENV_DEATH_PENALTY per
+life lost. An episode ends at game over, or is cut off (truncated) after
+max_ticks.
+
+    env = VectorEnv(64, seed=1)
+    obs = env.reset()
+    obs, rewards, dones = env.step(actions)  # the same arrays every step
+"""
+import math
+import random
+from typing import Optional
+import numpy as np
+from constants import (
+    PLAYER_MAX_SPEED, POWERUP_DURATION, ASTEROID_SIZES,
+    ENV_NEAREST_ASTEROIDS, ENV_NEAREST_UFOS, ENV_NEAREST_BULLETS, ENV_FRAME_SKIP, ENV_MAX_TICKS,
+    ENV_SCORE_REWARD, ENV_DEATH_PENALTY
+)
+from headless import create_headless_game
+from input_source import Controls
+from entity_store import StoredGroup
+
+ACTION_COUNT = 16
+ACTIONS = tuple(Controls.from_mask(mask) for mask in range(ACTION_COUNT))
+PLAYER_FEATURES = 11
+OBJECT_FEATURES = 6
+_MAX_RADIUS = max(size['radius'] for size in ASTEROID_SIZES.values())
+
+
+def observation_size(asteroids: int = ENV_NEAREST_ASTEROIDS, ufos: int = ENV_NEAREST_UFOS,
+                     bullets: int = ENV_NEAREST_BULLETS) -> int:
+    return PLAYER_FEATURES + (asteroids + ufos + bullets) * OBJECT_FEATURES
+
+
+class ActionInput:
+    """Input source that replays whichever action the environment set last."""
+    def __init__(self) -> None:
+        self.controls = ACTIONS[0]
+
+    def poll(self) -> Controls:
+        return self.controls
+
+
+class _NearestObjects:
+    """Scratch buffers for picking the K objects of one group closest to the player.
+
+    Rows hold x, y, vx, vy and radius. They grow when a group outgrows them
+    and are otherwise reused every step.
+    """
+    def __init__(self, k: int, capacity: int = 64) -> None:
+        self.k = k
+        self.rows = np.zeros((capacity, 5))
+        self.distance = np.zeros(capacity)
+
+    def _gather(self, group) -> int:
+        if isinstance(group, StoredGroup):
+            store = group.store
+            # Group order rather than slot order, so ties break the same way as unstored groups
+            slots = group.slots()
+            live = slots[store.active[slots]]
+            n = len(live)
+            self._reserve(n)
+            np.take(store.position, live, axis=0, out=self.rows[:n, 0:2])
+            np.take(store.velocity, live, axis=0, out=self.rows[:n, 2:4])
+            np.take(store.radius, live, out=self.rows[:n, 4])
+            return n
+        self._reserve(len(group))
+        rows = self.rows
+        n = 0
+        for entity in group:
+            if not entity.active:
+                continue
+            position, velocity = entity.position, entity.velocity
+            row = rows[n]
+            row[0] = position.x
+            row[1] = position.y
+            row[2] = velocity.x
+            row[3] = velocity.y
+            row[4] = entity.radius
+            n += 1
+        return n
+
+    def _reserve(self, n: int) -> None:
+        if n > len(self.rows):
+            capacity = max(n, len(self.rows) * 2)
+            self.rows = np.zeros((capacity, 5))
+            self.distance = np.zeros(capacity)
+
+    def write(self, group, player, width: int, height: int, out: np.ndarray) -> None:
+        """Fill out (k rows of OBJECT_FEATURES) with the nearest objects, nearest first."""
+        n = self._gather(group)
+        out.fill(0.0)
+        if n == 0:
+            return
+        rows = self.rows[:n]
+        dx, dy = rows[:, 0], rows[:, 1]
+        # Shortest offset across the wrapped edges
+        dx -= player.position.x - width / 2
+        np.mod(dx, width, out=dx)
+        dx -= width / 2
+        dy -= player.position.y - height / 2
+        np.mod(dy, height, out=dy)
+        dy -= height / 2
+        distance = self.distance[:n]
+        np.hypot(dx, dy, out=distance)
+
+        k = min(self.k, n)
+        if n > k:
+            nearest = np.argpartition(distance, k - 1)[:k]
+            nearest.sort()
+            nearest = nearest[np.argsort(distance[nearest], kind='stable')]
+        else:
+            nearest = np.argsort(distance, kind='stable')
+        picked = out[:k]
+        np.take(rows, nearest, axis=0, out=picked[:, 0:5])
+        picked[:, 0] /= width
+        picked[:, 1] /= height
+        picked[:, 2] -= player.velocity.x
+        picked[:, 3] -= player.velocity.y
+        picked[:, 2:4] /= PLAYER_MAX_SPEED
+        picked[:, 4] /= _MAX_RADIUS
+        picked[:, 5] = 1.0
+
+
+class AsteroidsEnv:
+    """One headless game behind a reset()/step(action) interface.
+
+    reset() and step() return the same observation array every time, updated
+    in place; copy it to keep an old one. Passing `out` makes the environment
+    write its observation into a row the caller owns, which is how VectorEnv
+    batches games.
+    """
+    def __init__(self, difficulty: str = 'normal', seed: Optional[int] = None,
+                 frame_skip: int = ENV_FRAME_SKIP, max_ticks: int = ENV_MAX_TICKS,
+                 out: Optional[np.ndarray] = None) -> None:
+        self.difficulty = difficulty
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.input = ActionInput()
+        self.game = create_headless_game(self.input, difficulty, seed)
+        self.observation = out if out is not None else np.zeros(observation_size(), dtype=np.float32)
+        sections = np.cumsum([PLAYER_FEATURES] + [k * OBJECT_FEATURES for k in
+                             (ENV_NEAREST_ASTEROIDS, ENV_NEAREST_UFOS, ENV_NEAREST_BULLETS)])
+        self._player_view = self.observation[:PLAYER_FEATURES]
+        self._object_views = [
+            (group_name, nearest, self.observation[start:end].reshape(-1, OBJECT_FEATURES))
+            for group_name, nearest, start, end in zip(
+                ('asteroids', 'ufos', 'ufo_bullets'),
+                (_NearestObjects(ENV_NEAREST_ASTEROIDS), _NearestObjects(ENV_NEAREST_UFOS),
+                 _NearestObjects(ENV_NEAREST_BULLETS)),
+                sections[:-1], sections[1:],
+            )
+        ]
+        self._observe()
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """Start a new episode; the same seed and actions replay it exactly."""
+        game = self.game
+        game.difficulty = self.difficulty
+        game.apply_difficulty()
+        game.logic.reset_game(seed)
+        self._observe()
+        return self.observation
+
+    def advance(self, action: int) -> tuple[float, bool, bool]:
+        """Hold action for frame_skip ticks and update the observation in place.
+
+        Returns (reward, done, truncated) without building an info dict; step()
+        wraps it in the usual four-tuple.
+        """
+        game = self.game
+        self.input.controls = ACTIONS[action]
+        score, lives = game.score, game.lives
+        lives_lost = 0
+        dt = game.tick_dt
+        for _ in range(self.frame_skip):
+            if game.game_over:
+                break
+            game.update(dt)
+            if game.lives < lives:
+                lives_lost += lives - game.lives
+            lives = game.lives
+        self._observe()
+        reward = (game.score - score) * ENV_SCORE_REWARD - lives_lost * ENV_DEATH_PENALTY
+        truncated = not game.game_over and game.sim_clock.ticks >= self.max_ticks
+        return reward, game.game_over or truncated, truncated
+
+    def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+        reward, done, truncated = self.advance(action)
+        game = self.game
+        return self.observation, reward, done, {
+            'score': game.score, 'level': game.level, 'lives': game.lives,
+            'tick': game.sim_clock.ticks, 'truncated': truncated,
+        }
+
+    def _observe(self) -> None:
+        game = self.game
+        player = game.player
+        features = self._player_view
+        heading = math.radians(player.rotation)
+        features[0] = math.cos(heading)
+        features[1] = math.sin(heading)
+        features[2] = player.velocity.x / PLAYER_MAX_SPEED
+        features[3] = player.velocity.y / PLAYER_MAX_SPEED
+        features[4] = game.lives
+        features[5] = game.level
+        features[6] = player.shielded
+        features[7] = player.multishot
+        features[8] = player.speed_boost > 1.0
+        features[9] = player.powerup_timer / POWERUP_DURATION
+        features[10] = player.invincible_timer > 0
+        width, height = game.world_width, game.world_height
+        for group_name, nearest, out in self._object_views:
+            nearest.write(getattr(game, group_name), player, width, height, out)
+
+
+class VectorEnv:
+    """N independent games stepped together, batched into preallocated arrays.
+
+    step(actions) returns the same observations, rewards and dones arrays
+    every call. A game that finishes is reset right away with a fresh seed
+    drawn from `seed`, so its row already holds the next episode's first
+    observation; dones and truncated mark which rows just ended, and
+    episode_scores keeps the final score of each row's last finished episode.
+    """
+    def __init__(self, num_envs: int, difficulty: str = 'normal', seed: Optional[int] = None,
+                 frame_skip: int = ENV_FRAME_SKIP, max_ticks: int = ENV_MAX_TICKS) -> None:
+        self.num_envs = num_envs
+        self.seeds = random.Random(seed)
+        self.observations = np.zeros((num_envs, observation_size()), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.episode_scores = np.zeros(num_envs, dtype=np.int64)
+        self.envs = [
+            AsteroidsEnv(difficulty, self._next_seed(), frame_skip, max_ticks, out=self.observations[i])
+            for i in range(num_envs)
+        ]
+
+    def _next_seed(self) -> int:
+        return self.seeds.getrandbits(63)
+
+    def reset(self) -> np.ndarray:
+        for env in self.envs:
+            env.reset(self._next_seed())
+        self.rewards.fill(0.0)
+        self.dones.fill(False)
+        self.truncated.fill(False)
+        return self.observations
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rewards, dones, truncated = self.rewards, self.dones, self.truncated
+        for i, env in enumerate(self.envs):
+            reward, done, cut_off = env.advance(int(actions[i]))
+            rewards[i] = reward
+            dones[i] = done
+            truncated[i] = cut_off
+            if done:
+                self.episode_scores[i] = env.game.score
+                env.reset(self._next_seed())
+        return self.observations, rewards, dones
@@ -1,3 +1,21 @@
+"""Synchronous event bus for things that happen during a simulation tick.
+
+Collision passes only record what happened by emitting a small payload tuple.
+Scoring, power-up drops, particles, audio and telemetry subscribe to the
+event types they care about. They run once per tick, after the collision
+phase, and each handler gets the whole batch of that tick's events. This
+keeps the hit loops short and lets a subsystem coalesce work, for example
+playing one explosion sound for five kills. The pygame event queue is not
+involved, so the bus works the same in headless runs.
+
+Payloads, by event type:
+
+    ASTEROID_DESTROYED  (x, y, score, shot): shot is False when a shield rammed it
+    UFO_DESTROYED       (x, y, score)
+    PLAYER_HIT          (x, y, lives_left)
+    POWERUP_COLLECTED   (x, y, powerup_type)
+    LEVEL_COMPLETE      (level,)
+"""
 import pygame
 
 # Custom event types
@@ -7,27 +25,63 @@ PLAYER_HIT = pygame.USEREVENT + 3
 POWERUP_COLLECTED = pygame.USEREVENT + 4
 LEVEL_COMPLETE = pygame.USEREVENT + 5
 
-class EventManager:
-    @staticmethod
-    def post_asteroid_destroyed(position, score_value):
-        pygame.event.post(pygame.event.Event(ASTEROID_DESTROYED,
-            {'position': position, 'score': score_value}))
-
-    @staticmethod
-    def post_ufo_destroyed(position, score):
-        pygame.event.post(pygame.event.Event(UFO_DESTROYED,
-            {'position': position, 'score': score}))
-
-    @staticmethod
-    def post_player_hit():
-        pygame.event.post(pygame.event.Event(PLAYER_HIT))
-
-    @staticmethod
-    def post_powerup_collected(type_):
-        pygame.event.post(pygame.event.Event(POWERUP_COLLECTED,
-            {'type': type_}))
-
-    @staticmethod
-    def post_level_complete(level):
-        pygame.event.post(pygame.event.Event(LEVEL_COMPLETE,
-            {'level': level}))
\ No newline at end of file
+EVENT_NAMES = {
+    ASTEROID_DESTROYED: 'asteroid_destroyed',
+    UFO_DESTROYED: 'ufo_destroyed',
+    PLAYER_HIT: 'player_hit',
+    POWERUP_COLLECTED: 'powerup_collected',
+    LEVEL_COMPLETE: 'level_complete',
+}
+
+
+class EventBus:
+    """Per-tick event queues with batched, synchronous delivery.
+
+    emit() appends to the queue of its event type and does nothing else;
+    events of a type the bus does not know are dropped at once. dispatch()
+    hands each queue to that type's handlers in the order they subscribed,
+    taking the types in the order of event_types and then of their first
+    subscription, so a seeded run handles its events in the same order every
+    time. Events emitted while dispatching wait for the next dispatch().
+    counts keeps the number of events delivered per type, for telemetry.
+    """
+    def __init__(self, event_types=tuple(EVENT_NAMES)) -> None:
+        self._handlers: dict[int, list] = {event_type: [] for event_type in event_types}
+        self._queues: dict[int, list[tuple]] = {event_type: [] for event_type in event_types}
+        self.counts: dict[int, int] = {event_type: 0 for event_type in event_types}
+
+    def subscribe(self, event_type: int, handler) -> None:
+        """Call handler(events) with each tick's list of event_type payloads."""
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._queues.setdefault(event_type, [])
+        self.counts.setdefault(event_type, 0)
+
+    def unsubscribe(self, event_type: int, handler) -> None:
+        self._handlers[event_type].remove(handler)
+
+    def emit(self, event_type: int, *payload) -> None:
+        queue = self._queues.get(event_type)
+        if queue is not None:
+            queue.append(payload)
+
+    def pending(self, event_type: int) -> int:
+        queue = self._queues.get(event_type)
+        return len(queue) if queue else 0
+
+    def dispatch(self) -> None:
+        queues = self._queues
+        for event_type, events in queues.items():
+            if not events:
+                continue
+            queues[event_type] = []
+            self.counts[event_type] += len(events)
+            for handler in self._handlers[event_type]:
+                handler(events)
+
+    def clear(self) -> None:
+        """Drop undelivered events, e.g. when a new run starts."""
+        for events in self._queues.values():
+            events.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {EVENT_NAMES.get(event_type, str(event_type)): count for event_type, count in self.counts.items()}
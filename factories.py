@@ -1,36 +1,122 @@
 import pygame
+import random
 from asteroid import Asteroid
 from bullet import Bullet
 from powerup import PowerUp
 from ufo import UFO
-from particle import Particle
-from constants import ASTEROID_SIZES
+from constants import ASTEROID_SIZES, POOL_HIGH_WATER_MARKS
+
+
+class ObjectPool:
+    """Free list of released objects of one class.
+
+    acquire() hands out a released object after calling its reset() with the
+    constructor arguments, and only constructs a new one when the free list is
+    empty. release() keeps up to high_water objects for later reuse; any beyond
+    that are dropped for the garbage collector.
+    """
+    def __init__(self, cls: type, high_water: int) -> None:
+        self.cls = cls
+        self.high_water = high_water
+        self.free: list = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.cls(*args)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+
+    def release(self, obj) -> None:
+        # Objects built outside the pool may be released into it as well
+        self.in_use = max(0, self.in_use - 1)
+        if len(self.free) < self.high_water:
+            self.free.append(obj)
+        else:
+            self.discarded += 1
+
+    def stats(self) -> dict:
+        acquired = self.hits + self.misses
+        return {
+            'free': len(self.free),
+            'in_use': self.in_use,
+            'peak_in_use': self.peak_in_use,
+            'hits': self.hits,
+            'misses': self.misses,
+            'discarded': self.discarded,
+            'hit_rate': self.hits / acquired if acquired else 0.0,
+        }
+
 
 class AsteroidFactory:
-    @staticmethod
-    def create(position, size='large'):
-        return Asteroid(position, size)
+    def __init__(self, high_water: int = POOL_HIGH_WATER_MARKS['asteroids']) -> None:
+        self.pool = ObjectPool(Asteroid, high_water)
+
+    def create(self, position, size='large', rng=random):
+        return self.pool.acquire(position, size, rng)
 
 class BulletFactory:
-    @staticmethod
-    def create(position, velocity):
-        return Bullet(position, velocity)
+    def __init__(self, high_water: int = POOL_HIGH_WATER_MARKS['bullets']) -> None:
+        self.pool = ObjectPool(Bullet, high_water)
+
+    def create(self, position, velocity):
+        return self.pool.acquire(position, velocity)
 
 class PowerUpFactory:
-    @staticmethod
-    def create(position, type_):
-        return PowerUp(position, type_)
+    def __init__(self, high_water: int = POOL_HIGH_WATER_MARKS['powerups']) -> None:
+        self.pool = ObjectPool(PowerUp, high_water)
+
+    def create(self, position, type_):
+        return self.pool.acquire(position, type_)
 
 class UFOFactory:
-    @staticmethod
-    def create(position, screen_width):
-        return UFO(position, screen_width)
-
-class ParticleFactory:
-    @staticmethod
-    def create_explosion(position):
-        return Particle(position)
-
-    @staticmethod
-    def create_thrust(position, velocity):
-        return Particle(position, velocity)
\ No newline at end of file
+    def __init__(self, high_water: int = POOL_HIGH_WATER_MARKS['ufos']) -> None:
+        self.pool = ObjectPool(UFO, high_water)
+
+    def create(self, position, screen_width, rng=random):
+        return self.pool.acquire(position, screen_width, rng)
+
+
+class EntityFactories:
+    """The pooled factories of one game, with release() routed by entity type."""
+    def __init__(self) -> None:
+        self.asteroids = AsteroidFactory()
+        self.bullets = BulletFactory()
+        self.powerups = PowerUpFactory()
+        self.ufos = UFOFactory()
+        self._pools = {
+            Asteroid: self.asteroids.pool,
+            Bullet: self.bullets.pool,
+            PowerUp: self.powerups.pool,
+            UFO: self.ufos.pool,
+        }
+
+    def release(self, entity) -> None:
+        """Return an entity that has left every group to its pool."""
+        pool = self._pools.get(type(entity))
+        if pool is not None:
+            pool.release(entity)
+
+    def release_group(self, group) -> None:
+        """Empty a sprite group, returning its members to their pools."""
+        entities = group.sprites()
+        group.empty()
+        for entity in entities:
+            self.release(entity)
+
+    def stats(self) -> dict:
+        return {name: factory.pool.stats() for name, factory in (
+            ('asteroids', self.asteroids), ('bullets', self.bullets),
+            ('powerups', self.powerups), ('ufos', self.ufos),
+        )}
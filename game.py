@@ -6,33 +6,45 @@ from typing import List, Optional
 from player import Player
 from asteroid import Asteroid
 from bullet import Bullet
-from particle import Particle
 from powerup import PowerUp
 from ufo import UFO
 from game_states import MenuState, PlayingState, GameOverState, HighscoresState, EnterNameState
 from collision_manager import CollisionManager
-from event_manager import EventManager
-from factories import AsteroidFactory, PowerUpFactory, UFOFactory, ParticleFactory
+from event_manager import EventBus, ASTEROID_DESTROYED, UFO_DESTROYED
+from factories import EntityFactories
 from game_renderer import GameRenderer
 from game_logic import GameLogic
 from state_machine import StateMachine
+from entity_store import StoredGroup
+from game_object import EntityGroup
+from text_cache import get_font, render_text
+from input_source import InputSource, KeyboardInput
+from sim_clock import SimulationClock
+from particle_system import ParticleSystem
+from replay import ReplayRecorder
+from profiler import Profiler
+from sounds import SOUNDS
+from quality import QUALITY
+from startup import StartupTimer, AssetLoader
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE, RED, FONT_SIZE,
+    SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, FPS, TICK_RATE, MAX_CATCH_UP_TICKS, BLACK, WHITE, RED, FONT_SIZE,
     INITIAL_LIVES, INITIAL_LEVEL, BASE_ASTEROIDS, LEVEL_ASTEROID_INCREASE,
     ASTEROID_SPAWN_DISTANCE, SPEED_INCREASE_PER_LEVEL,
     POWERUP_SPAWN_CHANCE, POWERUP_TYPES, POWERUP_DURATION,
     UFO_SPAWN_LEVEL, UFO_SPAWN_CHANCE, UFO_SCORE,
     PARTICLE_COUNT_EXPLODE,
-    load_sounds, init_channels, MUSIC_BACKGROUND, MUSIC_VOLUME, SOUND_EXPLODE,
+    MUSIC_BACKGROUND, MUSIC_VOLUME,
     UI_SCORE_X, UI_SCORE_Y, UI_LIVES_X, UI_LIVES_Y, UI_LEVEL_X, UI_LEVEL_Y,
     UI_GAME_OVER_X_OFFSET, UI_GAME_OVER_Y, UI_TITLE_X, UI_TITLE_Y,
     UI_START_X, UI_START_Y, UI_HIGHSCORES_X, UI_HIGHSCORES_Y,
     UI_BACK_X, UI_BACK_Y, UI_ENTER_NAME_PROMPT_X, UI_ENTER_NAME_PROMPT_Y,
     UI_ENTER_NAME_TEXT_Y, UI_PAUSE_TITLE_X, UI_PAUSE_TITLE_Y,
     UI_RESUME_X, UI_RESUME_Y, UI_RESTART_X, UI_RESTART_Y,
-    UI_MENU_X, UI_MENU_Y
+    UI_MENU_X, UI_MENU_Y, USE_ENTITY_STORE, RECORD_REPLAYS
 )
-from highscores import get_highscores, add_highscore, is_highscore
+import sqlite3
+from highscores import HighscoreStore, HIGHSCORES_FILE
+from leaderboard import Leaderboard
 
 
 class Game:
@@ -40,17 +52,53 @@ class Game:
 
     Handles initialization, game loop, input processing, updating, rendering,
     and manages all game entities through sprite groups and state machine.
+
+    With headless=True no window, mixer or fonts are created and nothing is
+    drawn; the simulation reads controls from input_source and is stepped
+    explicitly (see headless.py).
+
+    The simulation advances in fixed ticks of 1 / TICK_RATE seconds and draws
+    all of its randomness from self.rng, so a given seed and input sequence
+    always produce the same run. Windowed runs are recorded as replays when
+    RECORD_REPLAYS is set (see replay.py).
+
+    Startup does only what the first menu frame needs: sounds, music and the
+    system font list load on a background AssetLoader, the leaderboard opens
+    on first use and the first level is built when a run starts. Each step's
+    duration is kept in self.startup (see startup.py).
     """
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, input_source: Optional[InputSource] = None, seed: Optional[int] = None,
+                 world_size: Optional[tuple[int, int]] = None) -> None:
         """Initialize the game with all necessary components."""
-        self._setup_pygame()
-        self._setup_audio()
-        self._setup_ui()
-        self._load_config()
-        self._setup_sprite_groups()
-        self._setup_game_state()
-        self._setup_state_machine()
-        self._setup_managers()
+        self.headless = headless
+        # The wrapping play field, which may be larger than the screen (see camera.py)
+        self.world_width, self.world_height = world_size or (WORLD_WIDTH, WORLD_HEIGHT)
+        self.input_source = input_source or KeyboardInput()
+        self.sim_clock = SimulationClock()
+        self.rng = random.Random()
+        self.seed = seed
+        self.tick_dt = 1.0 / TICK_RATE
+        self.render_alpha = 1.0  # Fraction of a tick the rendered frame lies past the last tick
+        self.replay_recorder = ReplayRecorder() if RECORD_REPLAYS and not headless else None
+        self.profiler = Profiler()
+        self.startup = StartupTimer()
+        self.assets: Optional[AssetLoader] = None
+        self.report_startup = False  # Print self.startup once the loader is done
+        if headless:
+            steps = [('headless', self._setup_headless)]
+        else:
+            steps = [('pygame', self._setup_pygame), ('assets', self._setup_assets)]
+        steps += [
+            ('ui', self._setup_ui),
+            ('config', self._load_config),
+            ('sprite groups', self._setup_sprite_groups),
+            ('game state', self._setup_game_state),
+            ('state machine', self._setup_state_machine),
+            ('managers', self._setup_managers),
+        ]
+        for name, step in steps:
+            with self.startup.phase(name):
+                step()
 
     def _setup_pygame(self) -> None:
         """Initialize Pygame and basic display settings."""
@@ -71,11 +119,24 @@ class Game:
         self.clock = pygame.time.Clock()
         self.fps = FPS
 
-    def _setup_audio(self) -> None:
-        """Load and initialize audio components."""
-        global SOUND_SHOOT, SOUND_EXPLODE, SOUND_THRUST
-        SOUND_SHOOT, SOUND_EXPLODE, SOUND_THRUST = load_sounds()
-        init_channels()
+    def _setup_headless(self) -> None:
+        """Simulation-only setup: no display, audio or font initialization."""
+        self.screen_width = SCREEN_WIDTH
+        self.screen_height = SCREEN_HEIGHT
+        self.screen = None
+        self.clock = None
+        self.fps = FPS
+
+    def _setup_assets(self) -> None:
+        """Start loading the system font list, sounds and music in the background."""
+        SOUNDS.init_channels()
+        self.assets = AssetLoader(self.startup)
+        self.assets.add('fonts', pygame.font.get_fonts)  # Scans the system fonts once for SysFont
+        self.assets.add('sounds', SOUNDS.load)
+        self.assets.add('music', self._start_music)
+        self.assets.start()
+
+    def _start_music(self) -> None:
         if os.path.exists(MUSIC_BACKGROUND):
             pygame.mixer.music.load(MUSIC_BACKGROUND)
             pygame.mixer.music.play(-1)
@@ -83,10 +144,9 @@ class Game:
 
     def _setup_ui(self) -> None:
         """Initialize UI components and caching."""
-        self.font = pygame.font.Font(None, FONT_SIZE)
+        self.font = None if self.headless else get_font(None, FONT_SIZE)
         self.difficulty = 'normal'
         self.input_name = ""
-        self.ui_text_cache = {}
         self.dirty_rects = []
         self.use_dirty_rects = True  # Enable optimized rendering
 
@@ -101,13 +161,19 @@ class Game:
             self.config = {}  # Fallback empty config
 
     def _setup_sprite_groups(self) -> None:
-        """Initialize all sprite groups for game entities."""
-        self.asteroids = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
-        self.ufos = pygame.sprite.Group()
-        self.ufo_bullets = pygame.sprite.Group()
-        self.explosion_particles = pygame.sprite.Group()
+        """Initialize all entity groups for game entities."""
+        if USE_ENTITY_STORE:
+            self.asteroids = StoredGroup('asteroids')
+            self.bullets = StoredGroup('bullets')
+            self.ufo_bullets = StoredGroup('ufo_bullets')
+        else:
+            self.asteroids = EntityGroup()
+            self.bullets = EntityGroup()
+            self.ufo_bullets = EntityGroup()
+        self.powerups = EntityGroup()
+        self.ufos = EntityGroup()
+        self.particles = ParticleSystem()
+        self.factories = EntityFactories()
 
     def _setup_game_state(self) -> None:
         """Initialize game state variables."""
@@ -118,9 +184,30 @@ class Game:
         self.game_over = False
         self.player = None
         self.running = True
-        self.start_time = pygame.time.get_ticks()
+        self.highscores = HighscoreStore()
+        self._leaderboard: Optional[Leaderboard] = None
+        self._leaderboard_opened = self.headless  # Headless runs never use the leaderboard
+        self.last_rank = None  # Leaderboard rank of the last name entered
+        self.events = EventBus()
         self.logic = GameLogic(self)
-        self.logic.reset_game()
+        self._subscribe_events()
+        # The first level is built when a run starts: PlayingState.enter for windowed games,
+        # create_headless_game() or play_replay() for headless ones
+
+    def _subscribe_events(self) -> None:
+        """Hook scoring, power-up drops, particles and audio up to the collision events.
+
+        Handlers of one event type run in this order; power-up drops draw
+        from the seeded rng, so changing it changes replays.
+        """
+        events = self.events
+        for event_type in (ASTEROID_DESTROYED, UFO_DESTROYED):
+            events.subscribe(event_type, self.logic.score_kills)
+        events.subscribe(ASTEROID_DESTROYED, self.logic.drop_powerups)
+        for event_type in (ASTEROID_DESTROYED, UFO_DESTROYED):
+            events.subscribe(event_type, self.particles.emit_explosions)
+            if not self.headless:
+                events.subscribe(event_type, SOUNDS.play_explosions)
 
     def _setup_state_machine(self) -> None:
         """Initialize the state machine with all game states."""
@@ -135,7 +222,9 @@ class Game:
     def _setup_managers(self) -> None:
         """Initialize collision and rendering managers."""
         self.collision_manager = CollisionManager(self)
-        self.renderer = GameRenderer(self)
+        self.renderer = None if self.headless else GameRenderer(self)
+        if not self.headless:
+            self.apply_quality()
 
     @property
     def states(self):
@@ -156,7 +245,7 @@ class Game:
         self.state_machine.change_state(new_state_name)
 
     def update(self, dt: float) -> None:
-        """Update game logic with delta time."""
+        """Run one simulation tick of dt seconds."""
         self.logic.update(dt)
 
     def handle_input(self, events, keys) -> None:
@@ -165,7 +254,31 @@ class Game:
 
     def draw(self) -> None:
         """Render the current game state to the screen."""
-        self.renderer.draw(self.screen)
+        if self.renderer:
+            self.renderer.draw(self.screen)
+
+    def snapshot(self) -> dict:
+        """Plain-data summary of the simulation state for playtest and load-test tooling."""
+        return {
+            'seed': self.seed,
+            'tick': self.sim_clock.ticks,
+            'time': self.sim_clock.now,
+            'score': self.score,
+            'lives': self.lives,
+            'level': self.level,
+            'game_over': self.game_over,
+            'player': {
+                'position': (self.player.position.x, self.player.position.y),
+                'velocity': (self.player.velocity.x, self.player.velocity.y),
+                'rotation': self.player.rotation,
+            },
+            'asteroids': len(self.asteroids),
+            'bullets': len(self.bullets),
+            'ufos': len(self.ufos),
+            'ufo_bullets': len(self.ufo_bullets),
+            'powerups': len(self.powerups),
+            'particles': len(self.particles),
+        }
 
     def apply_difficulty(self) -> None:
         if self.difficulty == 'easy':
@@ -178,47 +291,123 @@ class Game:
             self.initial_lives = 3
             self.ufo_spawn_chance = 0.05
 
-    def _get_cached_text(self, key: str, text: str, color: tuple[int, int, int]) -> pygame.Surface:
-        cache_key = f"{key}_{text}_{color}"
-        cached = self.ui_text_cache.get(cache_key)
-        if cached is None or cached[0] != text:
-            surface = self.font.render(text, True, color)
-            self.ui_text_cache[cache_key] = (text, surface)
-        return self.ui_text_cache[cache_key][1]
+    def apply_quality(self) -> None:
+        """Match the particle density to the current render quality tier (see quality.py)."""
+        self.particles.density = QUALITY.tier.particles
+
+    def _get_cached_text(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        return render_text(text, self.font, color)
+
+    @property
+    def leaderboard(self) -> Optional[Leaderboard]:
+        """The SQLite leaderboard, opened on first use to keep it off the startup path."""
+        if not self._leaderboard_opened:
+            self._leaderboard_opened = True
+            self._leaderboard = self._open_leaderboard()
+        return self._leaderboard
+
+    def _open_leaderboard(self) -> Optional[Leaderboard]:
+        """Open the SQLite leaderboard, importing the legacy JSON table on first use."""
+        try:
+            leaderboard = Leaderboard()
+            leaderboard.import_json(HIGHSCORES_FILE)
+            return leaderboard
+        except sqlite3.Error as e:
+            print(f"Warning: Could not open leaderboard: {e}. Using {HIGHSCORES_FILE} only.")
+            return None
 
     def get_highscores(self):
-        return get_highscores()
+        if self.leaderboard:
+            return self.leaderboard.top(self.difficulty)
+        return self.highscores.get_highscores()
+
+    def is_highscore(self, score: int) -> bool:
+        if self.leaderboard:
+            return self.leaderboard.is_highscore(score, self.difficulty)
+        return self.highscores.is_highscore(score)
+
+    def refresh_highscores(self) -> None:
+        """Pick up scores saved by other game processes."""
+        self.highscores.refresh()
+        if self.leaderboard:
+            self.leaderboard.refresh()
 
     def add_highscore(self, name, score):
-        return add_highscore(name, score)
+        if self.leaderboard:
+            self.leaderboard.add_run(name, score, self.difficulty, self.level, self.seed)
+            self.last_rank = self.leaderboard.rank(score, self.difficulty)
+        return self.highscores.add_highscore(name, score)
 
     def _reset_player_position(self) -> None:
-        self.player.position = pygame.Vector2(self.screen_width // 2, self.screen_height // 2)
+        self.player.position = pygame.Vector2(self.world_width // 2, self.world_height // 2)
         self.player.velocity = pygame.Vector2(0, 0)
         self.player.rotation = 0
         self.player.invincible_timer = 2.0  # 2 seconds of invincibility
 
     def run(self) -> None:
-        """Main game loop handling events, updates, and rendering."""
+        """Main game loop: fixed-step simulation, rendering once per frame.
+
+        Frame time accumulates and is consumed in whole ticks. After a hitch at
+        most MAX_CATCH_UP_TICKS run in one frame and the remaining backlog is
+        dropped, so the game slows down briefly instead of spiraling.
+        """
+        accumulator = 0.0
+        profiler = self.profiler
         while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0
+            frame_time = self.clock.tick(self.fps) / 1000.0
+            profiler.begin_frame()
 
-            events = pygame.event.get()
-            keys = pygame.key.get_pressed()
+            with profiler.span('input.poll'):
+                events = pygame.event.get()
+                keys = pygame.key.get_pressed()
 
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and profiler.count:
+                    print(f"Profile written to {profiler.export_default()}")
 
-            self.handle_input(events, keys)
+            with profiler.span('input.handle'):
+                self.handle_input(events, keys)
 
             if self.state_name == 'playing' and not self.game_over:
-                self.update(dt)
+                accumulator += frame_time
+                ticks = 0
+                while accumulator >= self.tick_dt and ticks < MAX_CATCH_UP_TICKS and not self.game_over:
+                    self.update(self.tick_dt)
+                    accumulator -= self.tick_dt
+                    ticks += 1
+                if ticks == MAX_CATCH_UP_TICKS:
+                    accumulator = min(accumulator, self.tick_dt)
+                self.render_alpha = min(accumulator / self.tick_dt, 1.0)
+            else:
+                accumulator = 0.0
+                self.render_alpha = 1.0
+
+            # Quality follows the frames of play only; menus would always look idle
+            if self.state_name == 'playing' and QUALITY.observe(self.clock.get_rawtime() / 1000.0):
+                self.apply_quality()
 
             if self.state_name == 'playing' and self.game_over:
-                if is_highscore(self.score):
+                if self.is_highscore(self.score):
                     self.change_state('enter_name')
 
-            self.draw()
-
+            with profiler.span('audio'):
+                SOUNDS.flush()
+
+            with profiler.span('render'):
+                self.draw()
+            profiler.end_frame()
+            self.startup.mark_first_frame()
+            if self.report_startup and self.assets.done.is_set():
+                self.report_startup = False
+                print(self.startup.report())
+
+        if self.replay_recorder:
+            self.replay_recorder.finish()
+        self.highscores.close()
+        if self._leaderboard:
+            self._leaderboard.close()
         pygame.quit()
\ No newline at end of file
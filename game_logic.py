@@ -1,14 +1,16 @@
 import pygame
 import random
-from typing import TYPE_CHECKING
+import numpy as np
+from typing import TYPE_CHECKING, Optional
 from player import Player
-from asteroid import Asteroid
-from ufo import UFO
+from input_source import Controls
 from constants import (
     INITIAL_LIVES, INITIAL_LEVEL, BASE_ASTEROIDS, LEVEL_ASTEROID_INCREASE,
-    ASTEROID_SPAWN_DISTANCE, SPEED_INCREASE_PER_LEVEL, UFO_SPAWN_LEVEL, UFO_SPAWN_CHANCE,
-    POWERUP_DURATION, SPEED_BOOST_MULTIPLIER
+    ASTEROID_SPAWN_DISTANCE, ASTEROID_SPAWN_ATTEMPTS, SPEED_INCREASE_PER_LEVEL, UFO_SPAWN_LEVEL, UFO_SPAWN_CHANCE,
+    POWERUP_DURATION, SPEED_BOOST_MULTIPLIER, POWERUP_SPAWN_CHANCE, POWERUP_TYPES,
+    FAR_UPDATE_DISTANCE, FAR_UPDATE_INTERVAL
 )
+from event_manager import LEVEL_COMPLETE
 
 if TYPE_CHECKING:
     from game import Game
@@ -18,65 +20,162 @@ class GameLogic:
         self.game = game
 
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
+        """Advance the simulation by one fixed tick of dt seconds.
+
+        The stages are separate methods so benchmarks can time
+        them individually; they must run in this order.
+        """
+        profiler = self.game.profiler
+        with profiler.span('logic.begin'):
+            controls = self.begin_tick(dt)
+        with profiler.span('logic.entities'):
+            self.update_entities(dt, controls)
+        with profiler.span('logic.collisions'):
+            self.game.collision_manager.check_collisions(dt)
+        with profiler.span('logic.events'):
+            self.game.events.dispatch()
+        with profiler.span('logic.particles'):
+            self.game.particles.update(dt)
+        with profiler.span('logic.end'):
+            self.end_tick()
+
+    def begin_tick(self, dt: float) -> Controls:
+        """Advance the clock and read this tick's controls."""
+        self._save_previous_positions()
+        self.game.sim_clock.advance(dt)
+        controls = self.game.input_source.poll()
+        if self.game.replay_recorder:
+            self.game.replay_recorder.record_input(controls)
+        return controls
+
+    def update_entities(self, dt: float, controls: Controls) -> None:
+        """Move the player and every entity group, spawn and fire UFOs."""
+        now = self.game.sim_clock.now
 
         # Update player
-        self.game.player.update(dt, keys, self.game.screen_width, self.game.screen_height)
+        self.game.player.update(dt, controls, self.game.world_width, self.game.world_height)
 
         # Shoot
-        if keys[pygame.K_SPACE]:
-            bullets = self.game.player.shoot()
+        if controls.shoot:
+            bullets = self.game.player.shoot(now, self.game.factories.bullets.create)
             self.game.bullets.add(*bullets)
 
         # Update groups
-        self.game.bullets.update(dt, self.game.screen_width, self.game.screen_height)
-        self.game.asteroids.update(dt, self.game.screen_width, self.game.screen_height)
-        self.game.powerups.update(dt, self.game.screen_width, self.game.screen_height)
+        self.game.bullets.update(dt, self.game.world_width, self.game.world_height)
+        self.update_asteroids(dt)
+        self.game.powerups.update(dt, self.game.world_width, self.game.world_height)
 
         # Spawn UFOs
-        if self.game.level >= UFO_SPAWN_LEVEL and len(self.game.ufos.sprites()) < 2 and random.random() < self.game.ufo_spawn_chance:
+        if self.game.level >= UFO_SPAWN_LEVEL and len(self.game.ufos.sprites()) < 2 and self.game.rng.random() < self.game.ufo_spawn_chance:
             # Spawn at top or bottom
-            y = 0 if random.random() > 0.5 else self.game.screen_height
-            x = random.randint(0, self.game.screen_width)
-            ufo = UFO(pygame.Vector2(x, y), self.game.screen_width)
+            y = 0 if self.game.rng.random() > 0.5 else self.game.world_height
+            x = self.game.rng.randint(0, self.game.world_width)
+            ufo = self.game.factories.ufos.create(pygame.Vector2(x, y), self.game.world_width, self.game.rng)
             self.game.ufos.add(ufo)
 
         # Update UFOs
         for ufo in self.game.ufos:
-            ufo.update(dt, self.game.screen_width, self.game.screen_height, self.game.player.position)
-            bullet = ufo.shoot(self.game.player.position)
+            ufo.update(dt, self.game.world_width, self.game.world_height, self.game.player.position)
+            bullet = ufo.shoot(self.game.player.position, now, self.game.factories.bullets.create)
             if bullet:
                 self.game.ufo_bullets.add(bullet)
-        self.game.ufo_bullets.update(dt, self.game.screen_width, self.game.screen_height)
+        self.game.ufo_bullets.update(dt, self.game.world_width, self.game.world_height)
 
-        # Check collisions
-        self.game.collision_manager.check_collisions()
+    def update_asteroids(self, dt: float) -> None:
+        """Move the asteroids; those far from the player only every FAR_UPDATE_INTERVAL ticks.
 
-        # Update particles
-        self.game.explosion_particles.update(dt, self.game.screen_width, self.game.screen_height)
-        self.game.player.thrust_particles.update(dt, self.game.screen_width, self.game.screen_height)
+        A far asteroid banks the time it sits out and catches up in one larger
+        step on its turn. Turns are staggered by group position, so each tick
+        moves about the same share of them. Far means beyond
+        FAR_UPDATE_DISTANCE, out of view and out of bullet range, so the
+        coarse steps are neither seen nor shot at. Fields too small to have
+        far asteroids, and StoredGroups, which move everything in one
+        vectorized pass anyway, update every asteroid each tick.
+        """
+        asteroids = self.game.asteroids
+        width, height = self.game.world_width, self.game.world_height
+        if hasattr(asteroids, 'store') or width * width + height * height <= 4 * FAR_UPDATE_DISTANCE ** 2:
+            asteroids.update(dt, width, height)
+            return
+        px, py = self.game.player.position
+        half_w, half_h = width / 2, height / 2
+        far_squared = FAR_UPDATE_DISTANCE ** 2
+        turn = self.game.sim_clock.ticks
+        for i, asteroid in enumerate(asteroids):
+            if asteroid.far and (turn + i) % FAR_UPDATE_INTERVAL:
+                asteroid.idle_dt += dt
+                continue
+            asteroid.update(dt + asteroid.idle_dt, width, height)
+            asteroid.idle_dt = 0.0
+            position = asteroid.position
+            # Shortest offset across the wrapped edges
+            dx = (position.x - px + half_w) % width - half_w
+            dy = (position.y - py + half_h) % height - half_h
+            asteroid.far = dx * dx + dy * dy > far_squared
 
-        # Check level complete
+    def end_tick(self) -> None:
+        """Start the next level once the field is clear."""
         if not self.game.asteroids and not self.game.game_over:
+            self.game.events.emit(LEVEL_COMPLETE, self.game.level)
             self.game.level += 1
             # Automatic upgrade every 5 levels
             if self.game.level % 5 == 0:
                 self.game.lives += 1
             self.spawn_asteroids()
 
+        recorder = self.game.replay_recorder
+        if recorder:
+            recorder.after_tick(self.game)
+            if self.game.game_over:
+                recorder.finish()
+
+    def _save_previous_positions(self) -> None:
+        """Snapshot positions so the renderer can interpolate into this tick."""
+        for group in (self.game.asteroids, self.game.bullets, self.game.powerups, self.game.ufos, self.game.ufo_bullets):
+            if hasattr(group, 'save_previous_positions'):
+                group.save_previous_positions()
+            else:
+                for entity in group:
+                    entity.save_previous_position()
+        self.game.player.save_previous_position()
+
     def spawn_asteroids(self) -> None:
         num_asteroids = BASE_ASTEROIDS + self.game.level * LEVEL_ASTEROID_INCREASE
         for _ in range(num_asteroids):
-            # Spawn away from player
-            while True:
-                pos = pygame.Vector2(random.randint(0, self.game.screen_width), random.randint(0, self.game.screen_height))
-                if pos.distance_to(self.game.player.position) > ASTEROID_SPAWN_DISTANCE:
-                    break
-            asteroid = Asteroid(pos, 'large')
+            asteroid = self.game.factories.asteroids.create(self.spawn_position(), 'large', self.game.rng)
             # Increase speed with level
             asteroid.velocity *= 1.0 + (self.game.level - 1) * SPEED_INCREASE_PER_LEVEL
             self.game.asteroids.add(asteroid)
 
+    def spawn_position(self) -> pygame.Vector2:
+        """Random point more than ASTEROID_SPAWN_DISTANCE from the player.
+
+        Gives up after ASTEROID_SPAWN_ATTEMPTS tries and returns the farthest
+        point it drew, so a crowded or tiny field cannot stall the spawn.
+        """
+        game = self.game
+        best, best_distance = None, -1.0
+        for _ in range(ASTEROID_SPAWN_ATTEMPTS):
+            pos = pygame.Vector2(game.rng.randint(0, game.world_width), game.rng.randint(0, game.world_height))
+            distance = pos.distance_to(game.player.position)
+            if distance > ASTEROID_SPAWN_DISTANCE:
+                return pos
+            if distance > best_distance:
+                best, best_distance = pos, distance
+        return best
+
+    def score_kills(self, events: list[tuple]) -> None:
+        """Event handler: add the points of this tick's destroyed asteroids or UFOs."""
+        self.game.score += sum(event[2] for event in events)
+
+    def drop_powerups(self, events: list[tuple]) -> None:
+        """Event handler: each asteroid shot this tick may leave a power-up behind."""
+        rng = self.game.rng
+        for x, y, _, shot in events:
+            if shot and rng.random() < POWERUP_SPAWN_CHANCE:
+                powerup_type = rng.choice(POWERUP_TYPES)
+                self.game.powerups.add(self.game.factories.powerups.create(pygame.Vector2(x, y), powerup_type))
+
     def apply_powerup(self, type_: str) -> None:
         self.game.player.powerup_timer = POWERUP_DURATION
         if type_ == 'shield':
@@ -86,17 +185,24 @@ class GameLogic:
         elif type_ == 'multishot':
             self.game.player.multishot = True
 
-    def reset_game(self) -> None:
-        self.game.player = Player(pygame.Vector2(self.game.screen_width // 2, self.game.screen_height // 2))
-        self.game.asteroids.empty()
-        self.game.bullets.empty()
-        self.game.powerups.empty()
-        self.game.ufos.empty()
-        self.game.ufo_bullets.empty()
-        self.game.explosion_particles.empty()
-        self.game.player.thrust_particles.empty()
+    def reset_game(self, seed: Optional[int] = None) -> None:
+        """Start a new run. The same seed and inputs reproduce the run exactly."""
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.game.seed = seed
+        self.game.rng.seed(seed)
+        self.game.particles.rng = np.random.default_rng(seed)
+        self.game.player = Player(pygame.Vector2(self.game.world_width // 2, self.game.world_height // 2), self.game.particles, self.game.rng)
+        factories = self.game.factories
+        for group in (self.game.asteroids, self.game.bullets, self.game.powerups, self.game.ufos, self.game.ufo_bullets):
+            factories.release_group(group)
+        self.game.particles.clear()
+        self.game.events.clear()
         self.game.score = 0
         self.game.lives = self.game.initial_lives
         self.game.level = INITIAL_LEVEL
         self.game.game_over = False
-        self.spawn_asteroids()
\ No newline at end of file
+        self.game.sim_clock.reset()
+        self.spawn_asteroids()
+        if self.game.replay_recorder:
+            self.game.replay_recorder.begin(seed, self.game.difficulty, (self.game.world_width, self.game.world_height))
\ No newline at end of file
@@ -1,35 +1,54 @@
 import pygame
 from abc import ABC, abstractmethod
-from typing import Protocol
+from typing import Optional, Protocol
+from constants import INTERPOLATION_MAX_STEP
 
 
 class Drawable(Protocol):
-    def draw(self, screen: pygame.Surface) -> None: ...
+    __slots__ = ()
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> Optional[pygame.Rect]: ...
 
 
 class Updatable(Protocol):
+    __slots__ = ()
+
     def update(self, dt: float, screen_width: int, screen_height: int) -> None: ...
 
 
-class GameObject(pygame.sprite.Sprite, ABC, Drawable, Updatable):
+class GameObject(ABC, Drawable, Updatable):
     """Base class for all game entities with position, velocity, and collision.
 
-    Provides common functionality for movement, screen wrapping, and sprite management.
+    Provides common functionality for movement, screen wrapping, and interpolation.
     All game objects should inherit from this class and implement update() and draw().
+
+    Attributes live in __slots__, and there is no placeholder image or rect
+    since every entity draws itself. Subclasses list their own attributes in
+    __slots__ too; one that does not simply gets a __dict__ and still works.
+    Entities are kept in EntityGroups rather than pygame sprite groups.
     """
-    """Base class for all game entities with position, velocity, and collision."""
+    __slots__ = ('position', 'previous_position', 'velocity', 'rotation', 'radius', 'active')
 
     def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2 = None) -> None:
-        pygame.sprite.Sprite.__init__(self)
-        self.position: pygame.Vector2 = position
+        # Copy so siblings spawned from one point (splits, multishot) don't share a vector
+        self.position: pygame.Vector2 = pygame.Vector2(position)
+        # Position at the start of the current tick, for render interpolation
+        self.previous_position: pygame.Vector2 = pygame.Vector2(position)
         self.velocity: pygame.Vector2 = velocity or pygame.Vector2(0, 0)
         self.rotation: float = 0.0
         self.radius: float = 0.0  # For collision detection
         self.active: bool = True  # To mark for removal
-        # Set rect for sprite collision
-        self.rect = pygame.Rect(position.x - self.radius, position.y - self.radius, self.radius * 2, self.radius * 2)
-        # Sprite needs image, but we'll draw manually
-        self.image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+
+    def reset(self, position: pygame.Vector2, velocity: pygame.Vector2 = None) -> None:
+        """Reinitialize a released object in place so a pool can hand it out again."""
+        self.position.update(position)
+        self.previous_position.update(position)
+        if velocity is None:
+            self.velocity.update(0, 0)
+        else:
+            self.velocity.update(velocity)
+        self.rotation = 0.0
+        self.active = True
 
     @abstractmethod
     def update(self, dt: float, screen_width: int, screen_height: int) -> None:
@@ -37,10 +56,33 @@ class GameObject(pygame.sprite.Sprite, ABC, Drawable, Updatable):
         pass
 
     @abstractmethod
-    def draw(self, screen: pygame.Surface) -> None:
-        """Render the object to the screen."""
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> Optional[pygame.Rect]:
+        """Render the object to the screen and return the area it touched.
+
+        alpha is how far the frame lies between the previous tick and the
+        current one; see render_position(). offset is added to the world
+        position to get the screen position (see Camera.visible_offsets()).
+        """
         pass
 
+    def save_previous_position(self) -> None:
+        """Remember where the object was before the next simulation tick."""
+        self.previous_position.update(self.position)
+
+    def render_position(self, alpha: float) -> pygame.Vector2:
+        """Position interpolated between the last two ticks.
+
+        Wrap-arounds and respawns move an object much farther than a tick of
+        motion; those jumps are drawn at the current position instead.
+        """
+        position = self.position
+        if alpha >= 1.0:
+            return position
+        previous = self.previous_position
+        if abs(position.x - previous.x) > INTERPOLATION_MAX_STEP or abs(position.y - previous.y) > INTERPOLATION_MAX_STEP:
+            return position
+        return previous.lerp(position, alpha)
+
     def wrap_position(self, screen_width: int, screen_height: int) -> None:
         """Wrap position around screen edges for seamless movement."""
         if self.position.x < 0:
@@ -53,5 +95,63 @@ class GameObject(pygame.sprite.Sprite, ABC, Drawable, Updatable):
         elif self.position.y > screen_height:
             self.position.y = 0
 
-        # Update rect
-        self.rect.center = (self.position.x, self.position.y)
\ No newline at end of file
+
+class EntityGroup:
+    """Ordered set of entities with the parts of pygame's Group API the game uses.
+
+    Members are the keys of one dict, so add, remove and membership tests are
+    O(1) and iteration follows insertion order, like pygame.sprite.Group.
+    Entities do not keep track of their groups. Iterating the group itself
+    yields the members directly; loop over sprites() instead when the loop
+    adds or removes members. Subclasses can hook add_internal() and
+    remove_internal(), as with pygame groups.
+    """
+    __slots__ = ('members',)
+
+    def __init__(self, *entities) -> None:
+        self.members: dict = {}
+        self.add(*entities)
+
+    def add_internal(self, entity) -> None:
+        self.members[entity] = None
+
+    def remove_internal(self, entity) -> None:
+        del self.members[entity]
+
+    def add(self, *entities) -> None:
+        members = self.members
+        for entity in entities:
+            if entity not in members:
+                self.add_internal(entity)
+
+    def remove(self, *entities) -> None:
+        members = self.members
+        for entity in entities:
+            if entity in members:
+                self.remove_internal(entity)
+
+    def has(self, *entities) -> bool:
+        return all(entity in self.members for entity in entities)
+
+    def sprites(self) -> list:
+        return list(self.members)
+
+    def empty(self) -> None:
+        for entity in list(self.members):
+            self.remove_internal(entity)
+
+    def update(self, *args) -> None:
+        for entity in self.members:
+            entity.update(*args)
+
+    def __iter__(self):
+        return iter(self.members)
+
+    def __contains__(self, entity) -> bool:
+        return entity in self.members
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __bool__(self) -> bool:
+        return bool(self.members)
@@ -1,12 +1,17 @@
 import pygame
 import math
 from typing import TYPE_CHECKING
+from background import BackgroundLayer
+from camera import Camera
+from quality import QUALITY
+from text_cache import get_font, render_neon, NEON_GLOW_OFFSET
 from constants import (
-    BLACK, WHITE, NEON_CYAN, NEON_MAGENTA, NEON_YELLOW, NEON_GREEN, NEON_ORANGE,
+    WHITE, NEON_CYAN, NEON_MAGENTA, NEON_YELLOW, NEON_GREEN, NEON_ORANGE,
     UI_TITLE_X, UI_TITLE_Y, UI_START_X, UI_START_Y, UI_HIGHSCORES_X, UI_HIGHSCORES_Y,
     UI_BACK_X, UI_BACK_Y, UI_ENTER_NAME_PROMPT_X, UI_ENTER_NAME_PROMPT_Y, UI_ENTER_NAME_TEXT_Y,
     UI_PAUSE_TITLE_X, UI_PAUSE_TITLE_Y, UI_RESUME_X, UI_RESUME_Y, UI_RESTART_X, UI_RESTART_Y, UI_MENU_X, UI_MENU_Y,
-    UI_SCORE_X, UI_SCORE_Y, UI_LIVES_X, UI_LIVES_Y, UI_LEVEL_X, UI_LEVEL_Y
+    UI_SCORE_X, UI_SCORE_Y, UI_LIVES_X, UI_LIVES_Y, UI_LEVEL_X, UI_LEVEL_Y, HUD_HEIGHT,
+    DIRTY_RECT_MAX_COVERAGE, CAMERA_CULL_MARGIN
 )
 
 if TYPE_CHECKING:
@@ -15,54 +20,65 @@ if TYPE_CHECKING:
 class GameRenderer:
     def __init__(self, game: 'Game') -> None:
         self.game = game
-        self.stars = self._generate_stars()
-        # Initialize custom fonts
-        self.font_large = pygame.font.SysFont("consolas", 80, bold=True)
-        self.font_medium = pygame.font.SysFont("consolas", 40, bold=True)
-        self.font_small = pygame.font.SysFont("consolas", 24)
-
-    def _generate_stars(self) -> list[tuple[int, int, int, int]]:
-        """Generate a static starfield."""
-        import random
-        stars = []
-        for _ in range(100):
-            x = random.randint(0, self.game.screen_width)
-            y = random.randint(0, self.game.screen_height)
-            size = random.randint(1, 2)
-            brightness = random.randint(100, 255)
-            stars.append((x, y, size, brightness))
-        return stars
-
-    def draw_text_neon(self, text: str, font: pygame.font.Font, color: tuple, pos: tuple, center: bool = False, pulse: bool = False) -> None:
-        """Draw text with a neon glow effect."""
+        self.background = BackgroundLayer(self.game.screen_width, self.game.screen_height)
+        self.hud_chrome = None
+        self.camera = Camera(self.game.screen_width, self.game.screen_height, self.game.world_width, self.game.world_height)
+        # Entities drawn and culled in the last frame, counting each ghost copy as a draw
+        self.entities_drawn = 0
+        self.entities_culled = 0
+        # Screen areas drawn this frame and last frame, for dirty-rect updates.
+        # None means the next frame must be presented with a full flip.
+        self.frame_rects: list[pygame.Rect] = []
+        self.previous_rects: list[pygame.Rect] | None = None
+
+    def _font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        """The UI font, or pygame's built-in one until the system font scan is done."""
+        assets = self.game.assets
+        if assets is None or assets.finished('fonts'):
+            return get_font("consolas", size, bold=bold)
+        return get_font(None, size)
+
+    @property
+    def font_large(self) -> pygame.font.Font:
+        return self._font(80, bold=True)
+
+    @property
+    def font_medium(self) -> pygame.font.Font:
+        return self._font(40, bold=True)
+
+    @property
+    def font_small(self) -> pygame.font.Font:
+        return self._font(24)
+
+    def _build_hud_chrome(self, width: int) -> pygame.Surface:
+        """Pre-render the translucent HUD bar and its separator line."""
+        chrome = pygame.Surface((width, HUD_HEIGHT + 2), pygame.SRCALPHA)
+        chrome.fill((0, 0, 10, 200), (0, 0, width, HUD_HEIGHT))  # Dark transparent blue
+        pygame.draw.line(chrome, NEON_CYAN, (0, HUD_HEIGHT), (width, HUD_HEIGHT), 2)
+        if pygame.display.get_surface() is not None:
+            chrome = chrome.convert_alpha()
+        return chrome
+
+    def draw_text_neon(self, text: str, font: pygame.font.Font, color: tuple, pos: tuple, center: bool = False, pulse: bool = False) -> pygame.Rect:
+        """Draw text with a neon glow effect from the shared text cache."""
         # Calculate alpha for pulse
         alpha = 255
-        if pulse:
+        if pulse and QUALITY.tier.pulse:
             current_time = pygame.time.get_ticks()
             alpha = int(abs(math.sin(current_time / 500.0)) * 255)
             if alpha < 50: alpha = 50 # Minimum visibility
 
-        # Render Glow
-        glow_surf = font.render(text, True, color)
-        if pulse:
-            glow_surf.set_alpha(alpha)
-        
-        # Determine position
-        rect = glow_surf.get_rect()
+        surf = render_neon(text, font, color)
+        rect = surf.get_rect()
         if center:
             rect.center = pos
         else:
-            rect.topleft = pos
+            # pos is the corner of the text itself, inside the glow padding
+            rect.topleft = (pos[0] - NEON_GLOW_OFFSET, pos[1] - NEON_GLOW_OFFSET)
 
-        # Draw slight offsets for thickness/glow
-        for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2)]:
-            self.game.screen.blit(glow_surf, (rect.x + dx, rect.y + dy))
-
-        # Core (White)
-        core_surf = font.render(text, True, WHITE)
-        if pulse:
-            core_surf.set_alpha(alpha)
-        self.game.screen.blit(core_surf, rect)
+        # Pulse fades the cached composite instead of re-rendering it
+        surf.set_alpha(alpha)
+        return self.game.screen.blit(surf, rect)
 
     def draw_lives_icons(self, x: int, y: int, lives: int) -> None:
         """Draw miniature player ships to represent lives."""
@@ -78,16 +94,12 @@ class GameRenderer:
             ]
             pygame.draw.polygon(self.game.screen, NEON_CYAN, points, 2)
 
-    def draw_hud(self) -> None:
-        """Draw the in-game Heads-Up Display."""
-        # HUD Background Bar (Semi-transparent)
-        hud_height = 40
-        bar = pygame.Surface((self.game.screen_width, hud_height), pygame.SRCALPHA)
-        bar.fill((0, 0, 10, 200)) # Dark transparent blue
-        self.game.screen.blit(bar, (0, 0))
-        
-        # Neon Line Separator
-        pygame.draw.line(self.game.screen, NEON_CYAN, (0, hud_height), (self.game.screen_width, hud_height), 2)
+    def draw_hud(self) -> pygame.Rect:
+        """Draw the in-game Heads-Up Display and return the area it covers."""
+        # HUD background bar and neon separator, baked once per screen width
+        if self.hud_chrome is None or self.hud_chrome.get_width() != self.game.screen.get_width():
+            self.hud_chrome = self._build_hud_chrome(self.game.screen.get_width())
+        hud_rect = self.game.screen.blit(self.hud_chrome, (0, 0))
 
         # Score (Left)
         score_str = f"SCORE: {self.game.score:05d}" # Zero padded
@@ -100,38 +112,90 @@ class GameRenderer:
         # Lives (Right) - Use Icons
         # self.draw_text_neon(f"LIVES", self.font_small, NEON_MAGENTA, (self.game.screen_width - 150, 10))
         self.draw_lives_icons(self.game.screen_width - 100, 25, self.game.lives)
+        return hud_rect
 
     def draw(self, screen: pygame.Surface) -> None:
-        self.game.screen.fill(BLACK)
-        
-        # Draw Stars
-        for x, y, size, brightness in self.stars:
-            s = pygame.Surface((size, size))
-            s.fill((brightness, brightness, brightness))
-            s.set_alpha(brightness)
-            self.game.screen.blit(s, (x, y))
+        profiler = self.game.profiler
+        # Only the playing state redraws the same layout every frame; menus and
+        # overlays always take the full-frame path.
+        dirty_mode = self.game.use_dirty_rects and self.game.state_name == 'playing'
+        camera = self.camera
+        if camera.scrolls and self.background.parallax:
+            dirty_mode = False  # Scrolled parallax layers change the whole background
+        with profiler.span('render.background'):
+            if not dirty_mode or self.previous_rects is None or screen.get_size() != self.background.size:
+                self.previous_rects = None
+                self.background.draw(self.game.screen, camera.offset)
+            else:
+                # Erase last frame's sprites by restoring the background under them
+                for rect in self.previous_rects:
+                    self.background.restore(self.game.screen, rect, camera.offset)
+
+        self.frame_rects = []
+        with profiler.span('render.state'):
+            self.game.current_state.draw(screen)
+        if profiler.overlay_visible:
+            self.frame_rects.append(profiler.draw_overlay(screen, self.quality_status()))
+
+        with profiler.span('render.flip'):
+            if not dirty_mode:
+                self.game.dirty_rects = []
+                pygame.display.flip()
+                return
+            self._present_dirty()
+
+    def quality_status(self) -> str:
+        """One-line summary of the render quality governor for the profiler overlay."""
+        mode = "pinned" if QUALITY.pinned else f"load {QUALITY.load:.0%}"
+        return f"quality {QUALITY.tier.name} ({QUALITY.level + 1}/{len(QUALITY.tiers)})  {mode}"
 
-        self.game.current_state.draw(screen)
-        pygame.display.flip()
+    def _present_dirty(self) -> None:
+        """Push last and current sprite areas, or flip when that is cheaper."""
+        if self.previous_rects is None:
+            dirty = None
+        else:
+            dirty = self.previous_rects + self.frame_rects
+            screen_area = self.game.screen.get_width() * self.game.screen.get_height()
+            if sum(rect.w * rect.h for rect in dirty) > screen_area * DIRTY_RECT_MAX_COVERAGE:
+                dirty = None
+
+        if dirty is None:
+            self.game.dirty_rects = []
+            pygame.display.flip()
+        else:
+            self.game.dirty_rects = dirty
+            pygame.display.update(dirty)
+        self.previous_rects = self.frame_rects
 
     def draw_game(self) -> None:
-        # Draw all game entities in correct order (player last for layering)
-        for asteroid in self.game.asteroids:
-            asteroid.draw(self.game.screen)
-        for bullet in self.game.bullets:
-            bullet.draw(self.game.screen)
-        for powerup in self.game.powerups:
-            powerup.draw(self.game.screen)
-        for ufo in self.game.ufos:
-            ufo.draw(self.game.screen)
-        for ufo_bullet in self.game.ufo_bullets:
-            ufo_bullet.draw(self.game.screen)
-        for particle in self.game.explosion_particles:
-            particle.draw(self.game.screen)
-        self.game.player.draw(self.game.screen)  # Player on top
+        screen = self.game.screen
+        rects = self.frame_rects
+        alpha = self.game.render_alpha
+        profiler = self.game.profiler
+        camera = self.camera
+        player = self.game.player
+        camera.follow(player.render_position(alpha))
+        drawn = culled = 0
+        # Draw the entities in view, in correct order (player last for layering)
+        with profiler.span('render.entities'):
+            for group in (self.game.asteroids, self.game.bullets, self.game.powerups, self.game.ufos, self.game.ufo_bullets):
+                for entity in group:
+                    offsets = camera.visible_offsets(entity.position, entity.radius + CAMERA_CULL_MARGIN)
+                    if not offsets:
+                        culled += 1
+                        continue
+                    for offset in offsets:
+                        rects.append(entity.draw(screen, alpha, offset))
+                    drawn += len(offsets)
+        self.entities_drawn, self.entities_culled = drawn, culled
+        with profiler.span('render.particles'):
+            rects.extend(self.game.particles.draw(screen, alpha, camera))
+        for offset in camera.visible_offsets(player.position, player.radius + CAMERA_CULL_MARGIN):
+            rects.append(player.draw(screen, alpha, offset))  # Player on top
 
         # UI / HUD
-        self.draw_hud()
+        with profiler.span('render.hud'):
+            rects.append(self.draw_hud())
 
     def draw_pause_overlay(self) -> None:
         # Semi-transparent overlay
@@ -168,13 +232,17 @@ class GameRenderer:
 
     def draw_highscores(self) -> None:
         center_x = self.game.screen_width // 2
-        self.draw_text_neon("TOP PILOTS", self.font_medium, NEON_YELLOW, (center_x, 50), center=True)
+        title = f"TOP PILOTS - {self.game.difficulty.upper()}" if self.game.leaderboard else "TOP PILOTS"
+        self.draw_text_neon(title, self.font_medium, NEON_YELLOW, (center_x, 50), center=True)
         
         scores = self.game.get_highscores()
         for i, entry in enumerate(scores):
             color = NEON_CYAN if i == 0 else WHITE
             text = f"{i+1}. {entry['name']} ... {entry['score']}"
             self.draw_text_neon(text, self.font_small, color, (center_x, 120 + i * 40), center=True)
+
+        if self.game.last_rank:
+            self.draw_text_neon(f"YOUR RANK: #{self.game.last_rank}", self.font_small, NEON_GREEN, (center_x, self.game.screen_height - 85), center=True)
             
         self.draw_text_neon("BACK [ESC]", self.font_small, NEON_ORANGE, (center_x, self.game.screen_height - 50), center=True)
 
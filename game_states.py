@@ -25,8 +25,8 @@ class MenuState(GameState):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_RETURN:
-                    self.game.change_state('playing')
                     self.game.logic.reset_game()
+                    self.game.change_state('playing')
                 elif event.key == pygame.K_h:
                     self.game.change_state('highscores')
                 elif event.key == pygame.K_ESCAPE:
@@ -37,6 +37,11 @@ class MenuState(GameState):
         self.game.renderer.draw_menu()
 
 class PlayingState(GameState):
+    def enter(self):
+        # Windowed games skip the first level at startup; build it on first use
+        if self.game.player is None:
+            self.game.logic.reset_game(self.game.seed)
+
     def update(self, dt):
         # Update is handled in Game.run
         pass
@@ -56,10 +61,13 @@ class GameOverState(GameState):
 
     def draw(self, screen):
         self.game.renderer.draw_game()  # Draw game elements first
-        game_over_text = self.game.font.render("GAME OVER - Press R to restart, M for menu", True, RED)
+        game_over_text = self.game._get_cached_text("GAME OVER - Press R to restart, M for menu", RED)
         screen.blit(game_over_text, (self.game.screen_width // 2 - 200, self.game.screen_height // 2))
 
 class HighscoresState(GameState):
+    def enter(self):
+        self.game.refresh_highscores()
+
     def handle_input(self, events, keys):
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -0,0 +1,83 @@
+"""Headless simulation entry point for automated playtests and load tests.
+
+Runs GameLogic without a window, audio or fonts, driven by an injected input
+source and the simulation clock, as fast as the CPU allows:
+
+    from headless import run_headless
+    state = run_headless(ticks=3600)
+
+or from the command line:
+
+    python headless.py --ticks 3600 --difficulty hard
+    python headless.py --ticks 600 --trace trace.json
+    python headless.py --ticks 3600 --world 4000x3000
+"""
+import argparse
+import json
+import time
+from typing import Optional
+from constants import TICK_RATE
+from game import Game
+from camera import world_size_arg
+from input_source import InputSource, NullInput
+
+
+def create_headless_game(input_source: Optional[InputSource] = None, difficulty: str = 'normal',
+                         seed: Optional[int] = None, world_size: Optional[tuple[int, int]] = None) -> Game:
+    """Build a windowless Game at the start of a fresh run in the playing state."""
+    game = Game(headless=True, input_source=input_source or NullInput(), seed=seed, world_size=world_size)
+    game.difficulty = difficulty
+    game.apply_difficulty()
+    game.logic.reset_game(game.seed)
+    game.change_state('playing')
+    return game
+
+
+def step(game: Game, ticks: int, dt: float = 1.0 / TICK_RATE) -> dict:
+    """Advance the simulation up to `ticks` fixed steps, stopping at game over."""
+    for _ in range(ticks):
+        if game.game_over:
+            break
+        game.update(dt)
+    return game.snapshot()
+
+
+def run_headless(ticks: int, input_source: Optional[InputSource] = None,
+                 difficulty: str = 'normal', seed: Optional[int] = None,
+                 dt: float = 1.0 / TICK_RATE, world_size: Optional[tuple[int, int]] = None) -> dict:
+    """Play one game for up to `ticks` steps and return its final state."""
+    game = create_headless_game(input_source, difficulty, seed, world_size)
+    return step(game, ticks, dt)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the Asteroids simulation without a window.")
+    parser.add_argument('--ticks', type=int, default=TICK_RATE * 60, help="number of simulation steps")
+    parser.add_argument('--difficulty', choices=['easy', 'normal', 'hard'], default='normal')
+    parser.add_argument('--seed', type=int, default=None, help="RNG seed; the same seed replays the same game")
+    parser.add_argument('--trace', help="profile every tick and write a Chrome trace to this file")
+    parser.add_argument('--world', type=world_size_arg, help="play field size as WIDTHxHEIGHT (default: the screen)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.trace:
+        game = create_headless_game(difficulty=args.difficulty, seed=args.seed, world_size=args.world)
+        game.profiler.set_enabled(True)
+        for _ in range(args.ticks):
+            if game.game_over:
+                break
+            game.profiler.begin_frame()
+            game.update(1.0 / TICK_RATE)
+            game.profiler.end_frame()
+        state = game.snapshot()
+    else:
+        state = run_headless(args.ticks, difficulty=args.difficulty, seed=args.seed, world_size=args.world)
+    elapsed = time.perf_counter() - start
+    if args.trace:
+        game.profiler.export_chrome_trace(args.trace)
+    state['ticks_per_second'] = state['tick'] / elapsed if elapsed > 0 else 0.0
+    print(json.dumps(state, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,197 @@
 import json
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
 
 HIGHSCORES_FILE = 'highscores.json'
+HIGHSCORES_LIMIT = 10
 
-def load_highscores():
-    if os.path.exists(HIGHSCORES_FILE):
-        with open(HIGHSCORES_FILE, 'r') as f:
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive advisory lock on path + '.lock', shared by every game process."""
+    with open(path + '.lock', 'a+') as lock:
+        if fcntl:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        elif msvcrt:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            elif msvcrt:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read(path: str) -> list[dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
-    return []
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError as e:
+        print(f"Warning: Could not parse highscores in {path}: {e}")
+        return []
+
+
+def _write_atomic(path: str, scores: list[dict]) -> None:
+    """Write to a temp file next to path and rename it over path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix='.highscores-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(scores, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class HighscoreStore:
+    """High-score table held in memory with write-behind persistence.
+
+    The file is read once, and is_highscore() compares against a cached
+    cutoff, so it is safe to call every frame. New entries go into the table
+    immediately. A background thread then merges them into the file under an
+    exclusive lock, re-reading it first, and replaces it atomically. Several
+    game processes can therefore add scores to one file without losing each
+    other's entries.
+    """
+    def __init__(self, path: str = HIGHSCORES_FILE, limit: int = HIGHSCORES_LIMIT) -> None:
+        self.path = path
+        self.limit = limit
+        self._cond = threading.Condition()
+        self._unsaved: list[dict] = []
+        self._writing = False
+        self._closing = False
+        self._writer: Optional[threading.Thread] = None
+        self._mtime = None
+        self._set_scores(self._top(_read(path)))
+        self._mtime = self._stat()
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _top(self, scores: list[dict]) -> list[dict]:
+        return sorted(scores, key=lambda x: x['score'], reverse=True)[:self.limit]
+
+    def _set_scores(self, scores: list[dict]) -> None:
+        self.scores = scores
+        self._cutoff = scores[-1]['score'] if len(scores) >= self.limit else None
+
+    def get_highscores(self) -> list[dict]:
+        return self.scores
+
+    def is_highscore(self, score: int) -> bool:
+        return self._cutoff is None or score > self._cutoff
+
+    def add_highscore(self, name: str, score: int) -> list[dict]:
+        entry = {'name': name, 'score': score}
+        with self._cond:
+            self._unsaved.append(entry)
+            self._set_scores(self._top(self.scores + [entry]))
+            if self._writer is None:
+                self._closing = False
+                self._writer = threading.Thread(target=self._write_loop, name='highscore-writer', daemon=True)
+                self._writer.start()
+            self._cond.notify()
+        return self.scores
+
+    def refresh(self) -> None:
+        """Pick up scores other processes saved since the file was last read."""
+        with self._cond:
+            # With a save in flight the writer refreshes the table when it is done
+            if self._unsaved or self._writing:
+                return
+            mtime = self._stat()
+            if mtime == self._mtime:
+                return
+            self._set_scores(self._top(_read(self.path)))
+            self._mtime = mtime
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._unsaved or self._closing)
+                if not self._unsaved:
+                    return
+                batch, self._unsaved = self._unsaved, []
+                self._writing = True
+            saved = None
+            try:
+                with _file_lock(self.path):
+                    merged = self._top(_read(self.path) + batch)
+                    _write_atomic(self.path, merged)
+                    mtime = self._stat()
+                saved = merged
+            except OSError as e:
+                print(f"Warning: Could not save highscores to {self.path}: {e}")
+            with self._cond:
+                self._writing = False
+                if saved is not None:
+                    self._mtime = mtime
+                    self._set_scores(self._top(saved + self._unsaved))
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every added score is on disk; False if timeout passed first."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._unsaved and not self._writing, timeout)
+
+    def close(self) -> None:
+        """Flush pending saves and stop the writer thread."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+
+_default_store: Optional[HighscoreStore] = None
+
+
+def _store() -> HighscoreStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = HighscoreStore()
+    return _default_store
+
+
+def load_highscores():
+    return _read(HIGHSCORES_FILE)
 
 def save_highscores(scores):
-    with open(HIGHSCORES_FILE, 'w') as f:
-        json.dump(scores, f, indent=2)
+    with _file_lock(HIGHSCORES_FILE):
+        _write_atomic(HIGHSCORES_FILE, scores)
 
 def add_highscore(name, score):
-    scores = load_highscores()
-    scores.append({'name': name, 'score': score})
-    scores.sort(key=lambda x: x['score'], reverse=True)
-    scores = scores[:10]  # Keep top 10
-    save_highscores(scores)
-    return scores
+    return _store().add_highscore(name, score)
 
 def get_highscores():
-    return load_highscores()
+    return _store().get_highscores()
 
 def is_highscore(score):
-    scores = get_highscores()
-    if len(scores) < 10:
-        return True
-    return score > scores[-1]['score']
\ No newline at end of file
+    return _store().is_highscore(score)
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Callable, Protocol
+import pygame
+
+
+@dataclass(frozen=True)
+class Controls:
+    """Player intent for one simulation tick, independent of the input device."""
+    rotate_left: bool = False
+    rotate_right: bool = False
+    thrust: bool = False
+    shoot: bool = False
+
+    # Bit layout used by replays and other compact encodings
+    ROTATE_LEFT = 1
+    ROTATE_RIGHT = 2
+    THRUST = 4
+    SHOOT = 8
+
+    def to_mask(self) -> int:
+        return (
+            (self.ROTATE_LEFT if self.rotate_left else 0)
+            | (self.ROTATE_RIGHT if self.rotate_right else 0)
+            | (self.THRUST if self.thrust else 0)
+            | (self.SHOOT if self.shoot else 0)
+        )
+
+    @classmethod
+    def from_mask(cls, mask: int) -> 'Controls':
+        return cls(
+            rotate_left=bool(mask & cls.ROTATE_LEFT),
+            rotate_right=bool(mask & cls.ROTATE_RIGHT),
+            thrust=bool(mask & cls.THRUST),
+            shoot=bool(mask & cls.SHOOT),
+        )
+
+
+NO_CONTROLS = Controls()
+
+
+class InputSource(Protocol):
+    def poll(self) -> Controls: ...
+
+
+class KeyboardInput:
+    """Reads the live keyboard state (arrow keys / WASD and space)."""
+    def poll(self) -> Controls:
+        keys = pygame.key.get_pressed()
+        return Controls(
+            rotate_left=keys[pygame.K_LEFT] or keys[pygame.K_a],
+            rotate_right=keys[pygame.K_RIGHT] or keys[pygame.K_d],
+            thrust=keys[pygame.K_UP] or keys[pygame.K_w],
+            shoot=keys[pygame.K_SPACE],
+        )
+
+
+class ScriptedInput:
+    """Produces controls from a function of the tick number, for playtests and bots."""
+    def __init__(self, script: Callable[[int], Controls]) -> None:
+        self.script = script
+        self.tick = 0
+
+    def poll(self) -> Controls:
+        controls = self.script(self.tick)
+        self.tick += 1
+        return controls
+
+
+class NullInput:
+    """Never presses anything."""
+    def poll(self) -> Controls:
+        return NO_CONTROLS
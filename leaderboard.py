@@ -0,0 +1,258 @@
+"""SQLite leaderboard with a board per difficulty and rank lookups.
+
+Every finished run is kept in one table, with an index on
+(difficulty, score DESC, id). The top-N and next-page queries therefore read
+only the rows they return. An insert trigger keeps run counts per block of
+LEADERBOARD_RANK_BUCKET points. A rank lookup sums the blocks above the score
+and counts only the runs inside its own block, so it does not have to walk
+every better run.
+
+Inserts are buffered and written in batches, one transaction per batch. The
+database runs in WAL mode, so several game processes can share it while
+readers keep going during writes.
+
+    python leaderboard.py import highscores.json --difficulty normal
+    python leaderboard.py top --difficulty hard --limit 20 --page 2
+    python leaderboard.py rank 5000 --difficulty normal
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+from typing import Iterable, Optional
+from constants import (
+    LEADERBOARD_DB, LEADERBOARD_BATCH_SIZE, LEADERBOARD_PAGE_SIZE, LEADERBOARD_RANK_BUCKET, DIFFICULTIES
+)
+
+SCHEMA_VERSION = 1
+
+_SETTINGS = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    difficulty TEXT NOT NULL,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER,
+    seed INTEGER,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_board_score ON runs (difficulty, score DESC, id);
+CREATE TABLE IF NOT EXISTS score_buckets (
+    difficulty TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, bucket)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS runs_count_bucket AFTER INSERT ON runs BEGIN
+    INSERT INTO score_buckets (difficulty, bucket, runs)
+    VALUES (NEW.difficulty, NEW.score / {bucket}, 1)
+    ON CONFLICT (difficulty, bucket) DO UPDATE SET runs = runs + 1;
+END;
+CREATE TABLE IF NOT EXISTS imports (
+    source TEXT PRIMARY KEY,
+    imported_at REAL NOT NULL,
+    rows INTEGER NOT NULL
+);
+"""
+
+
+class Leaderboard:
+    """Persistent per-difficulty leaderboard backed by sqlite3.
+
+    add_run() only buffers a run. Buffered runs are written once
+    LEADERBOARD_BATCH_SIZE of them have piled up, before any query, and on
+    flush() or close(). A query therefore always sees the caller's own runs.
+    Each board's top page and its high-score cutoff are cached until the next
+    write or refresh().
+    """
+    def __init__(self, path: str = LEADERBOARD_DB, batch_size: int = LEADERBOARD_BATCH_SIZE) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path, timeout=10.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints; WAL keeps the file consistent
+        with self.conn:
+            self.conn.executescript(_SETTINGS)
+            # The bucket size is baked into the trigger, so a database keeps the one it was created with
+            self.conn.execute(
+                "INSERT OR IGNORE INTO settings (key, value) VALUES ('rank_bucket', ?)", (LEADERBOARD_RANK_BUCKET,)
+            )
+            (self.rank_bucket,) = self.conn.execute("SELECT value FROM settings WHERE key = 'rank_bucket'").fetchone()
+            self.conn.executescript(_SCHEMA.format(bucket=int(self.rank_bucket)))
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._pending: list[tuple] = []
+        self._top_cache: dict[tuple[str, int], list[dict]] = {}
+
+    def add_run(self, name: str, score: int, difficulty: str = 'normal',
+                level: Optional[int] = None, seed: Optional[int] = None,
+                played_at: Optional[float] = None) -> None:
+        self._pending.append((difficulty, name, int(score), level, seed, played_at or time.time()))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def add_runs(self, runs: Iterable[dict]) -> None:
+        """Buffer many runs, given as dicts with add_run's keyword arguments."""
+        for run in runs:
+            self.add_run(**run)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO runs (difficulty, name, score, level, seed, played_at) VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._pending.clear()
+        self._top_cache.clear()
+
+    def refresh(self) -> None:
+        """Drop cached pages so runs saved by other processes show up."""
+        self._top_cache.clear()
+
+    def top(self, difficulty: str = 'normal', limit: int = LEADERBOARD_PAGE_SIZE, offset: int = 0) -> list[dict]:
+        """One page of a board, best first. Pages past the first should use after()."""
+        key = (difficulty, limit)
+        if offset == 0 and key in self._top_cache:
+            return self._top_cache[key]
+        self.flush()
+        rows = self.conn.execute(
+            "SELECT id, name, score, level, played_at FROM runs WHERE difficulty = ? "
+            "ORDER BY score DESC, id LIMIT ? OFFSET ?",
+            (difficulty, limit, offset),
+        ).fetchall()
+        page = [self._entry(row, offset + i + 1) for i, row in enumerate(rows)]
+        if offset == 0:
+            self._top_cache[key] = page
+        return page
+
+    def after(self, difficulty: str, last: dict, limit: int = LEADERBOARD_PAGE_SIZE) -> list[dict]:
+        """The page following `last`, the final entry of the previous page.
+
+        Seeks straight to the position in the index, so deep pages cost the
+        same as the first one, unlike top() with a large offset.
+        """
+        self.flush()
+        # Two range scans; a single OR condition would stop SQLite seeking the index
+        rows = self.conn.execute(
+            "SELECT id, name, score, level, played_at FROM runs WHERE difficulty = ? "
+            "AND score = ? AND id > ? ORDER BY id LIMIT ?",
+            (difficulty, last['score'], last['id'], limit),
+        ).fetchall()
+        if len(rows) < limit:
+            rows += self.conn.execute(
+                "SELECT id, name, score, level, played_at FROM runs WHERE difficulty = ? "
+                "AND score < ? ORDER BY score DESC, id LIMIT ?",
+                (difficulty, last['score'], limit - len(rows)),
+            ).fetchall()
+        return [self._entry(row, last['rank'] + i + 1) for i, row in enumerate(rows)]
+
+    @staticmethod
+    def _entry(row: tuple, rank: int) -> dict:
+        run_id, name, score, level, played_at = row
+        return {'id': run_id, 'rank': rank, 'name': name, 'score': score, 'level': level, 'played_at': played_at}
+
+    def rank(self, score: int, difficulty: str = 'normal') -> int:
+        """Position a score would take on a board; ties share the better rank."""
+        self.flush()
+        bucket = score // self.rank_bucket
+        (in_higher_buckets,) = self.conn.execute(
+            "SELECT COALESCE(SUM(runs), 0) FROM score_buckets WHERE difficulty = ? AND bucket > ?",
+            (difficulty, bucket),
+        ).fetchone()
+        (in_same_bucket,) = self.conn.execute(
+            "SELECT COUNT(*) FROM runs WHERE difficulty = ? AND score > ? AND score < ?",
+            (difficulty, score, (bucket + 1) * self.rank_bucket),
+        ).fetchone()
+        return in_higher_buckets + in_same_bucket + 1
+
+    def count(self, difficulty: Optional[str] = None) -> int:
+        self.flush()
+        if difficulty is None:
+            return self.conn.execute("SELECT COALESCE(SUM(runs), 0) FROM score_buckets").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COALESCE(SUM(runs), 0) FROM score_buckets WHERE difficulty = ?", (difficulty,)
+        ).fetchone()[0]
+
+    def is_highscore(self, score: int, difficulty: str = 'normal', board_size: int = LEADERBOARD_PAGE_SIZE) -> bool:
+        """Whether score would make the visible top board_size, from the cached page."""
+        page = self.top(difficulty, board_size)
+        return len(page) < board_size or score > page[-1]['score']
+
+    def import_json(self, path: str, difficulty: str = 'normal') -> int:
+        """Load a legacy highscores.json once; later calls for the same file do nothing."""
+        source = os.path.abspath(path)
+        if self.conn.execute("SELECT 1 FROM imports WHERE source = ?", (source,)).fetchone():
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not import highscores from {path}: {e}")
+            return 0
+        played_at = os.path.getmtime(path)
+        self.flush()
+        with self.conn:
+            # Claim the source first, under the write lock, so a process importing the same file at the same
+            # time finds the claim and writes nothing
+            self.conn.execute("BEGIN IMMEDIATE")
+            claimed = self.conn.execute(
+                "INSERT OR IGNORE INTO imports (source, imported_at, rows) VALUES (?, ?, ?)",
+                (source, time.time(), len(entries)),
+            ).rowcount
+            if not claimed:
+                return 0
+            self.conn.executemany(
+                "INSERT INTO runs (difficulty, name, score, level, seed, played_at) VALUES (?, ?, ?, NULL, NULL, ?)",
+                [(difficulty, entry['name'], int(entry['score']), played_at) for entry in entries],
+            )
+        self._top_cache.clear()
+        return len(entries)
+
+    def close(self) -> None:
+        self.flush()
+        self.conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query or fill the Asteroids leaderboard.")
+    parser.add_argument('--db', default=LEADERBOARD_DB, help="leaderboard database file")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_cmd = commands.add_parser('import', help="import a legacy highscores.json")
+    import_cmd.add_argument('path')
+    import_cmd.add_argument('--difficulty', choices=DIFFICULTIES, default='normal')
+
+    top_cmd = commands.add_parser('top', help="print one page of a board")
+    top_cmd.add_argument('--difficulty', choices=DIFFICULTIES, default='normal')
+    top_cmd.add_argument('--limit', type=int, default=LEADERBOARD_PAGE_SIZE)
+    top_cmd.add_argument('--page', type=int, default=1)
+
+    rank_cmd = commands.add_parser('rank', help="print the rank a score would take")
+    rank_cmd.add_argument('score', type=int)
+    rank_cmd.add_argument('--difficulty', choices=DIFFICULTIES, default='normal')
+
+    args = parser.parse_args()
+    board = Leaderboard(args.db)
+    try:
+        if args.command == 'import':
+            print(f"Imported {board.import_json(args.path, args.difficulty)} runs")
+        elif args.command == 'top':
+            for entry in board.top(args.difficulty, args.limit, (args.page - 1) * args.limit):
+                print(f"{entry['rank']:>6}. {entry['name']:<8} {entry['score']}")
+        elif args.command == 'rank':
+            print(f"#{board.rank(args.score, args.difficulty)} of {board.count(args.difficulty)}")
+    finally:
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,20 @@
+import argparse
+import time
+
+_started = time.perf_counter()
 from game import Game
+from camera import world_size_arg
+from quality import QUALITY, TIER_NAMES
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Play Asteroids.")
+    parser.add_argument('--startup-report', action='store_true', help="print how long each startup step took")
+    parser.add_argument('--world', type=world_size_arg, help="play field size as WIDTHxHEIGHT; larger than the screen scrolls")
+    parser.add_argument('--quality', choices=('auto',) + TIER_NAMES, default='auto',
+                        help="render quality tier; auto steps between them to hold FPS")
+    args = parser.parse_args()
+    QUALITY.pin(None if args.quality == 'auto' else args.quality)
+    game = Game(world_size=args.world)
+    game.startup.include_imports(_started)
+    game.report_startup = args.startup_report
     game.run()
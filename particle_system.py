@@ -0,0 +1,151 @@
+import math
+import numpy as np
+import pygame
+from constants import (
+    PARTICLE_LIFETIME, PARTICLE_SPEED, PARTICLE_COLORS, PARTICLE_SIZE,
+    PARTICLE_CAPACITY, PARTICLE_ALPHA_LEVELS, PARTICLE_COUNT_EXPLODE
+)
+
+
+class ParticleSystem:
+    """Packed-array emitter for explosion and thrust particles.
+
+    Live particles occupy the first `count` rows of the arrays, so aging,
+    movement and expiry are a handful of vectorized operations regardless of
+    how many bursts are in flight. Drawing blits from a small table of
+    pre-rendered alpha stamps (one per color and fade level) instead of
+    allocating a surface per particle. The total number of particles is capped,
+    which keeps the cost of a frame flat when many explosions overlap.
+    density, set from the render quality tier, thins out bursts and exhaust.
+    """
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, rng: np.random.Generator = None) -> None:
+        self.capacity = capacity
+        self.rng = rng or np.random.default_rng()
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.lifetime = np.zeros(capacity)
+        self.color_index = np.zeros(capacity, dtype=np.intp)
+        self.last_dt = 0.0
+        self.density = 1.0  # Share of requested particles actually spawned
+        self._stamps: list[list[pygame.Surface]] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _reserve(self, amount: int) -> slice:
+        """Claim up to `amount` rows at the end of the live range."""
+        start = self.count
+        end = min(self.capacity, start + amount)
+        self.count = end
+        return slice(start, end)
+
+    def emit_burst(self, position: pygame.Vector2, amount: int) -> None:
+        """Spawn an explosion: random directions and speeds around position."""
+        self._burst(position.x, position.y, amount)
+
+    def emit_explosions(self, events: list[tuple]) -> None:
+        """Event handler: a burst for each destroyed asteroid or UFO, skipping shield rams."""
+        for event in events:
+            if len(event) < 4 or event[3]:
+                self._burst(event[0], event[1], PARTICLE_COUNT_EXPLODE)
+
+    def _burst(self, x: float, y: float, amount: int) -> None:
+        rows = self._reserve(math.ceil(amount * self.density))
+        n = rows.stop - rows.start
+        if n <= 0:
+            return
+        angles = self.rng.uniform(0, 2 * math.pi, n)
+        speeds = self.rng.uniform(50, PARTICLE_SPEED, n)
+        self.position[rows] = (x, y)
+        self.velocity[rows, 0] = np.cos(angles) * speeds
+        self.velocity[rows, 1] = np.sin(angles) * speeds
+        self.lifetime[rows] = PARTICLE_LIFETIME
+        self.color_index[rows] = self.rng.integers(0, len(PARTICLE_COLORS), n)
+
+    def emit(self, position: pygame.Vector2, velocity: pygame.Vector2) -> None:
+        """Spawn a single particle with a given velocity (engine exhaust)."""
+        if self.density < 1.0 and self.rng.random() >= self.density:
+            return
+        rows = self._reserve(1)
+        if rows.start == rows.stop:
+            return
+        i = rows.start
+        self.position[i] = (position.x, position.y)
+        self.velocity[i] = (velocity.x, velocity.y)
+        self.lifetime[i] = PARTICLE_LIFETIME
+        self.color_index[i] = self.rng.integers(0, len(PARTICLE_COLORS))
+
+    def update(self, dt: float) -> None:
+        """Age, move and compact all live particles."""
+        self.last_dt = dt
+        n = self.count
+        if n == 0:
+            return
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        position = self.position[:n]
+        position += self.velocity[:n] * dt
+
+        alive = lifetime > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            k = len(keep)
+            self.position[:k] = position[keep]
+            self.velocity[:k] = self.velocity[keep]
+            self.lifetime[:k] = lifetime[keep]
+            self.color_index[:k] = self.color_index[keep]
+            self.count = k
+
+    def _build_stamps(self) -> None:
+        size = PARTICLE_SIZE
+        convert = pygame.display.get_surface() is not None
+        for color in PARTICLE_COLORS:
+            levels = []
+            for level in range(1, PARTICLE_ALPHA_LEVELS + 1):
+                alpha = int(255 * level / PARTICLE_ALPHA_LEVELS)
+                stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(stamp, (*color, alpha), (size, size), size)
+                levels.append(stamp.convert_alpha() if convert else stamp)
+            self._stamps.append(levels)
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, camera=None) -> list[pygame.Rect]:
+        """Blit every visible particle and return the rects they touched.
+
+        Particles move in straight lines, so interpolating toward the previous
+        tick is just backing each one off along its velocity. With a camera,
+        positions are wrapped into its view and particles outside it are
+        skipped.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        if not self._stamps:
+            self._build_stamps()
+
+        # Fade level rounds up so a particle stays visible until it expires
+        fade = self.lifetime[:n] / PARTICLE_LIFETIME
+        levels = np.clip(np.ceil(fade * PARTICLE_ALPHA_LEVELS).astype(np.intp) - 1, 0, PARTICLE_ALPHA_LEVELS - 1)
+        colors = self.color_index[:n]
+        position = self.position[:n]
+        if alpha < 1.0:
+            position = position - self.velocity[:n] * ((1.0 - alpha) * self.last_dt)
+        if camera is not None:
+            # Wrap the stamp's corner, so particles poking in past the left or
+            # top edge stay in view just like those past the right or bottom
+            corner = position - camera.offset
+            corner += PARTICLE_SIZE
+            np.mod(corner, (camera.world_width, camera.world_height), out=corner)
+            visible = ((corner[:, 0] < camera.view_width + 2 * PARTICLE_SIZE)
+                       & (corner[:, 1] < camera.view_height + 2 * PARTICLE_SIZE))
+            if not visible.all():
+                corner, levels, colors = corner[visible], levels[visible], colors[visible]
+            position = corner - PARTICLE_SIZE
+        corners = (position - PARTICLE_SIZE).astype(np.intp).tolist()
+        stamps = self._stamps
+        return screen.blits(
+            [(stamps[c][l], xy) for c, l, xy in zip(colors.tolist(), levels.tolist(), corners)]
+        )
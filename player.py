@@ -2,33 +2,83 @@ import pygame
 import random
 from game_object import GameObject
 from bullet import Bullet
-from particle import Particle
+from particle_system import ParticleSystem
+from sprite_cache import GLOW_STAMPS, quantize_angle
+from quality import QUALITY
+from input_source import Controls
+from sounds import SOUNDS
 from constants import (
     PLAYER_RADIUS, PLAYER_ROTATION_SPEED, PLAYER_THRUST, PLAYER_MAX_SPEED,
     PLAYER_DRAG, PLAYER_SHOOT_COOLDOWN, BULLET_SPEED, PLAYER_COLOR, WHITE, ORANGE,
-    SOUND_SHOOT, THRUST_CHANNEL, SOUND_THRUST, PARTICLE_FREQUENCY,
-    MULTISHOT_ANGLE, SPEED_BOOST_MULTIPLIER
+    PARTICLE_FREQUENCY,
+    MULTISHOT_ANGLE, SPEED_BOOST_MULTIPLIER, PLAYER_ROTATION_STEPS
 )
 import math
 
+SHIP_GLOW_WIDTH = 6
+
+
+def _stamp_half_size(radius: float) -> int:
+    # Large enough for the flame tip (1.5 radii) plus the glow stroke
+    return int(radius * 1.5) + SHIP_GLOW_WIDTH
+
+
+def _render_ship(radius: float, angle: float, shielded: bool, glow: bool = True) -> pygame.Surface:
+    half = _stamp_half_size(radius)
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    center = pygame.Vector2(half, half)
+    # Ship shape (triangle)
+    points = [
+        pygame.Vector2(0, -radius),
+        pygame.Vector2(-radius * 0.7, radius * 0.7),
+        pygame.Vector2(radius * 0.7, radius * 0.7)
+    ]
+    local_points = [point.rotate(angle) + center for point in points]
+
+    # Draw Glow (Thick, transparent)
+    if glow:
+        pygame.draw.polygon(surf, (*PLAYER_COLOR, 100), local_points, SHIP_GLOW_WIDTH)
+    # Draw Core (Thin, solid)
+    pygame.draw.polygon(surf, PLAYER_COLOR, local_points, 2)
+    # Shield effect
+    if shielded:
+        pygame.draw.circle(surf, (0, 255, 255, 100), center, radius + 5, 2)
+    return surf
+
+
+def _render_flame(radius: float, angle: float) -> pygame.Surface:
+    half = _stamp_half_size(radius)
+    surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    center = pygame.Vector2(half, half)
+    flame_points = [
+        pygame.Vector2(-radius * 0.3, radius * 0.7),
+        pygame.Vector2(0, radius * 1.5),
+        pygame.Vector2(radius * 0.3, radius * 0.7)
+    ]
+    local_flame = [point.rotate(angle) + center for point in flame_points]
+    pygame.draw.polygon(surf, (*ORANGE, 150), local_flame)
+    pygame.draw.polygon(surf, (255, 255, 0, 200), local_flame, 2)
+    return surf
+
 
 class Player(GameObject):
     """Player-controlled spaceship with movement, shooting, and power-up effects.
 
     Handles input for rotation, thrust, and shooting. Supports power-ups like
-    shields, speed boosts, and multishot. Manages thrust particles and invincibility.
+    shields, speed boosts, and multishot. Emits thrust particles and manages invincibility.
     """
-    def __init__(self, position: pygame.Vector2):
+    def __init__(self, position: pygame.Vector2, particles: ParticleSystem = None, rng: random.Random = random):
         super().__init__(position)
+        self.rng = rng
         self.radius = PLAYER_RADIUS
         self.rotation_speed = PLAYER_ROTATION_SPEED
         self.thrust = PLAYER_THRUST
         self.max_speed = PLAYER_MAX_SPEED
         self.drag = PLAYER_DRAG
         self.shoot_cooldown = PLAYER_SHOOT_COOLDOWN
-        self.last_shot_time = 0
+        self.last_shot_time = float('-inf')
         self.thrusting = False
-        self.thrust_particles = pygame.sprite.Group()
+        self.particles = particles or ParticleSystem()
 
         # Power-up attributes
         self.shielded = False
@@ -45,9 +95,7 @@ class Player(GameObject):
         self.powerup_timer = 0
         self.invincible_timer = 0
 
-    def update(self, dt: float, keys, screen_width: int, screen_height: int):
-        current_time = pygame.time.get_ticks() / 1000.0  # Convert to seconds
-
+    def update(self, dt: float, controls: Controls, screen_width: int, screen_height: int):
         # Update invincibility timer
         self.invincible_timer = max(0, self.invincible_timer - dt)
 
@@ -55,20 +103,18 @@ class Player(GameObject):
         was_thrusting = self.thrusting
 
         # Rotation
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if controls.rotate_left:
             self.rotation -= self.rotation_speed * dt
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if controls.rotate_right:
             self.rotation += self.rotation_speed * dt
 
         # Thrust
-        self.thrusting = keys[pygame.K_UP] or keys[pygame.K_w]
+        self.thrusting = controls.thrust
 
         if self.thrusting and not was_thrusting:
-            if THRUST_CHANNEL:
-                THRUST_CHANNEL.play(SOUND_THRUST, loops=-1)
+            SOUNDS.start_thrust()
         elif not self.thrusting and was_thrusting:
-            if THRUST_CHANNEL:
-                THRUST_CHANNEL.stop()
+            SOUNDS.stop_thrust()
         if self.thrusting:
             direction = pygame.Vector2(0, -1).rotate(self.rotation)
             effective_thrust = self.thrust * self.speed_boost
@@ -94,86 +140,45 @@ class Player(GameObject):
 
         # Spawn thrust particles
         if self.thrusting:
-            if random.random() < PARTICLE_FREQUENCY:
+            if self.rng.random() < PARTICLE_FREQUENCY:
                 direction = pygame.Vector2(0, 1).rotate(self.rotation)  # Backwards
                 particle_pos = self.position + direction * (self.radius + 5)
-                particle_vel = direction * random.uniform(100, 200) + self.velocity * 0.5
-                particle = Particle(particle_pos, particle_vel)
-                self.thrust_particles.add(particle)
-
-        # Update particles
-        self.thrust_particles.update(dt, screen_width, screen_height)
+                particle_vel = direction * self.rng.uniform(100, 200) + self.velocity * 0.5
+                self.particles.emit(particle_pos, particle_vel)
 
-    def shoot(self):
-        current_time = pygame.time.get_ticks() / 1000.0
+    def shoot(self, current_time: float, create_bullet=Bullet):
+        """Fire if the cooldown has passed; current_time is simulation time in seconds."""
         if current_time - self.last_shot_time >= self.shoot_cooldown:
             self.last_shot_time = current_time
-            if SOUND_SHOOT:
-                SOUND_SHOOT.play()
+            SOUNDS.trigger('shoot')
             direction = pygame.Vector2(0, -1).rotate(self.rotation)
             bullet_pos = self.position + direction * (self.radius + 5)
-            bullets = [Bullet(bullet_pos, direction * BULLET_SPEED)]
+            bullets = [create_bullet(bullet_pos, direction * BULLET_SPEED)]
             if self.multishot:
                 # Add side bullets
                 side_angle = MULTISHOT_ANGLE
                 left_dir = direction.rotate(-side_angle)
                 right_dir = direction.rotate(side_angle)
-                bullets.append(Bullet(bullet_pos, left_dir * BULLET_SPEED))
-                bullets.append(Bullet(bullet_pos, right_dir * BULLET_SPEED))
+                bullets.append(create_bullet(bullet_pos, left_dir * BULLET_SPEED))
+                bullets.append(create_bullet(bullet_pos, right_dir * BULLET_SPEED))
             return bullets
         return []
 
-    def draw(self, screen: pygame.Surface):
-        # Ship shape (triangle)
-        points = [
-            pygame.Vector2(0, -self.radius),
-            pygame.Vector2(-self.radius * 0.7, self.radius * 0.7),
-            pygame.Vector2(self.radius * 0.7, self.radius * 0.7)
-        ]
-
-        # Rotate points
-        rotated_points = []
-        for point in points:
-            rotated = point.rotate(self.rotation)
-            rotated_points.append(pygame.Vector2(rotated.x, rotated.y))
-
-        # Create glow surface
-        glow_size = int(self.radius * 3)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        center = pygame.Vector2(glow_size, glow_size)
-
-        # Translate points to local surface coordinates
-        local_points = [(p + center) for p in rotated_points]
-
-        # Draw Glow (Thick, transparent)
-        glow_color = (*PLAYER_COLOR, 100)  # Add alpha
-        pygame.draw.polygon(glow_surf, glow_color, local_points, 6)
-        
-        # Draw Core (Thin, solid)
-        pygame.draw.polygon(glow_surf, PLAYER_COLOR, local_points, 2)
-        
-        # Shield effect
-        if self.shielded:
-            pygame.draw.circle(glow_surf, (0, 255, 255, 100), center, self.radius + 5, 2)
-
-        # Blit to screen
-        screen_pos = self.position - center
-        screen.blit(glow_surf, screen_pos)
-
-        # Draw thrust particles
-        self.thrust_particles.draw(screen)
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
+        step = quantize_angle(self.rotation, PLAYER_ROTATION_STEPS)
+        angle = step * 360 / PLAYER_ROTATION_STEPS
+        glow = QUALITY.tier.glow
+        ship = GLOW_STAMPS.get(
+            ('ship', self.radius, step, self.shielded, glow),
+            lambda: _render_ship(self.radius, angle, self.shielded, glow),
+        )
+        half = ship.get_width() // 2
+        position = self.render_position(alpha)
+        screen_pos = (position.x + offset[0] - half, position.y + offset[1] - half)
+        rect = screen.blit(ship, screen_pos)
 
         # Draw thrust flame
         if self.thrusting:
-            flame_points = [
-                pygame.Vector2(-self.radius * 0.3, self.radius * 0.7),
-                pygame.Vector2(0, self.radius * 1.5),
-                pygame.Vector2(self.radius * 0.3, self.radius * 0.7)
-            ]
-            
-            flame_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            local_flame = [(p.rotate(self.rotation) + center) for p in flame_points]
-            
-            pygame.draw.polygon(flame_surf, (*ORANGE, 150), local_flame)
-            pygame.draw.polygon(flame_surf, (255, 255, 0, 200), local_flame, 2)
-            screen.blit(flame_surf, screen_pos)
\ No newline at end of file
+            flame = GLOW_STAMPS.get(('flame', self.radius, step), lambda: _render_flame(self.radius, angle))
+            screen.blit(flame, screen_pos)  # Same footprint as the ship stamp
+        return rect
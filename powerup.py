@@ -1,38 +1,55 @@
 import pygame
 from game_object import GameObject
+from sprite_cache import GLOW_STAMPS
+from quality import QUALITY
+from text_cache import get_font
 from constants import POWERUP_RADIUS, POWERUP_COLORS, POWERUP_DURATION, WHITE
 
 
+def _render_powerup(color: tuple, radius: int, letter: str, glow: bool = True) -> pygame.Surface:
+    glow_radius = radius * 2 if glow else radius + 1
+    surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+    center = (glow_radius, glow_radius)
+    # Glow
+    if glow:
+        pygame.draw.circle(surf, (*color, 100), center, int(radius * 1.5))
+    # Core
+    pygame.draw.circle(surf, color, center, radius, 2)
+    # Text
+    text = get_font("arial", 12, bold=True).render(letter, True, WHITE)
+    surf.blit(text, text.get_rect(center=center))
+    return surf
+
+
 class PowerUp(GameObject):
+    __slots__ = ('type', 'color', 'age', 'lifetime')
+
     def __init__(self, position: pygame.Vector2, type_: str):
         super().__init__(position)
+        self.reset(position, type_)
+
+    def reset(self, position: pygame.Vector2, type_: str) -> None:
+        super().reset(position)
         self.type = type_
         self.radius = POWERUP_RADIUS
         self.color = POWERUP_COLORS[type_]
-        self.spawn_time = pygame.time.get_ticks() / 1000.0
-        self.font = pygame.font.SysFont("arial", 12, bold=True)
+        self.age = 0.0
+        self.lifetime = POWERUP_DURATION
 
     def update(self, dt: float, screen_width: int, screen_height: int):
-        current_time = pygame.time.get_ticks() / 1000.0
-        self.lifetime = POWERUP_DURATION - (current_time - self.spawn_time)
+        self.age += dt
+        self.lifetime = POWERUP_DURATION - self.age
         if self.lifetime <= 0:
             self.active = False
         self.wrap_position(screen_width, screen_height)
 
-    def draw(self, screen: pygame.Surface):
-        glow_radius = int(self.radius * 2)
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        center = (glow_radius, glow_radius)
-
-        # Glow
-        pygame.draw.circle(glow_surf, (*self.color, 100), center, int(self.radius * 1.5))
-        # Core
-        pygame.draw.circle(glow_surf, self.color, center, self.radius, 2)
-        
-        # Text
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
         letter = self.type[0].upper()
-        text = self.font.render(letter, True, WHITE)
-        text_rect = text.get_rect(center=center)
-        glow_surf.blit(text, text_rect)
-
-        screen.blit(glow_surf, (self.position.x - glow_radius, self.position.y - glow_radius))
\ No newline at end of file
+        glow = QUALITY.tier.glow
+        stamp = GLOW_STAMPS.get(
+            ('powerup', self.color, self.radius, letter, glow),
+            lambda: _render_powerup(self.color, self.radius, letter, glow),
+        )
+        glow_radius = stamp.get_width() // 2
+        position = self.render_position(alpha)
+        return screen.blit(stamp, (position.x + offset[0] - glow_radius, position.y + offset[1] - glow_radius))
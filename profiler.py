@@ -0,0 +1,179 @@
+"""Per-frame phase profiler for the game loop.
+
+Hot-path code wraps each phase in `with game.profiler.span("name"):`. While the
+profiler is disabled, span() returns a shared no-op context, so the cost is one
+attribute check per phase. Once it is enabled, finished spans go into a fixed
+size ring buffer, and per-phase averages are kept for the overlay.
+
+In game, F3 toggles the overlay (a frame-time graph against the 1 / FPS
+budget plus the slowest phases) and F4 writes the buffered spans to PROFILE_DIR
+as Chrome trace_event JSON. Open it in chrome://tracing or ui.perfetto.dev.
+"""
+import json
+import os
+import time
+from array import array
+from contextlib import nullcontext
+import pygame
+from text_cache import get_font
+from constants import (
+    FPS, PROFILER_SPAN_CAPACITY, PROFILER_FRAME_HISTORY, PROFILE_DIR,
+    WHITE, NEON_GREEN, NEON_RED, NEON_YELLOW
+)
+
+_DISABLED = nullcontext()
+
+OVERLAY_WIDTH = 260
+OVERLAY_GRAPH_HEIGHT = 60
+OVERLAY_PHASE_LINES = 6
+OVERLAY_LINE_HEIGHT = 14
+OVERLAY_AVERAGE_WEIGHT = 0.05  # Weight of the newest frame in the per-phase averages
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'Profiler', name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+
+
+class Profiler:
+    """Ring buffer of named timing spans grouped into frames."""
+    def __init__(self, capacity: int = PROFILER_SPAN_CAPACITY, frame_history: int = PROFILER_FRAME_HISTORY) -> None:
+        self.enabled = False
+        self.overlay_visible = False
+        self.capacity = capacity
+        self.names = [''] * capacity
+        self.starts = array('q', bytes(8 * capacity))
+        self.ends = array('q', bytes(8 * capacity))
+        self.count = 0  # Spans recorded since the last clear; the buffer holds the newest `capacity`
+        self.frame_times = array('d', bytes(8 * frame_history))  # Milliseconds, a ring as well
+        self.frames = 0
+        self.averages: dict[str, float] = {}  # Milliseconds per frame, smoothed
+        self._frame_totals: dict[str, int] = {}
+        self._frame_start = 0
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _DISABLED
+        return _Span(self, name)
+
+    def record(self, name: str, start: int, end: int) -> None:
+        i = self.count % self.capacity
+        self.names[i] = name
+        self.starts[i] = start
+        self.ends[i] = end
+        self.count += 1
+        self._frame_totals[name] = self._frame_totals.get(name, 0) + (end - start)
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        if not self.enabled or not self._frame_start:
+            return
+        end = time.perf_counter_ns()
+        self.record('frame', self._frame_start, end)
+        self.frame_times[self.frames % len(self.frame_times)] = (end - self._frame_start) / 1e6
+        self.frames += 1
+        self._frame_start = 0
+
+        # Fold this frame's per-phase totals into the smoothed averages
+        totals = self._frame_totals
+        for name in self.averages.keys() | totals.keys():
+            ms = totals.get(name, 0) / 1e6
+            average = self.averages.get(name, ms)
+            self.averages[name] = average + (ms - average) * OVERLAY_AVERAGE_WEIGHT
+        totals.clear()
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._frame_start = 0
+
+    def toggle_overlay(self) -> None:
+        self.overlay_visible = not self.overlay_visible
+        self.set_enabled(self.overlay_visible)
+
+    def clear(self) -> None:
+        self.count = 0
+        self.frames = 0
+        self.averages.clear()
+        self._frame_totals.clear()
+
+    def spans(self) -> list[tuple[str, int, int]]:
+        """Buffered spans, oldest first, as (name, start_ns, end_ns)."""
+        n = min(self.count, self.capacity)
+        first = self.count - n
+        return [
+            (self.names[i % self.capacity], self.starts[i % self.capacity], self.ends[i % self.capacity])
+            for i in range(first, self.count)
+        ]
+
+    def chrome_trace(self) -> dict:
+        return {
+            'traceEvents': [
+                {
+                    'name': name, 'cat': name.split('.')[0], 'ph': 'X', 'pid': 1, 'tid': 1,
+                    'ts': (start - self._origin) / 1000.0, 'dur': (end - start) / 1000.0,
+                }
+                for name, start, end in self.spans()
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def export_chrome_trace(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+    def export_default(self) -> str:
+        return self.export_chrome_trace(os.path.join(PROFILE_DIR, f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"))
+
+    def draw_overlay(self, screen: pygame.Surface, status: str = "") -> pygame.Rect:
+        """Draw the frame graph, an optional status line and the slowest phases in the bottom-right corner."""
+        font = get_font("consolas", 12)
+        height = OVERLAY_GRAPH_HEIGHT + (OVERLAY_PHASE_LINES + 1 + bool(status)) * OVERLAY_LINE_HEIGHT + 8
+        panel = pygame.Surface((OVERLAY_WIDTH, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+
+        # One bar per frame, scaled so twice the budget fills the graph
+        budget = 1000.0 / FPS
+        history = len(self.frame_times)
+        bar_width = OVERLAY_WIDTH / history
+        scale = OVERLAY_GRAPH_HEIGHT / (2 * budget)
+        for age in range(min(self.frames, history)):
+            ms = self.frame_times[(self.frames - 1 - age) % history]
+            bar_height = min(OVERLAY_GRAPH_HEIGHT, int(ms * scale) + 1)
+            x = int(OVERLAY_WIDTH - (age + 1) * bar_width)
+            color = NEON_GREEN if ms <= budget else NEON_RED
+            panel.fill(color, (x, OVERLAY_GRAPH_HEIGHT - bar_height, max(1, int(bar_width)), bar_height))
+        budget_y = OVERLAY_GRAPH_HEIGHT - int(budget * scale)
+        pygame.draw.line(panel, NEON_YELLOW, (0, budget_y), (OVERLAY_WIDTH, budget_y))
+
+        # Text changes every frame, so it is rendered directly rather than cached
+        y = OVERLAY_GRAPH_HEIGHT + 4
+        frame_ms = self.averages.get('frame', 0.0)
+        panel.blit(font.render(f"frame {frame_ms:6.2f} ms  budget {budget:.1f} ms", True, WHITE), (4, y))
+        if status:
+            y += OVERLAY_LINE_HEIGHT
+            panel.blit(font.render(status, True, NEON_YELLOW), (4, y))
+        phases = sorted((item for item in self.averages.items() if item[0] != 'frame'), key=lambda item: -item[1])
+        for name, ms in phases[:OVERLAY_PHASE_LINES]:
+            y += OVERLAY_LINE_HEIGHT
+            panel.blit(font.render(name, True, WHITE), (4, y))
+            value = font.render(f"{ms:.2f}", True, WHITE)
+            panel.blit(value, (OVERLAY_WIDTH - value.get_width() - 4, y))
+
+        return screen.blit(panel, (screen.get_width() - OVERLAY_WIDTH - 10, screen.get_height() - height - 10))
@@ -0,0 +1,104 @@
+"""Render quality tiers and the governor that picks one from recent frame times.
+
+Each tier in QUALITY_TIERS trades looks for speed: glow layers on sprites,
+the share of particles spawned, asteroid outline detail and pulsing text.
+Game.run hands the governor the work time of every frame played, meaning the
+time spent before the clock starts waiting for the next frame. Once a window
+of QUALITY_WINDOW frames has filled, the governor compares a high percentile
+of it with the 1 / FPS budget. It steps to a cheaper tier when frames come
+close to the budget, and back up only when they are well under it and the
+tier has held for a while. After a change it waits for a fresh window before
+judging again. A step up that is undone within two windows doubles the wait
+before the next one, so a tier that cannot hold FPS is not retried every few
+seconds; one that holds resets the wait.
+
+Only drawing reads the tier. The simulation, replays and headless runs are
+the same at every tier.
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+from constants import (
+    FPS, QUALITY_TIERS, QUALITY_WINDOW, QUALITY_PERCENTILE, QUALITY_DOWNGRADE_LOAD, QUALITY_UPGRADE_LOAD,
+    QUALITY_UPGRADE_HOLD, QUALITY_MAX_UPGRADE_HOLD
+)
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    glow: bool
+    particles: float
+    outline_points: Optional[int]
+    pulse: bool
+
+
+TIERS = tuple(QualityTier(**tier) for tier in QUALITY_TIERS)
+TIER_NAMES = tuple(tier.name for tier in TIERS)
+
+
+class QualityGovernor:
+    """Current render tier, stepped with hysteresis to hold the frame budget."""
+    def __init__(self, tiers: tuple[QualityTier, ...] = TIERS, budget: float = 1.0 / FPS,
+                 window: int = QUALITY_WINDOW) -> None:
+        self.tiers = tiers
+        self.budget = budget
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.level = 0  # Index into tiers, 0 is the best
+        self.pinned = False
+        self.load = 0.0  # Percentile frame of the last full window, as a share of the budget
+        self.upgrade_hold = QUALITY_UPGRADE_HOLD
+        self.changes = 0
+        self._frames_at_tier = 0
+        self._stepped_up = False
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.level]
+
+    def pin(self, name: Optional[str]) -> None:
+        """Hold the named tier from now on; None goes back to choosing automatically."""
+        self.pinned = name is not None
+        if name is not None:
+            self._change([tier.name for tier in self.tiers].index(name), stepped_up=False)
+
+    def observe(self, frame_time: float) -> bool:
+        """Record one frame's work time in seconds; True when the tier changed."""
+        if self.pinned:
+            return False
+        times = self.frame_times
+        times.append(frame_time)
+        self._frames_at_tier += 1
+        if len(times) < times.maxlen:
+            return False
+        self.load = sorted(times)[int(QUALITY_PERCENTILE * (len(times) - 1))] / self.budget
+        if self._stepped_up and self._frames_at_tier > 2 * times.maxlen:
+            # The last step up held, so the next one need not wait out earlier bounces
+            self.upgrade_hold = QUALITY_UPGRADE_HOLD
+            self._stepped_up = False
+        if self.load > QUALITY_DOWNGRADE_LOAD and self.level < len(self.tiers) - 1:
+            if self._stepped_up:  # Undone within two windows
+                self.upgrade_hold = min(self.upgrade_hold * 2, QUALITY_MAX_UPGRADE_HOLD)
+            self._change(self.level + 1, stepped_up=False)
+            return True
+        if self.load < QUALITY_UPGRADE_LOAD and self.level > 0 and self._frames_at_tier >= self.upgrade_hold:
+            self._change(self.level - 1, stepped_up=True)
+            return True
+        return False
+
+    def _change(self, level: int, stepped_up: bool) -> None:
+        if level != self.level:
+            self.changes += 1
+        self.level = level
+        self.frame_times.clear()
+        self._frames_at_tier = 0
+        self._stepped_up = stepped_up
+
+    def stats(self) -> dict:
+        return {
+            'tier': self.tier.name, 'level': self.level, 'pinned': self.pinned, 'load': self.load,
+            'changes': self.changes, 'upgrade_hold': self.upgrade_hold,
+        }
+
+
+QUALITY = QualityGovernor()
@@ -0,0 +1,287 @@
+"""Compact input-stream replays and accelerated playback.
+
+A replay stores only what is needed to rebuild a run through GameLogic: the
+RNG seed, the difficulty, the world size and one input bitmask byte per tick. The simulation
+is deterministic, so that is enough. Every REPLAY_CHECKSUM_INTERVAL ticks a CRC
+of the game state is stored as well, and playback stops with
+ReplayDivergenceError as soon as a rebuilt run disagrees with it.
+
+File layout (little endian):
+
+    header: b"ASTR", version u8, flags u8, tick rate u16, checksum interval u16,
+            seed u64, world width u16, world height u16, difficulty length u8,
+            difficulty utf-8
+    chunk:  first tick u32, tick count u16, checksum count u16, payload size u32,
+            payload (zlib-compressed when FLAG_COMPRESSED is set):
+            tick count input bytes, then checksum count (tick u32, crc u32)
+
+Play a replay back headless or in a window:
+
+    python replay.py replays/20260101-120000-42.replay
+    python replay.py replays/20260101-120000-42.replay --render
+"""
+import argparse
+import json
+import os
+import struct
+import time
+import zlib
+import pygame
+from typing import BinaryIO, Iterator, Optional, TYPE_CHECKING
+from constants import (
+    TICK_RATE, WORLD_WIDTH, WORLD_HEIGHT, REPLAY_DIR, REPLAY_CHUNK_TICKS, REPLAY_CHECKSUM_INTERVAL, REPLAY_COMPRESS
+)
+from input_source import Controls, NO_CONTROLS
+from sounds import SOUNDS
+
+if TYPE_CHECKING:
+    from game import Game
+
+MAGIC = b"ASTR"
+VERSION = 4  # 2: bullets collide along their swept path; 3: power-up drops roll after the collision passes;
+             # 4: the header stores the world size
+FLAG_COMPRESSED = 1
+HEADER = struct.Struct("<4sBBHHQHHB")
+CHUNK_HEADER = struct.Struct("<IHHI")
+CHECKSUM = struct.Struct("<II")
+
+
+class ReplayError(Exception):
+    """Raised for files that are not replays or cannot be played here."""
+
+
+class ReplayDivergenceError(ReplayError):
+    """Raised when a rebuilt run no longer matches the recorded checksums."""
+    def __init__(self, tick: int, expected: int, actual: int) -> None:
+        super().__init__(f"Replay diverged at tick {tick}: expected checksum {expected:08x}, got {actual:08x}")
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+def state_checksum(game: 'Game') -> int:
+    """CRC32 over the parts of the state that any divergence quickly touches."""
+    player = game.player
+    crc = zlib.crc32(struct.pack(
+        "<IqiI6d", game.sim_clock.ticks, game.score, game.lives, game.level,
+        player.position.x, player.position.y, player.velocity.x, player.velocity.y,
+        player.rotation, player.invincible_timer,
+    ))
+    for group in (game.asteroids, game.bullets, game.ufos, game.ufo_bullets, game.powerups):
+        crc = zlib.crc32(struct.pack("<I", len(group)), crc)
+        for entity in group:
+            crc = zlib.crc32(struct.pack("<2d", entity.position.x, entity.position.y), crc)
+    return crc
+
+
+class ReplayWriter:
+    """Streams a replay to a binary file in chunks of REPLAY_CHUNK_TICKS ticks."""
+    def __init__(self, stream: BinaryIO, seed: int, difficulty: str, world_size: tuple[int, int] = (WORLD_WIDTH, WORLD_HEIGHT),
+                 compress: bool = REPLAY_COMPRESS, checksum_interval: int = REPLAY_CHECKSUM_INTERVAL) -> None:
+        self.stream = stream
+        self.compress = compress
+        self.checksum_interval = checksum_interval
+        self.ticks = 0
+        self._chunk_start = 0
+        self._inputs = bytearray()
+        self._checksums = bytearray()
+        self._checksum_count = 0
+        difficulty_bytes = difficulty.encode('utf-8')
+        stream.write(HEADER.pack(
+            MAGIC, VERSION, FLAG_COMPRESSED if compress else 0, TICK_RATE,
+            checksum_interval, seed, *world_size, len(difficulty_bytes),
+        ))
+        stream.write(difficulty_bytes)
+
+    def record_tick(self, mask: int) -> None:
+        self._inputs.append(mask)
+        self.ticks += 1
+
+    def record_checksum(self, tick: int, checksum: int) -> None:
+        self._checksums += CHECKSUM.pack(tick, checksum)
+        self._checksum_count += 1
+        if len(self._inputs) >= REPLAY_CHUNK_TICKS:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._inputs and not self._checksum_count:
+            return
+        payload = bytes(self._inputs + self._checksums)
+        if self.compress:
+            payload = zlib.compress(payload)
+        self.stream.write(CHUNK_HEADER.pack(self._chunk_start, len(self._inputs), self._checksum_count, len(payload)))
+        self.stream.write(payload)
+        self._chunk_start = self.ticks
+        self._inputs.clear()
+        self._checksums.clear()
+        self._checksum_count = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.stream.close()
+
+
+class ReplayReader:
+    """Parses a replay file into its header fields, inputs and checksums."""
+    def __init__(self, stream: BinaryIO) -> None:
+        header = stream.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ReplayError("File is too short to be a replay")
+        magic, version, flags, tick_rate, interval, seed, world_width, world_height, difficulty_len = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self.tick_rate = tick_rate
+        self.checksum_interval = interval
+        self.seed = seed
+        self.world_size = (world_width, world_height)
+        self.difficulty = stream.read(difficulty_len).decode('utf-8')
+        self.inputs = bytearray()
+        self.checksums: dict[int, int] = {}
+        self._read_chunks(stream)
+
+    def _read_chunks(self, stream: BinaryIO) -> None:
+        while True:
+            header = stream.read(CHUNK_HEADER.size)
+            if not header:
+                break
+            if len(header) < CHUNK_HEADER.size:
+                raise ReplayError("Truncated chunk header")
+            first_tick, tick_count, checksum_count, size = CHUNK_HEADER.unpack(header)
+            if first_tick != len(self.inputs):
+                raise ReplayError(f"Chunk starts at tick {first_tick}, expected {len(self.inputs)}")
+            payload = stream.read(size)
+            if len(payload) < size:
+                raise ReplayError("Truncated chunk payload")
+            if self.compressed:
+                payload = zlib.decompress(payload)
+            self.inputs += payload[:tick_count]
+            for tick, checksum in CHECKSUM.iter_unpack(payload[tick_count:tick_count + checksum_count * CHECKSUM.size]):
+                self.checksums[tick] = checksum
+
+    @property
+    def ticks(self) -> int:
+        return len(self.inputs)
+
+
+class ReplayInput:
+    """Input source that feeds recorded bitmasks back, one per tick."""
+    def __init__(self, inputs: bytes) -> None:
+        self.inputs = inputs
+        self.tick = 0
+
+    def poll(self) -> Controls:
+        if self.tick >= len(self.inputs):
+            return NO_CONTROLS
+        controls = Controls.from_mask(self.inputs[self.tick])
+        self.tick += 1
+        return controls
+
+
+class ReplayRecorder:
+    """Records the current session of a Game to REPLAY_DIR.
+
+    begin() is called when a run starts; the file is only created once the
+    first tick is recorded, so runs that never leave the menu leave nothing
+    behind. finish() flushes and closes it.
+    """
+    def __init__(self, directory: str = REPLAY_DIR) -> None:
+        self.directory = directory
+        self.writer: Optional[ReplayWriter] = None
+        self.path: Optional[str] = None
+        self._pending: Optional[tuple[int, str, tuple[int, int]]] = None
+
+    def begin(self, seed: int, difficulty: str, world_size: tuple[int, int] = (WORLD_WIDTH, WORLD_HEIGHT)) -> None:
+        self.finish()
+        self._pending = (seed, difficulty, world_size)
+
+    def record_input(self, controls: Controls) -> None:
+        if self._pending is not None:
+            seed, difficulty, world_size = self._pending
+            self._pending = None
+            os.makedirs(self.directory, exist_ok=True)
+            self.path = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{seed}.replay")
+            self.writer = ReplayWriter(open(self.path, 'wb'), seed, difficulty, world_size)
+        if self.writer:
+            self.writer.record_tick(controls.to_mask())
+
+    def after_tick(self, game: 'Game') -> None:
+        if self.writer and game.sim_clock.ticks % self.writer.checksum_interval == 0:
+            self.writer.record_checksum(game.sim_clock.ticks, state_checksum(game))
+
+    def finish(self) -> None:
+        self._pending = None
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+
+def load_replay(path: str) -> ReplayReader:
+    with open(path, 'rb') as f:
+        return ReplayReader(f)
+
+
+def play_replay(path: str, render: bool = False) -> dict:
+    """Rebuild a recorded run and return its final state.
+
+    Headless playback runs as fast as the CPU allows; with render=True the
+    run is shown in a window at normal speed. Either way every stored
+    checksum is verified and the first mismatch raises ReplayDivergenceError.
+    """
+    from game import Game
+
+    replay = load_replay(path)
+    if replay.tick_rate != TICK_RATE:
+        raise ReplayError(f"Replay was recorded at {replay.tick_rate} ticks/s, this build runs at {TICK_RATE}")
+
+    game = Game(headless=not render, input_source=ReplayInput(replay.inputs), seed=replay.seed,
+                world_size=replay.world_size)
+    game.replay_recorder = None  # Never record a replay of a replay
+    game.difficulty = replay.difficulty
+    game.apply_difficulty()
+    game.logic.reset_game(replay.seed)
+    game.change_state('playing')
+
+    start = time.perf_counter()
+    for tick in range(1, replay.ticks + 1):
+        if render and any(event.type == pygame.QUIT for event in pygame.event.get()):
+            break
+        game.update(game.tick_dt)
+        expected = replay.checksums.get(tick)
+        if expected is not None:
+            actual = state_checksum(game)
+            if actual != expected:
+                raise ReplayDivergenceError(tick, expected, actual)
+        if render:
+            SOUNDS.flush()  # Once per frame like Game.run, so triggers are heard and do not pile up
+            game.draw()
+            game.clock.tick(TICK_RATE)
+    elapsed = time.perf_counter() - start
+    if render:
+        pygame.quit()
+
+    state = game.snapshot()
+    state['ticks_per_second'] = replay.ticks / elapsed if elapsed > 0 else 0.0
+    return state
+
+
+def iter_replays(directory: str = REPLAY_DIR) -> Iterator[str]:
+    if not os.path.isdir(directory):
+        return
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.replay'):
+            yield os.path.join(directory, name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play back a recorded Asteroids session.")
+    parser.add_argument('path', help="replay file to play")
+    parser.add_argument('--render', action='store_true', help="show the run in a window at normal speed")
+    args = parser.parse_args()
+    print(json.dumps(play_replay(args.path, render=args.render), indent=2))
+
+
+if __name__ == "__main__":
+    main()
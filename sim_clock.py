@@ -0,0 +1,17 @@
+class SimulationClock:
+    """Game time advanced only by simulation ticks, never read from the wall clock.
+
+    Cooldowns and timers measured against it behave the same whether the game
+    runs in real time with a window or headless as fast as the CPU allows.
+    """
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.ticks = 0
+
+    def advance(self, dt: float) -> None:
+        self.now += dt
+        self.ticks += 1
+
+    def reset(self) -> None:
+        self.now = 0.0
+        self.ticks = 0
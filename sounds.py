@@ -0,0 +1,126 @@
+"""Sound effects shared by every module that plays them.
+
+Callers look sounds up on SOUNDS when they play them instead of importing
+them by name, so sounds that finish loading after startup still reach them.
+
+Effects are not played the moment they are triggered. trigger() counts
+requests by sound name, and flush() plays them once per frame. Identical
+triggers in one frame become a single play, a little louder the more there
+were. Each effect plays on one of a fixed set of mixer channels. Every sound
+has a cap on the voices it may hold at once, and when all channels are busy a
+new sound takes over the oldest voice of equal or lower priority, or is
+dropped. The thrust loop keeps a reserved channel of its own.
+"""
+import math
+from typing import Optional
+import pygame
+from constants import (
+    load_sounds, init_channels, AUDIO_RESERVED_CHANNELS, AUDIO_EFFECT_VOICES, AUDIO_VOICES_PER_SOUND,
+    AUDIO_PRIORITIES, AUDIO_TRIGGER_VOLUME, AUDIO_COALESCE_GAIN
+)
+
+
+class AudioManager:
+    """Loaded sound effects and the voices playing them; every slot stays None until loading succeeds."""
+    def __init__(self) -> None:
+        self.shoot: Optional[pygame.mixer.Sound] = None
+        self.explode: Optional[pygame.mixer.Sound] = None
+        self.thrust: Optional[pygame.mixer.Sound] = None
+        self.thrust_channel: Optional[pygame.mixer.Channel] = None
+        self.channels: list[pygame.mixer.Channel] = []  # Effect voices; empty without a mixer
+        self._owners: list[Optional[str]] = []  # Sound name last started on each channel
+        self._started: list[int] = []  # Play sequence number per channel, for picking the oldest voice
+        self._sequence = 0
+        self._requests: dict[str, int] = {}
+        self.counters = {'triggers': 0, 'plays': 0, 'coalesced': 0, 'stolen': 0, 'dropped': 0, 'peak_voices': 0}
+
+    def load(self) -> None:
+        """Decode the effect files; safe to call off the main thread."""
+        self.shoot, self.explode, self.thrust = load_sounds()
+
+    def init_channels(self) -> None:
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.set_num_channels(AUDIO_RESERVED_CHANNELS + AUDIO_EFFECT_VOICES)
+        pygame.mixer.set_reserved(AUDIO_RESERVED_CHANNELS)
+        self.thrust_channel = init_channels()
+        self.channels = [pygame.mixer.Channel(AUDIO_RESERVED_CHANNELS + i) for i in range(AUDIO_EFFECT_VOICES)]
+        self._owners = [None] * AUDIO_EFFECT_VOICES
+        self._started = [0] * AUDIO_EFFECT_VOICES
+
+    def trigger(self, name: str, count: int = 1) -> None:
+        """Ask for effect `name` (e.g. 'explode') to play at the end of this frame."""
+        if self.channels:
+            self._requests[name] = self._requests.get(name, 0) + count
+
+    def play_explosions(self, events: list[tuple]) -> None:
+        """Event handler: an explosion for each destroyed asteroid or UFO, skipping shield rams."""
+        count = sum(1 for event in events if len(event) < 4 or event[3])
+        if count:
+            self.trigger('explode', count)
+
+    def flush(self) -> None:
+        """Play this frame's triggers, highest priority first."""
+        requests = self._requests
+        if not requests:
+            return
+        counters = self.counters
+        busy = [channel.get_busy() for channel in self.channels]
+        for name in sorted(requests, key=lambda name: -AUDIO_PRIORITIES.get(name, 0)):
+            count = requests[name]
+            counters['triggers'] += count
+            sound = getattr(self, name, None)
+            i = self._voice_for(name, busy) if sound is not None else None
+            if i is None:
+                counters['dropped'] += count  # Every trigger merged into it is lost, not just one
+                continue
+            channel = self.channels[i]
+            if busy[i]:
+                channel.stop()
+                counters['stolen'] += 1
+            # Coalesced triggers play once, louder with every doubling
+            channel.set_volume(min(1.0, AUDIO_TRIGGER_VOLUME * (1.0 + AUDIO_COALESCE_GAIN * math.log2(count))))
+            channel.play(sound)
+            busy[i] = True
+            self._owners[i] = name
+            self._sequence += 1
+            self._started[i] = self._sequence
+            counters['plays'] += 1
+            counters['coalesced'] += count - 1
+        counters['peak_voices'] = max(counters['peak_voices'], sum(busy))
+        requests.clear()
+
+    def _voice_for(self, name: str, busy: list[bool]) -> Optional[int]:
+        """Channel for a new play of `name`, or None to drop it."""
+        owners, started = self._owners, self._started
+        held = [i for i, owner in enumerate(owners) if busy[i] and owner == name]
+        if len(held) >= AUDIO_VOICES_PER_SOUND.get(name, AUDIO_EFFECT_VOICES):
+            return min(held, key=started.__getitem__)
+        for i, channel_busy in enumerate(busy):
+            if not channel_busy:
+                return i
+        priority = AUDIO_PRIORITIES.get(name, 0)
+        victims = [i for i, owner in enumerate(owners) if AUDIO_PRIORITIES.get(owner, 0) <= priority]
+        if not victims:
+            return None
+        return min(victims, key=lambda i: (AUDIO_PRIORITIES.get(owners[i], 0), started[i]))
+
+    def stats(self) -> dict:
+        """Trigger and voice counters, plus the voices playing right now per sound."""
+        voices = {}
+        for channel, owner in zip(self.channels, self._owners):
+            if owner and channel.get_busy():
+                voices[owner] = voices.get(owner, 0) + 1
+        return {**self.counters, 'voices': sum(voices.values()), 'voices_by_sound': voices,
+                'max_voices': len(self.channels)}
+
+    def start_thrust(self) -> None:
+        if self.thrust_channel and self.thrust:
+            self.thrust_channel.play(self.thrust, loops=-1)
+
+    def stop_thrust(self) -> None:
+        if self.thrust_channel:
+            self.thrust_channel.stop()
+
+
+SOUNDS = AudioManager()
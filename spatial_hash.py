@@ -0,0 +1,169 @@
+import math
+from typing import Iterable
+import numpy as np
+
+
+class SpatialHash:
+    """Uniform-grid broad-phase for circle collisions on a toroidal play field.
+
+    The grid period matches the play field, so cell indices wrap the same way
+    GameObject.wrap_position wraps positions and queries near an edge also see
+    objects just across the seam. Objects are bucketed by their center; queries
+    widen their search by the largest radius inserted so far.
+
+    Buckets hold (obj, x, y, radius, vx, vy) records taken at insert time, so
+    the narrow phase compares plain floats instead of reading entity
+    attributes, which on stored entities costs an array read and a new vector
+    each. Only obj.active is read live, since it changes during a pass.
+    """
+    def __init__(self, width: float, height: float, cell_size: float) -> None:
+        self.width = width
+        self.height = height
+        # Stretch the cells slightly so a whole number of them spans the field,
+        # otherwise the last column/row would not wrap onto the first.
+        self.cols = max(1, round(width / cell_size))
+        self.rows = max(1, round(height / cell_size))
+        self.cell_width = width / self.cols
+        self.cell_height = height / self.rows
+        self.cells: dict[int, list] = {}
+        self.max_radius = 0.0
+
+    def _cell_index(self, col: int, row: int) -> int:
+        return (row % self.rows) * self.cols + (col % self.cols)
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.max_radius = 0.0
+
+    def insert(self, obj) -> None:
+        position, velocity, radius = obj.position, obj.velocity, obj.radius
+        col = int(position.x // self.cell_width)
+        row = int(position.y // self.cell_height)
+        self.cells.setdefault(self._cell_index(col, row), []).append(
+            (obj, position.x, position.y, radius, velocity.x, velocity.y))
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def rebuild(self, objects: Iterable) -> None:
+        """Drop every bucket and re-insert the given objects."""
+        self.clear()
+        if hasattr(objects, 'store'):
+            self._insert_stored(objects)
+            return
+        for obj in objects:
+            self.insert(obj)
+
+    def _insert_stored(self, group) -> None:
+        """Bucket a StoredGroup's entities straight from its store's arrays."""
+        if not group:
+            return
+        # Group order rather than slot order, so buckets match an unstored group's
+        store, slots = group.store, group.slots()
+        position = store.position[slots]
+        velocity = store.velocity[slots]
+        radius = store.radius[slots]
+        cols = (position[:, 0] // self.cell_width).astype(np.intp) % self.cols
+        rows = (position[:, 1] // self.cell_height).astype(np.intp) % self.rows
+        cells = self.cells
+        for obj, cell, x, y, r, vx, vy in zip(group, (rows * self.cols + cols).tolist(),
+                                              position[:, 0].tolist(), position[:, 1].tolist(), radius.tolist(),
+                                              velocity[:, 0].tolist(), velocity[:, 1].tolist()):
+            cells.setdefault(cell, []).append((obj, x, y, r, vx, vy))
+        self.max_radius = max(self.max_radius, float(radius.max()))
+
+    def _span(self, low: float, high: float, size: float, count: int) -> range:
+        first = math.floor(low / size)
+        last = math.floor(high / size)
+        # A query wider than the field would visit some cells twice
+        if last - first + 1 >= count:
+            return range(count)
+        return range(first, last + 1)
+
+    def query(self, x: float, y: float, radius: float) -> list:
+        """Return the records of active objects in the cells a circle at (x, y) could touch."""
+        reach = radius + self.max_radius
+        cols = self._span(x - reach, x + reach, self.cell_width, self.cols)
+        rows = self._span(y - reach, y + reach, self.cell_height, self.rows)
+        return self._collect(cols, rows)
+
+    def query_swept(self, x: float, y: float, step: tuple[float, float], radius: float, margin: float = 0.0) -> list:
+        """Return the records of active objects that a circle moving by step to (x, y) could touch.
+
+        margin is how far the stored objects themselves may have moved this tick.
+        """
+        half_x = step[0] * 0.5
+        half_y = step[1] * 0.5
+        x -= half_x
+        y -= half_y
+        reach_x = radius + abs(half_x) + margin + self.max_radius
+        reach_y = radius + abs(half_y) + margin + self.max_radius
+        cols = self._span(x - reach_x, x + reach_x, self.cell_width, self.cols)
+        rows = self._span(y - reach_y, y + reach_y, self.cell_height, self.rows)
+        return self._collect(cols, rows)
+
+    def _collect(self, cols: range, rows: range) -> list:
+        found = []
+        cells = self.cells
+        width = self.cols
+        wrapped_cols = [col % width for col in cols]
+        for row in rows:
+            base = (row % self.rows) * width
+            for col in wrapped_cols:
+                bucket = cells.get(base + col)
+                if bucket:
+                    found += [record for record in bucket if record[0].active]
+        return found
+
+    def wrapped_delta(self, ax: float, ay: float, bx: float, by: float) -> tuple[float, float]:
+        """Shortest (dx, dy) from (ax, ay) to (bx, by), taking the screen wrap into account."""
+        dx = bx - ax
+        dy = by - ay
+        if dx > self.width / 2:
+            dx -= self.width
+        elif dx < -self.width / 2:
+            dx += self.width
+        if dy > self.height / 2:
+            dy -= self.height
+        elif dy < -self.height / 2:
+            dy += self.height
+        return dx, dy
+
+    def overlaps(self, x: float, y: float, radius: float, record: tuple) -> bool:
+        """Narrow-phase test of a circle against a record, using the wrapped distance between centers."""
+        dx, dy = self.wrapped_delta(x, y, record[1], record[2])
+        reach = radius + record[3]
+        return dx * dx + dy * dy < reach * reach
+
+    def swept_overlaps(self, x: float, y: float, radius: float, a_step: tuple[float, float], record: tuple,
+                       dt: float, travel: float) -> bool:
+        """Continuous test over a tick in which circle a moved by a_step to (x, y) and record b at its velocity.
+
+        Works in b's frame: a travels along a segment ending at the wrapped
+        offset between the current centers, and the pair collides if that
+        segment comes within the sum of the radii of b at any point. A fast
+        bullet therefore cannot step over a small asteroid between ticks.
+        travel bounds the length of that segment; pairs farther apart than
+        it are rejected before the exact test.
+        """
+        ex, ey = self.wrapped_delta(record[1], record[2], x, y)
+        reach = radius + record[3]
+        bound = reach + travel
+        distance2 = ex * ex + ey * ey
+        if distance2 >= bound * bound:
+            return False
+        if distance2 < reach * reach:
+            return True
+        dx = a_step[0] - record[4] * dt
+        dy = a_step[1] - record[5] * dt
+        length2 = dx * dx + dy * dy
+        if length2 == 0.0:
+            return False
+        # Closest point to b along end - t * step, for t from 0 (now) to 1 (tick start)
+        t = (ex * dx + ey * dy) / length2
+        if t > 1.0:
+            t = 1.0
+        elif t < 0.0:
+            return False
+        ex -= t * dx
+        ey -= t * dy
+        return ex * ex + ey * ey < reach * reach
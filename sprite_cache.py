@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+import pygame
+from constants import GLOW_STAMP_CACHE_BYTES
+
+
+def quantize_angle(angle: float, steps: int) -> int:
+    """Map an angle in degrees to one of `steps` evenly spaced rotation buckets."""
+    return round(angle * steps / 360.0) % steps
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SpriteCache:
+    """LRU cache of pre-rendered surfaces bounded by total pixel memory.
+
+    Callers pass a hashable key describing everything the sprite's look depends
+    on, plus a builder that renders it on a miss. The least recently used
+    sprites are evicted once the cache grows past max_bytes.
+    """
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.sprites: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = build()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        self.sprites[key] = sprite
+        self.bytes += surface_bytes(sprite)
+        # Always keep the sprite just built, even if it alone exceeds the cap
+        while self.bytes > self.max_bytes and len(self.sprites) > 1:
+            _, evicted = self.sprites.popitem(last=False)
+            self.bytes -= surface_bytes(evicted)
+            self.evictions += 1
+        return sprite
+
+    def clear(self) -> None:
+        self.sprites.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.sprites),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Glow stamps shared by bullets, power-ups, UFOs and the player ship
+GLOW_STAMPS = SpriteCache(GLOW_STAMP_CACHE_BYTES)
@@ -0,0 +1,93 @@
+"""Startup timing and background asset loading.
+
+Game.__init__ only does the work the first menu frame needs. Sound decoding,
+music and the system font scan run on an AssetLoader thread. The leaderboard
+opens on first use, and the first level is built when a run starts.
+StartupTimer records how long each step took, so slow boards show where the
+time goes (python main.py --startup-report).
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+
+class StartupTimer:
+    """Durations of named startup phases in milliseconds, plus time to first frame."""
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.first_frame: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000.0)
+
+    def record(self, name: str, ms: float) -> None:
+        with self._lock:
+            self.phases[name] = ms
+
+    def include_imports(self, since: float) -> None:
+        """Count the module imports that ran before the timer existed, from perf_counter() value since."""
+        with self._lock:
+            self.phases = {'imports': (self.started - since) * 1000.0, **self.phases}
+            self.started = since
+
+    def mark_first_frame(self) -> None:
+        if self.first_frame is None:
+            self.first_frame = (time.perf_counter() - self.started) * 1000.0
+
+    def report(self) -> str:
+        with self._lock:
+            phases = list(self.phases.items())
+        lines = ["Startup:"]
+        lines += [f"  {name:<24} {ms:8.1f} ms" for name, ms in phases]
+        if self.first_frame is not None:
+            lines.append(f"  {'first frame':<24} {self.first_frame:8.1f} ms")
+        return "\n".join(lines)
+
+
+class AssetLoader:
+    """Runs startup jobs in order on one daemon thread.
+
+    The main loop never waits for it: anything that needs an asset checks
+    finished(name) and makes do until then. A job that fails prints a warning
+    and still counts as finished, so callers fall back for good.
+    """
+    def __init__(self, timer: Optional[StartupTimer] = None) -> None:
+        self.timer = timer
+        self._jobs: list[tuple[str, Callable[[], None]]] = []
+        self._finished: set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+        self.done = threading.Event()
+
+    def add(self, name: str, job: Callable[[], None]) -> None:
+        self._jobs.append((name, job))
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='asset-loader', daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        for name, job in self._jobs:
+            start = time.perf_counter()
+            try:
+                job()
+            except Exception as e:
+                print(f"Warning: Could not load {name}: {e}")
+            if self.timer:
+                self.timer.record(f"{name} (background)", (time.perf_counter() - start) * 1000.0)
+            self._finished.add(name)
+        self.done.set()
+
+    def finished(self, name: str) -> bool:
+        return name in self._finished
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every job has run; False if timeout passed first."""
+        return self.done.wait(timeout)
@@ -0,0 +1,46 @@
+import random
+import unittest
+import pygame
+from asteroid import Asteroid
+from entity_store import StoredGroup, FrozenVector2
+
+
+class StoredVectorMutationTest(unittest.TestCase):
+    """Changing a stored entity's vector in place must raise or reach the store, never be lost."""
+
+    def setUp(self) -> None:
+        self.group = StoredGroup('asteroids')
+        self.asteroid = Asteroid(pygame.Vector2(100, 200), 'large', random.Random(1))
+        self.group.add(self.asteroid)
+
+    def test_reads_are_frozen_copies(self) -> None:
+        self.assertIsInstance(self.asteroid.position, FrozenVector2)
+
+    def test_component_assignment_raises(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.asteroid.position.x = 5
+        with self.assertRaises(TypeError):
+            self.asteroid.velocity[1] = 5
+        self.assertEqual(self.asteroid.position, pygame.Vector2(100, 200))
+
+    def test_in_place_methods_raise(self) -> None:
+        for change in (lambda v: v.update(1, 2), lambda v: v.scale_to_length(3), lambda v: v.rotate_ip(90),
+                       lambda v: v.normalize_ip()):
+            with self.assertRaises(TypeError):
+                change(self.asteroid.velocity)
+
+    def test_augmented_assignment_persists(self) -> None:
+        self.asteroid.position += pygame.Vector2(1, -1)
+        self.assertEqual(self.asteroid.position, pygame.Vector2(101, 199))
+        self.assertEqual(tuple(self.group.store.position[self.asteroid._slot]), (101, 199))
+
+    def test_detached_entity_is_mutable_again(self) -> None:
+        self.asteroid.position += pygame.Vector2(1, 0)
+        self.group.remove(self.asteroid)
+        self.asteroid.position.x = 5
+        self.assertEqual(self.asteroid.position, pygame.Vector2(5, 200))
+        self.assertNotIsInstance(self.asteroid.position, FrozenVector2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+from functools import cache
+from typing import Optional
+import pygame
+from sprite_cache import SpriteCache
+from constants import WHITE, TEXT_CACHE_BYTES
+
+NEON_GLOW_OFFSET = 2
+
+# Rendered text keyed by (style, text, font, color)
+TEXT_SPRITES = SpriteCache(TEXT_CACHE_BYTES)
+
+
+@cache
+def get_font(name: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+    """Resolve a font once; None selects pygame's default font."""
+    if name is None:
+        return pygame.font.Font(None, size)
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+def _render_neon(text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+    glow = font.render(text, True, color)
+    core = font.render(text, True, WHITE)
+    pad = NEON_GLOW_OFFSET
+    surf = pygame.Surface((glow.get_width() + pad * 2, glow.get_height() + pad * 2), pygame.SRCALPHA)
+    # Slight offsets for thickness/glow, white core on top
+    for dx, dy in [(-pad, 0), (pad, 0), (0, -pad), (0, pad)]:
+        surf.blit(glow, (pad + dx, pad + dy))
+    surf.blit(core, (pad, pad))
+    return surf
+
+
+def render_text(text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+    """Plain antialiased text, cached."""
+    return TEXT_SPRITES.get(('plain', text, font, color), lambda: font.render(text, True, color))
+
+
+def render_neon(text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+    """Glow+core composite for neon text, cached.
+
+    The surface is padded by NEON_GLOW_OFFSET on every side, so its center
+    matches the center of the unpadded text.
+    """
+    return TEXT_SPRITES.get(('neon', text, font, color), lambda: _render_neon(text, font, color))
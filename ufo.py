@@ -2,15 +2,42 @@ import pygame
 import random
 from game_object import GameObject
 from bullet import Bullet
+from sprite_cache import GLOW_STAMPS
+from quality import QUALITY
 from constants import UFO_RADIUS, UFO_SPEED, UFO_SHOOT_INTERVAL, BULLET_SPEED, UFO_COLOR
 
+
+def _render_ufo(color: tuple, radius: int, glow: bool = True) -> pygame.Surface:
+    # Shape points (relative to center 0,0)
+    points = [
+        pygame.Vector2(0, -radius),
+        pygame.Vector2(-radius, radius),
+        pygame.Vector2(radius, radius)
+    ]
+    glow_size = int(radius * 2.5) if glow else radius + 2
+    surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+    center = pygame.Vector2(glow_size, glow_size)
+    local_points = [p + center for p in points]
+    # Glow, then core
+    if glow:
+        pygame.draw.polygon(surf, (*color, 100), local_points, 5)
+    pygame.draw.polygon(surf, color, local_points, 2)
+    return surf
+
+
 class UFO(GameObject):
-    def __init__(self, position: pygame.Vector2, screen_width: int):
-        velocity = pygame.Vector2(UFO_SPEED if random.random() > 0.5 else -UFO_SPEED, 0)
-        super().__init__(position, velocity)
+    __slots__ = ('screen_width', 'last_shot_time', 'shoot_interval')
+
+    def __init__(self, position: pygame.Vector2, screen_width: int, rng: random.Random = random):
+        super().__init__(position)
+        self.reset(position, screen_width, rng)
+
+    def reset(self, position: pygame.Vector2, screen_width: int, rng: random.Random = random) -> None:
+        velocity = pygame.Vector2(UFO_SPEED if rng.random() > 0.5 else -UFO_SPEED, 0)
+        super().reset(position, velocity)
         self.radius = UFO_RADIUS
         self.screen_width = screen_width
-        self.last_shot_time = 0
+        self.last_shot_time = float('-inf')  # Fire as soon as it appears
         self.shoot_interval = UFO_SHOOT_INTERVAL
 
     def update(self, dt: float, screen_width: int, screen_height: int, player_pos: pygame.Vector2):
@@ -21,12 +48,11 @@ class UFO(GameObject):
         elif self.position.x > screen_width:
             self.position.x = 0
 
-    def shoot(self, player_pos: pygame.Vector2):
-        current_time = pygame.time.get_ticks() / 1000.0
+    def shoot(self, player_pos: pygame.Vector2, current_time: float, create_bullet=Bullet):
         if current_time - self.last_shot_time >= self.shoot_interval:
             self.last_shot_time = current_time
             direction = (player_pos - self.position).normalize()
-            bullet = Bullet(self.position, direction * (BULLET_SPEED * 0.7))  # Slower bullets
+            bullet = create_bullet(self.position, direction * (BULLET_SPEED * 0.7))  # Slower bullets
             bullet.lifetime = 1.5 # Shorter lifetime
             # Ufo bullets should probably be a different color, but using standard for now or we can override draw in a subclass if needed.
             # Actually, standard Bullet class uses BULLET_COLOR. UFO bullet could use Red if passed or subclassed.
@@ -34,25 +60,9 @@ class UFO(GameObject):
             return bullet
         return None
 
-    def draw(self, screen: pygame.Surface):
-        # Shape points (relative to center 0,0)
-        points = [
-            pygame.Vector2(0, -self.radius),
-            pygame.Vector2(-self.radius, self.radius),
-            pygame.Vector2(self.radius, self.radius)
-        ]
-        
-        glow_size = int(self.radius * 2.5)
-        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        center = pygame.Vector2(glow_size, glow_size)
-
-        local_points = [p + center for p in points]
-
-        # Draw Glow
-        glow_color = (*UFO_COLOR, 100)
-        pygame.draw.polygon(glow_surf, glow_color, local_points, 5)
-
-        # Draw Core
-        pygame.draw.polygon(glow_surf, UFO_COLOR, local_points, 2)
-
-        screen.blit(glow_surf, self.position - center)
\ No newline at end of file
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0, offset: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
+        glow = QUALITY.tier.glow
+        stamp = GLOW_STAMPS.get(('ufo', UFO_COLOR, self.radius, glow), lambda: _render_ufo(UFO_COLOR, self.radius, glow))
+        glow_size = stamp.get_width() // 2
+        position = self.render_position(alpha)
+        return screen.blit(stamp, (position.x + offset[0] - glow_size, position.y + offset[1] - glow_size))